@@ -0,0 +1,79 @@
+# Copyright 2023 Nokia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compares the CPU time spent per request with each installed JSON codec.
+
+Requests are answered by the in-process `MockNaCServer`, so that only the
+work done by the SDK and the codec is measured, not the network.
+
+    python -m benchmarks.bench_codec [--requests 5000]
+
+Install `orjson` or `msgspec` to compare them against the standard library.
+"""
+
+import argparse
+import json
+import time
+
+from network_as_code import NetworkAsCodeClient
+from network_as_code.api.codec import CODECS, load_codec, use_codec
+
+from .mock_server import MockNaCServer, session_json
+
+# A listing of QoD sessions, as returned when polling the sessions of a device
+SESSIONS = json.dumps([
+    session_json(f"08305343-7ed2-43b7-8eda-4c5ae98{index:05d}", {"phoneNumber": f"+36701{index:05d}"})
+    for index in range(100)
+]).encode()
+
+
+def installed_codecs():
+    for name in CODECS:
+        try:
+            load_codec(name)
+        except ImportError:
+            continue
+        yield name
+
+
+def cpu_per_call(func, calls: int) -> float:
+    """Returns the CPU time of a call in microseconds"""
+    func()
+    started = time.process_time()
+    for _ in range(calls):
+        func()
+    return (time.process_time() - started) / calls * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000, help="requests per measurement")
+    args = parser.parse_args()
+
+    client = NetworkAsCodeClient(token="BENCHMARK", transport=MockNaCServer().transport())
+    device = client.devices.get(phone_number="+3670123456")
+
+    print(f"{'codec':<10}{'connectivity':>16}{'location':>16}{'100 sessions':>16}   (CPU µs per request)")
+    for name in installed_codecs():
+        codec = use_codec(name)
+        connectivity = cpu_per_call(device.get_connectivity, args.requests)
+        location = cpu_per_call(lambda: device.location(max_age=60), args.requests)
+        sessions = cpu_per_call(lambda codec=codec: codec.decode(SESSIONS), args.requests)
+        print(f"{name:<10}{connectivity:>16.1f}{location:>16.1f}{sessions:>16.1f}")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
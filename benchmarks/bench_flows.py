@@ -0,0 +1,140 @@
+# Copyright 2023 Nokia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures the throughput, latency and memory of the main flows of the SDK.
+
+Requests are answered by the in-process `MockNaCServer`, so the figures show
+the cost of the SDK itself, plus any latency injected into the server:
+
+    python -m benchmarks.bench_flows [--requests 2000] [--latency 0.002]
+                                     [--error-rate 0.01] [--flow device.location]
+
+For each flow, prints the calls per second, the median and 99th percentile
+latency of a call and the peak memory allocated while making one call.
+Failed calls, such as those hit by injected errors, are counted separately.
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from typing import Callable, Dict, List, NamedTuple
+
+from network_as_code import NetworkAsCodeClient
+from network_as_code.errors import NaCError
+
+from .mock_server import MockNaCServer
+
+
+class Result(NamedTuple):
+    calls_per_second: float
+    p50_ms: float
+    p99_ms: float
+    peak_kib: float
+    failures: int
+
+
+def build_flows(client: NetworkAsCodeClient) -> Dict[str, Callable[[], object]]:
+    device = client.devices.get(phone_number="+3670123456")
+    return {
+        "create_qod_session": lambda: device.create_qod_session(
+            profile="QOS_L", duration=3600, service_ipv4="5.6.7.8"
+        ),
+        "slices.get_all": client.slices.get_all,
+        "device.location": lambda: device.location(max_age=60),
+    }
+
+
+def call(flow: Callable[[], object]) -> bool:
+    """Makes a call of the flow and returns whether it succeeded"""
+    try:
+        flow()
+    except NaCError:
+        return False
+    return True
+
+
+def peak_memory(flow: Callable[[], object], calls: int) -> float:
+    """Returns the largest amount of memory in KiB allocated by a call of the flow"""
+    peak = 0
+    tracemalloc.start()
+    try:
+        for _ in range(calls):
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            call(flow)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def measure(flow: Callable[[], object], calls: int) -> Result:
+    for _ in range(min(calls, 50)):
+        call(flow)
+
+    latencies: List[float] = []
+    failures = 0
+    started = time.perf_counter()
+    for _ in range(calls):
+        call_started = time.perf_counter()
+        if not call(flow):
+            failures += 1
+        latencies.append(time.perf_counter() - call_started)
+    elapsed = time.perf_counter() - started
+
+    # Tracing allocations slows calls down, so it is kept out of the timed calls
+    peak = peak_memory(flow, min(calls, 100))
+
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return Result(
+        calls_per_second=calls / elapsed,
+        p50_ms=percentiles[49] * 1000,
+        p99_ms=percentiles[98] * 1000,
+        peak_kib=peak,
+        failures=failures,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000, help="calls made per flow")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds the server takes to answer")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests failed by the server")
+    parser.add_argument("--slices", type=int, default=20, help="slices listed by the server")
+    parser.add_argument("--flow", action="append", help="flow to measure, every flow by default")
+    args = parser.parse_args()
+
+    server = MockNaCServer(latency=args.latency, error_rate=args.error_rate, slices=args.slices)
+    client = NetworkAsCodeClient(token="BENCHMARK", transport=server.transport())
+    flows = build_flows(client)
+
+    unknown = set(args.flow or []) - set(flows)
+    if unknown:
+        parser.error(f"unknown flows {sorted(unknown)}, choose from {sorted(flows)}")
+
+    print(f"{'flow':<22}{'calls/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'peak KiB':>10}{'failed':>8}")
+    for name in args.flow or flows:
+        result = measure(flows[name], args.requests)
+        print(
+            f"{name:<22}{result.calls_per_second:>10.0f}{result.p50_ms:>10.3f}"
+            f"{result.p99_ms:>10.3f}{result.peak_kib:>10.1f}{result.failures:>8}"
+        )
+
+    print(f"\nserver answered {server.requests} requests, {server.errors} with injected errors")
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# Copyright 2023 Nokia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compares the CPU time spent by listing calls building models against
+building rows with `rows=True`.
+
+Requests are answered by the in-process `MockNaCServer`, so that only the
+work done by the SDK is measured, not the network. Rows of slices never list
+the attachments, so they are also compared against models built with
+`lazy_attachments=True`, which skip that request too.
+
+    python -m benchmarks.bench_listing [--items 100] [--calls 300]
+"""
+
+import argparse
+
+from network_as_code import NetworkAsCodeClient
+
+from .bench_codec import cpu_per_call
+from .mock_server import MockNaCServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=100, help="items in every listing")
+    parser.add_argument("--calls", type=int, default=300, help="calls per measurement")
+    args = parser.parse_args()
+
+    server = MockNaCServer(slices=args.items, sessions=args.items)
+    client = NetworkAsCodeClient(token="BENCHMARK", transport=server.transport())
+    device = client.devices.get(phone_number="+3670123456")
+
+    listings = {
+        "sessions": (device.sessions, lambda: device.sessions(rows=True)),
+        "slices": (client.slices.get_all, lambda: client.slices.get_all(rows=True)),
+        "slices, lazy": (
+            lambda: client.slices.get_all(lazy_attachments=True),
+            lambda: client.slices.get_all(rows=True),
+        ),
+    }
+
+    print(f"{args.items} items per listing")
+    print(f"{'listing':<16}{'models':>12}{'rows':>12}{'speedup':>10}   (CPU µs per call)")
+    for name, (models, rows) in listings.items():
+        with_models = cpu_per_call(models, args.calls)
+        with_rows = cpu_per_call(rows, args.calls)
+        print(f"{name:<16}{with_models:>12.0f}{with_rows:>12.0f}{with_models / with_rows:>9.1f}x")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
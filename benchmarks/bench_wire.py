@@ -0,0 +1,58 @@
+# Copyright 2023 Nokia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compares the CPU time spent turning devices into request payloads with
+`wire_dict()` against serialising them with pydantic.
+
+    python -m benchmarks.bench_wire [--calls 100000]
+"""
+
+import argparse
+
+from network_as_code import NetworkAsCodeClient
+from network_as_code.models.device import DeviceIpv4Addr
+
+from .bench_codec import cpu_per_call
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=100000, help="calls per measurement")
+    args = parser.parse_args()
+
+    client = NetworkAsCodeClient(token="BENCHMARK")
+    devices = {
+        "phone number": client.devices.get(phone_number="+3670123456"),
+        "all identifiers": client.devices.get(
+            "device@testcsp.net",
+            phone_number="+3670123456",
+            ipv4_address=DeviceIpv4Addr(public_address="233.252.0.2", public_port=80),
+            ipv6_address="2001:db8:1234:5678:9abc:def0:fedc:ba98",
+        ),
+    }
+
+    print(f"{'device':<18}{'model_dump':>14}{'wire_dict':>14}{'speedup':>10}   (CPU µs per call)")
+    for name, device in devices.items():
+        dumped = cpu_per_call(
+            lambda device=device: device.model_dump(mode="json", by_alias=True, exclude_none=True),
+            args.calls,
+        )
+        wired = cpu_per_call(device.wire_dict, args.calls)
+        print(f"{name:<18}{dumped:>14.2f}{wired:>14.2f}{dumped / wired:>9.1f}x")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
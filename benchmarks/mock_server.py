@@ -0,0 +1,184 @@
+# Copyright 2023 Nokia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An in-process mock of the Network as Code endpoints used by the benchmarks.
+
+The server answers requests made through an `httpx.MockTransport`, so that
+requests never leave the process:
+
+    server = MockNaCServer(latency=0.005, error_rate=0.01)
+    client = NetworkAsCodeClient(token="BENCHMARK", transport=server.transport())
+"""
+
+import json
+import random
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Tuple
+
+import httpx
+
+LOCATION = {
+    "lastLocationTime": "2024-06-18T09:46:58.213Z",
+    "area": {
+        "areaType": "CIRCLE",
+        "center": {"latitude": 47.48627616952785, "longitude": 19.07915612501993},
+        "radius": 100,
+    },
+    "civicAddress": {"country": "HU", "A1": "Budapest", "A2": "District XIII"},
+}
+
+
+def session_json(session_id: str, device: dict, profile: str = "QOS_L") -> dict:
+    return {
+        "sessionId": session_id,
+        "qosProfile": profile,
+        "device": device,
+        "applicationServer": {"ipv4Address": "5.6.7.8"},
+        "devicePorts": {"ports": [80, 443]},
+        "qosStatus": "REQUESTED",
+        "startedAt": "2024-06-18T09:46:58.213Z",
+        "expiresAt": "2024-06-18T10:46:58.213Z",
+    }
+
+
+def slice_json(index: int) -> dict:
+    return {
+        "slice": {
+            "name": f"slice{index}",
+            "networkIdentifier": {"mcc": "236", "mnc": "30"},
+            "sliceInfo": {"serviceType": "1", "differentiator": "AAABBB"},
+            "areaOfService": {
+                "polygon": [
+                    {"lat": 47.344, "lon": 104.349},
+                    {"lat": 35.344, "lon": 76.619},
+                    {"lat": 12.344, "lon": 142.541},
+                    {"lat": 19.43, "lon": 103.53},
+                ]
+            },
+            "maxDataConnections": 12,
+            "maxDevices": 3,
+            "notificationUrl": "https://example.com/notifications",
+            "sliceDownlinkThroughput": {"guaranteed": 3415, "maximum": 1234324},
+        },
+        "startPollingAt": 1691482014,
+        "csi_id": f"csi-{index}",
+        "order_id": f"order-{index}",
+        "administrativeState": None,
+        "state": "AVAILABLE",
+    }
+
+
+def attachment_json(index: int, slice_index: int) -> dict:
+    return {
+        "nac_resource_id": f"attachment-{index}",
+        "resource": {
+            "device": {"phoneNumber": f"+36701{index:05d}"},
+            "sliceId": f"slice{slice_index}",
+        },
+    }
+
+
+Handler = Callable[[httpx.Request], Tuple[int, object]]
+
+
+class MockNaCServer:
+    """Answers the requests of the SDK like the Network as Code API would.
+
+    #### Args:
+        latency (float): Seconds each request takes to be answered.
+        error_rate (float): Share of requests, from 0 to 1, answered with `503 Service Unavailable`.
+        slices (int): Number of slices listed by `GET /slices`.
+        sessions (int): Number of sessions listed for every device.
+        attachments_per_slice (int): Number of devices attached to each slice.
+        seed (int): Seed of the random errors, so that runs can be compared.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        slices: int = 20,
+        attachments_per_slice: int = 5,
+        sessions: int = 20,
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.requests = 0
+        self.errors = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+        # Listings are encoded once, so that the server costs little per request
+        self._slices = json.dumps([slice_json(index) for index in range(slices)]).encode()
+        self._attachments = json.dumps([
+            attachment_json(index * attachments_per_slice + offset, index)
+            for index in range(slices)
+            for offset in range(attachments_per_slice)
+        ]).encode()
+        self._location = json.dumps(LOCATION).encode()
+        self._sessions = sessions
+
+        self._routes: Dict[Tuple[str, str], Handler] = {
+            ("POST", "/qod/v0/sessions"): self._create_session,
+            ("POST", "/qod/v0/retrieve-sessions"): self._list_sessions,
+            ("POST", "/location-retrieval/v0/retrieve"): lambda request: (200, self._location),
+            ("POST", "/device-status/v0/connectivity"): lambda request: (
+                200, {"connectivityStatus": "CONNECTED_DATA"}
+            ),
+            ("POST", "/device-status/v0/roaming"): lambda request: (
+                200, {"roaming": True, "countryCode": 358, "countryName": ["Finland"]}
+            ),
+            ("GET", "/slice/v1/slices"): lambda request: (200, self._slices),
+            ("GET", "/device-attach/v0/attachments"): lambda request: (200, self._attachments),
+        }
+
+    def transport(self) -> httpx.MockTransport:
+        """Returns a transport sending the requests of a client to this server"""
+        return httpx.MockTransport(self)
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.requests += 1
+            failed = self._random.random() < self.error_rate
+            if failed:
+                self.errors += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        if failed:
+            return httpx.Response(503, json={"detail": "Injected error"})
+
+        handler = self._routes.get((request.method, request.url.path))
+        if handler is None:
+            return httpx.Response(404, json={"detail": f"No mock for {request.method} {request.url.path}"})
+
+        status, body = handler(request)
+        if isinstance(body, bytes):
+            return httpx.Response(status, content=body, headers={"Content-Type": "application/json"})
+        return httpx.Response(status, json=body)
+
+    def _create_session(self, request: httpx.Request) -> Tuple[int, object]:
+        body = json.loads(request.content)
+        return 201, session_json(str(uuid.uuid4()), body["device"], body["qosProfile"])
+
+    def _list_sessions(self, request: httpx.Request) -> Tuple[int, object]:
+        device = json.loads(request.content)["device"]
+        return 200, [
+            session_json(f"08305343-7ed2-43b7-8eda-4c5ae98{index:05d}", device)
+            for index in range(self._sessions)
+        ]
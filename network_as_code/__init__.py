@@ -12,6 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .client import NetworkAsCodeClient
+from .client import NetworkAsCodeClient, AsyncNetworkAsCodeClient
 
 __version__ = "6.1.0"
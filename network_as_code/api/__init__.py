@@ -12,5 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .client import APIClient
-from .slice_api import Throughput
+from typing import TYPE_CHECKING
+
+from .client import APIClient, AsyncAPIClient
+from .retry import RetryPolicy, RetryBudget
+from .rate_limit import RateLimiter
+from .circuit_breaker import CircuitBreakerPolicy
+from .cache import CachePolicy
+from .timeouts import request_timeout
+from .instrumentation import RequestEvent
+from .metrics import MetricsRegistry
+from ..lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .slice_api import Throughput
+
+# The slice API is only imported once used
+__getattr__, __dir__ = lazy_exports(globals(), {"Throughput": "slice_api"})
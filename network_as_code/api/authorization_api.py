@@ -13,16 +13,73 @@
 # limitations under the License.
 
 
-from network_as_code.api.utils import httpx_client
+from typing import Optional
+
+import httpx
+
+from network_as_code.api.utils import httpx_client, async_httpx_client
+from .cache import TTLCache
 from ..errors import error_handler
 
+# OpenID discovery documents by API base URL and key, shared by every client of the process
+ENDPOINTS_TTL = 3600.0
+ENDPOINTS_CACHE = TTLCache(ENDPOINTS_TTL)
+
 class AuthorizationAPI:
-    def __init__(self, base_url: str, rapid_key: str, rapid_host: str):
-        self.client = httpx_client(base_url, rapid_key, rapid_host)
+    def __init__(
+        self,
+        base_url: str,
+        rapid_key: str,
+        rapid_host: str,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        self.client = httpx_client(base_url, rapid_key, rapid_host, transport)
+        self.cache_key = (base_url, rapid_key)
 
     def fetch_endpoints(self):
+        cached = ENDPOINTS_CACHE.get(self.cache_key)
+        if cached is not None:
+            return dict(cached)
+
         response = self.client.get(url="/openid-configuration")
 
         error_handler(response)
 
-        return response.json()
\ No newline at end of file
+        fetched = response.json()
+        ENDPOINTS_CACHE.set(self.cache_key, fetched)
+
+        return dict(fetched)
+
+    def invalidate_endpoints(self):
+        """Forget the cached response, so that the next call fetches it again"""
+        ENDPOINTS_CACHE.invalidate(self.cache_key)
+
+
+class AsyncAuthorizationAPI:
+    def __init__(
+        self,
+        base_url: str,
+        rapid_key: str,
+        rapid_host: str,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.client = async_httpx_client(base_url, rapid_key, rapid_host, transport)
+        self.cache_key = (base_url, rapid_key)
+
+    async def fetch_endpoints(self):
+        cached = ENDPOINTS_CACHE.get(self.cache_key)
+        if cached is not None:
+            return dict(cached)
+
+        response = await self.client.get(url="/openid-configuration")
+
+        error_handler(response)
+
+        fetched = response.json()
+        ENDPOINTS_CACHE.set(self.cache_key, fetched)
+
+        return dict(fetched)
+
+    def invalidate_endpoints(self):
+        """Forget the cached response, so that the next call fetches it again"""
+        ENDPOINTS_CACHE.invalidate(self.cache_key)
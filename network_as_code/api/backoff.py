@@ -0,0 +1,29 @@
+# Copyright 2023 Nokia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+
+
+def backoff_delay(attempt: int, base: float, maximum: float, jitter: bool = True) -> float:
+    """Returns the delay in seconds before the given attempt, counting from zero.
+
+    The delay doubles on every attempt up to `maximum`. With jitter, a random
+    delay between half and all of it is returned, so that many clients waiting
+    at once spread their requests out instead of polling in lockstep.
+    """
+    # Cap the exponent so that long waits don't overflow the float
+    delay = min(maximum, base * 2 ** min(attempt, 32))
+    if jitter:
+        return random.uniform(delay / 2, delay)
+    return delay
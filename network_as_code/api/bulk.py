@@ -0,0 +1,125 @@
+# Copyright 2023 Nokia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_CONCURRENCY = 10
+
+
+def _check_concurrency(concurrency: int):
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+
+def run_bounded(
+    func: Callable[[T], R], items: Iterable[T], concurrency: int = DEFAULT_CONCURRENCY
+) -> Iterator[Tuple[T, Union[R, Exception]]]:
+    """Call `func` for every item with at most `concurrency` calls in flight.
+
+    Yields `(item, result)` pairs in completion order. Errors raised for an
+    item, such as API errors or a malformed response, are yielded in place of
+    the result so one failing item does not abort the rest of the batch.
+    Cancellation and interrupts still stop the batch. `items` is consumed lazily.
+    """
+    _check_concurrency(concurrency)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending: Dict[Future, T] = {}
+        iterator = iter(items)
+
+        def submit_next() -> bool:
+            for item in iterator:
+                # Run in a copy of the caller's context to keep its request timeout
+                pending[executor.submit(contextvars.copy_context().run, func, item)] = item
+                return True
+            return False
+
+        while len(pending) < concurrency and submit_next():
+            pass
+
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    item = pending.pop(future)
+
+                    try:
+                        result: Union[R, Exception] = future.result()
+                    except Exception as e:  # pylint: disable=broad-exception-caught
+                        result = e
+
+                    submit_next()
+                    yield item, result
+        finally:
+            # The consumer stopped iterating early, drop the queued calls
+            for future in pending:
+                future.cancel()
+
+
+async def async_run_bounded(
+    func: Callable[[T], Awaitable[R]], items: Iterable[T], concurrency: int = DEFAULT_CONCURRENCY
+) -> AsyncIterator[Tuple[T, Union[R, Exception]]]:
+    """Await `func` for every item with at most `concurrency` calls in flight.
+
+    The asyncio counterpart of `run_bounded`.
+    """
+    _check_concurrency(concurrency)
+
+    pending: Dict[asyncio.Future, T] = {}
+    iterator = iter(items)
+
+    def submit_next() -> bool:
+        for item in iterator:
+            pending[asyncio.ensure_future(func(item))] = item
+            return True
+        return False
+
+    while len(pending) < concurrency and submit_next():
+        pass
+
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            for future in done:
+                item = pending.pop(future)
+
+                try:
+                    result: Union[R, Exception] = future.result()
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    result = e
+
+                submit_next()
+                yield item, result
+    finally:
+        # The consumer stopped iterating early, don't leave requests running
+        for future in pending:
+            future.cancel()
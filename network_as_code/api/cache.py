@@ -0,0 +1,204 @@
+# Copyright 2023 Nokia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Hashable
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+C = TypeVar("C", bound="TTLCache")
+
+# Every cache created, so that they can all be cleared at once
+_caches: "weakref.WeakSet[TTLCache]" = weakref.WeakSet()
+
+
+class CachePolicy:
+    """Settings of an opt-in cache of API responses.
+
+    ### Args:
+        ttl (float): Seconds a response is kept and reused for, at most.
+        max_size (int): Number of responses kept, evicting the least recently used.
+    """
+
+    def __init__(self, ttl: float = 1.0, max_size: int = 10_000):
+        self.ttl = ttl
+        self.max_size = max_size
+
+
+class TTLCache:
+    """A thread-safe mapping whose entries expire `ttl` seconds after being stored.
+
+    With a `max_size`, the least recently used entries are evicted to stay within it.
+    """
+
+    def __init__(self, ttl: float, max_size: Optional[int] = None):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        _caches.add(self)
+
+    @classmethod
+    def from_policy(cls: Type[C], policy: Optional[CachePolicy]) -> Optional[C]:
+        """Returns a cache with the settings of the policy, None if caching is off"""
+        if policy is None:
+            return None
+        return cls(policy.ttl, policy.max_size)
+
+    def get(self, key: Hashable, accept: Optional[Callable[[Any], bool]] = None) -> Optional[Any]:
+        """Returns the value stored for the key, or None if it is missing or expired.
+
+        Values for which `accept` returns False are kept, but treated as missing.
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is not None and (accept is None or accept(value)):
+                self.hits += 1
+                return value
+            self.misses += 1
+            return None
+
+    def _lookup(self, key: Hashable) -> Optional[Any]:
+        # Called with the lock held
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            if self.max_size is not None and len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Drop the entry of the key, or every entry if no key is given"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self.hits = 0
+                self.misses = 0
+            else:
+                self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the number of hits and misses so far, and the number of entries"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+class ReadThroughCache(TTLCache):
+    """A `TTLCache` loading missing entries on demand.
+
+    Callers asking for a missing entry at once share a single load of it,
+    instead of each sending the same request. Failed loads are not cached,
+    and every caller waiting on them gets the error.
+    """
+
+    def __init__(self, ttl: float, max_size: Optional[int] = None):
+        super().__init__(ttl, max_size)
+        self._loads: Dict[Hashable, Future] = {}
+        self._async_loads: Dict[Hashable, asyncio.Future] = {}
+
+    def get_or_load(self, key: Hashable, load: Callable[[], T]) -> T:
+        """Returns the entry of the key, calling `load` for it if it is missing or expired"""
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            # Stored by another caller since, while this one waited for the lock
+            value = self._lookup(key)
+            if value is not None:
+                return value
+            pending = self._loads.get(key)
+            leader = pending is None
+            if pending is None:
+                pending = self._loads[key] = Future()
+
+        if not leader:
+            return pending.result()
+
+        try:
+            value = load()
+        except BaseException as error:
+            pending.set_exception(error)
+            raise
+        else:
+            self.set(key, value)
+            pending.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                del self._loads[key]
+
+    async def get_or_load_async(self, key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+        """Returns the entry of the key, awaiting `load` for it if it is missing or expired"""
+        loop = asyncio.get_running_loop()
+        while True:
+            value = self.get(key)
+            if value is not None:
+                return value
+
+            pending = self._async_loads.get(key)
+            # Loads are only shared within an event loop
+            if pending is None or pending.get_loop() is not loop:
+                break
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # Load again if the caller loading it was cancelled, rather than this one
+                if not pending.cancelled():
+                    raise
+
+        pending = self._async_loads[key] = loop.create_future()
+        try:
+            value = await load()
+        except Exception as error:
+            pending.set_exception(error)
+            # Mark the error as retrieved, as there may be no one else waiting for it
+            pending.exception()
+            raise
+        else:
+            self.set(key, value)
+            pending.set_result(value)
+            return value
+        finally:
+            if not pending.done():
+                pending.cancel()
+            if self._async_loads.get(key) is pending:
+                del self._async_loads[key]
+
+
+def clear_caches():
+    """Drop the entries of every cache of the SDK"""
+    for cache in list(_caches):
+        cache.invalidate()
@@ -13,14 +13,24 @@
 # limitations under the License.
 
 
-from network_as_code.api.utils import httpx_client
+from typing import Optional
+
+import httpx
+
+from network_as_code.api.utils import httpx_client, async_httpx_client
 
 from ..errors import error_handler
 
 
 class CallForwardingAPI:
-    def __init__(self, base_url: str, rapid_key: str, rapid_host: str):
-        self.client = httpx_client(base_url, rapid_key, rapid_host)
+    def __init__(
+        self,
+        base_url: str,
+        rapid_key: str,
+        rapid_host: str,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        self.client = httpx_client(base_url, rapid_key, rapid_host, transport)
 
     def retrieve_call_forwarding(self, phone_number):
         body = {
@@ -41,4 +51,36 @@ class CallForwardingAPI:
 
         error_handler(response)
 
-        return bool(response.json()['active'])
\ No newline at end of file
+        return bool(response.json()['active'])
+
+
+class AsyncCallForwardingAPI:
+    def __init__(
+        self,
+        base_url: str,
+        rapid_key: str,
+        rapid_host: str,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.client = async_httpx_client(base_url, rapid_key, rapid_host, transport)
+
+    async def retrieve_call_forwarding(self, phone_number):
+        body = {
+            "phoneNumber": phone_number
+        }
+
+        response = await self.client.post(url="/call-forwardings", json=body)
+
+        error_handler(response)
+
+        return response.json()
+
+    async def verify_unconditional_forwarding(self, phone_number: str) -> bool:
+        body = {
+            "phoneNumber": phone_number
+        }
+        response = await self.client.post(url="/unconditional-call-forwardings", json=body)
+
+        error_handler(response)
+
+        return bool(response.json()['active'])
@@ -0,0 +1,123 @@
+# Copyright 2023 Nokia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from typing import Optional
+
+import httpx
+
+from ..errors import CircuitOpenError
+
+CLOSED = "CLOSED"
+OPEN = "OPEN"
+HALF_OPEN = "HALF_OPEN"
+
+
+class CircuitBreakerPolicy:
+    """Settings of the circuit breakers guarding each product API.
+
+    ### Args:
+        failure_threshold (int): Consecutive failures after which the circuit opens.
+        recovery_time (float): Seconds to fail fast before probing the product again.
+        slow_call_duration (float): Calls taking longer than this many seconds count
+        as failures. Only errors count if not given.
+        half_open_probes (int): Requests let through at once to probe a recovering product.
+
+    Server errors, timeouts and connection failures count as failures, client
+    errors such as 404 do not.
+
+    #### Example:
+        ```python
+        client = NetworkAsCodeClient(token, circuit_breaker=CircuitBreakerPolicy(failure_threshold=10))
+        ```
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_time: float = 30.0,
+        slow_call_duration: Optional[float] = None,
+        half_open_probes: int = 1,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.slow_call_duration = slow_call_duration
+        self.half_open_probes = half_open_probes
+
+
+class CircuitBreaker:
+    """The circuit breaker of a single product API, shared by threads and asyncio tasks.
+
+    While open, requests fail with `CircuitOpenError` without being sent.
+    After `recovery_time` the circuit is half-open and lets a few probes
+    through: a successful probe closes it, a failed one opens it again.
+    """
+
+    def __init__(self, product: str, policy: CircuitBreakerPolicy):
+        self.product = product
+        self.policy = policy
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def before_request(self) -> bool:
+        """Raises `CircuitOpenError` if the request must not be sent.
+
+        Returns whether the request is a probe of a half-open circuit.
+        """
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self._opened_at < self.policy.recovery_time:
+                    raise CircuitOpenError(f"Circuit of {self.product} is open after repeated failures")
+                self.state = HALF_OPEN
+                self._probes = 0
+
+            if self.state == HALF_OPEN:
+                if self._probes >= self.policy.half_open_probes:
+                    raise CircuitOpenError(f"Circuit of {self.product} is waiting for a probe to finish")
+                self._probes += 1
+                return True
+
+            return False
+
+    def release(self, probe: bool):
+        """Frees the slot of a probe abandoned without an outcome, such as a cancelled request"""
+        if probe:
+            with self._lock:
+                self._probes = max(self._probes - 1, 0)
+
+    def record(self, probe: bool, duration: float, response: Optional[httpx.Response] = None):
+        """Record the outcome of a request, without a response if it failed to complete"""
+        slow = self.policy.slow_call_duration is not None and duration > self.policy.slow_call_duration
+        failed = response is None or response.status_code >= 500 or slow
+
+        with self._lock:
+            if probe:
+                self._probes -= 1
+            elif self.state != CLOSED:
+                # Requests sent before the circuit opened don't decide when it closes
+                return
+
+            if not failed:
+                self._failures = 0
+                self.state = CLOSED
+                return
+
+            self._failures += 1
+            if probe or self._failures >= self.policy.failure_threshold:
+                self.state = OPEN
+                self._opened_at = time.monotonic()
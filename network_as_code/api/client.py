@@ -12,19 +12,40 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Optional
-
-from network_as_code.api.qod_api import QodAPI
-from ..api.slice_api import AttachAPI, SliceAPI
-from .location_api import LocationVerifyAPI, LocationRetrievalAPI
-from .device_status_api import DeviceStatusAPI
-from .congestion_api import CongestionAPI
-from .sim_swap_api import SimSwapAPI
-from .geofencing_api import GeofencingAPI
-from .credentials_api import CredentialsAPI
-from .authorization_api import AuthorizationAPI
-from. number_verification_api import NumberVerificationAPI
-from .call_forwarding_api import CallForwardingAPI
+from __future__ import annotations
+
+import abc
+import threading
+import urllib.request
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, List, Optional, TypeVar, overload
+
+import httpx
+
+from ..lazy import import_attribute
+from .cache import CachePolicy, ReadThroughCache, TTLCache
+from .circuit_breaker import CircuitBreaker, CircuitBreakerPolicy
+from .instrumentation import Instrumentation, RequestHook
+from .metrics import MetricsRegistry
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .timeouts import TimeoutTypes
+from .transport import (
+    ProductPolicies, ProductTransport, AsyncProductTransport, ProxyRouter, AsyncProxyRouter
+)
+
+if TYPE_CHECKING:
+    from .qod_api import QodAPI, AsyncQodAPI
+    from .slice_api import AttachAPI, SliceAPI, AsyncAttachAPI, AsyncSliceAPI
+    from .location_api import LocationVerifyAPI, LocationRetrievalAPI, AsyncLocationVerifyAPI, AsyncLocationRetrievalAPI
+    from .device_status_api import DeviceStatusAPI, AsyncDeviceStatusAPI
+    from .congestion_api import CongestionAPI, AsyncCongestionAPI
+    from .sim_swap_api import SimSwapAPI, AsyncSimSwapAPI
+    from .geofencing_api import GeofencingAPI, AsyncGeofencingAPI
+    from .credentials_api import CredentialsAPI, AsyncCredentialsAPI
+    from .authorization_api import AuthorizationAPI, AsyncAuthorizationAPI
+    from .number_verification_api import NumberVerificationAPI, AsyncNumberVerificationAPI
+    from .call_forwarding_api import CallForwardingAPI, AsyncCallForwardingAPI
+    from .token_api import TokenAPI, AsyncTokenAPI
 
 QOS_URL = "/qod/v0"
 
@@ -52,6 +73,33 @@ AUTHORIZATION_URL = "/.well-known"
 
 CALL_FORWARDING_URL = "/passthrough/camara/v1/call-forwarding-signal/call-forwarding-signal/v0.3"
 
+PRODUCT_URLS = {
+    "qos": QOS_URL,
+    "location_verify": LOCATION_VERIFY_URL,
+    "location_retrieve": LOCATION_RETRIEVE_URL,
+    "slice": SLICE_URL,
+    "slice_attach": SLICE_ATTACH_URL,
+    "device_status": DEVICE_STATUS_URL,
+    "congestion": CONGESTION_URL,
+    "sim_swap": SIM_SWAP_URL,
+    "geofencing": GEOFENCING_URL,
+    "credentials": CREDENTIALS_URL,
+    "authorization": AUTHORIZATION_URL,
+    "number_verification": NUMBER_VERIFICATION_URL,
+    "call_forwarding": CALL_FORWARDING_URL,
+}
+
+T = TypeVar("T")
+
+DEFAULT_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=5.0,
+)
+
+# Seconds an attachment listing is reused by `Slices.get(cached_attachments=True)`
+ATTACHMENT_INDEX_TTL = 60.0
+
 # RAPID_HOST_PROD = "network-as-code.nokia.rapidapi.com"
 
 def environment_hostname(env_mode):
@@ -74,15 +122,144 @@ def environment_base_url(env_mode):
 
     return "https://network-as-code.p-eu.rapidapi.com"
 
+def product_base_urls(env_mode, overrides: Dict[str, Optional[str]]) -> Dict[str, str]:
+    """Select the base URL of every product API, unless explicitly overridden"""
+    base_url = environment_base_url(env_mode)
 
-class APIClient:
-    """A client for communicating with Network as Code APIs.
+    return {
+        product: overrides.get(product) or f"{base_url}{path}"
+        for product, path in PRODUCT_URLS.items()
+    }
 
-    ### Args:
-        token (str): Authentication token for the Network as Code API.
-        base_url (str): Base URL for the Network as Code API.
-        testmode (bool): Whether to use simulated or real resources.
+
+def pool_options(
+    transport: Any,
+    limits: Optional[httpx.Limits],
+    http2: bool,
+    proxy: Optional[httpx.Proxy | str],
+) -> Dict[str, Any]:
+    """Returns the arguments of the connection pool shared by the product APIs.
+
+    Raises `ValueError` if a custom transport is combined with pool settings,
+    since those would silently have no effect on it.
     """
+    if transport is not None and (limits is not None or http2 or proxy is not None):
+        raise ValueError("limits, http2 and proxy cannot be combined with a custom transport")
+
+    return {
+        "limits": limits if limits else DEFAULT_POOL_LIMITS,
+        "http2": http2,
+        "proxy": proxy,
+    }
+
+
+def environment_proxies(trust_env: bool, options: Dict[str, Any]) -> Dict[str, str]:
+    """Returns the URLs of the proxies set in the environment by scheme, "all" for any scheme.
+
+    Empty if `trust_env` is false, a proxy is given explicitly or no proxy is
+    set in the environment. Hosts excluded by `NO_PROXY` are told apart per request.
+    """
+    if not trust_env or options["proxy"] is not None:
+        return {}
+
+    proxies = urllib.request.getproxies()
+    return {
+        # Proxies given as "host:port" are plain HTTP proxies, as for HTTPX and curl
+        scheme: url if "://" in url else f"http://{url}"
+        for scheme, url in proxies.items()
+        if scheme in ("http", "https", "all") and url
+    }
+
+
+def product_timeouts(
+    timeout: Optional[TimeoutTypes], overrides: Optional[Dict[str, TimeoutTypes]]
+) -> Dict[str, Optional[httpx.Timeout]]:
+    """Returns the timeouts of every product API, keyed by product name.
+
+    Products missing from the overrides use `timeout`, or the timeouts of the
+    HTTPX client if that is not given either.
+    """
+    overrides = overrides or {}
+    unknown = set(overrides) - set(PRODUCT_URLS) - {"token"}
+    if unknown:
+        raise ValueError(f"Unknown products in timeouts: {', '.join(sorted(unknown))}")
+
+    default = httpx.Timeout(timeout) if timeout is not None else None
+    return {
+        product: httpx.Timeout(overrides[product]) if product in overrides else default
+        for product in [*PRODUCT_URLS, "token"]
+    }
+
+
+def product_policies(api, product: str) -> ProductPolicies:
+    """Returns the policies of a product API from the settings of the client"""
+    breaker = None
+    if api.circuit_breaker:
+        breaker = api.circuit_breakers.setdefault(product, CircuitBreaker(product, api.circuit_breaker))
+    return ProductPolicies(
+        product, api.retry, api.rate_limiter, breaker, api.timeouts[product], api.instrumentation
+    )
+
+
+def client_instrumentation(
+    urls: Dict[str, str],
+    request_hooks: Optional[List[RequestHook]],
+    opentelemetry: bool,
+    metrics: Optional[MetricsRegistry],
+) -> Optional[Instrumentation]:
+    """Returns the instrumentation of a client, or None if nothing follows its requests"""
+    hooks = list(request_hooks or [])
+    if metrics is not None:
+        hooks.append(metrics.record)
+    if not hooks and not opentelemetry:
+        return None
+
+    base_paths = {product: httpx.URL(url).path for product, url in urls.items()}
+    return Instrumentation(hooks, opentelemetry, base_paths)
+
+
+class LazyProductAPI(Generic[T]):
+    """The API of a product, built on first access and then cached on the client.
+
+    Most programs use only a few of the products, so building the HTTPX client
+    of every product up front would only slow down creating a client.
+    """
+
+    def __init__(self, product: str, api_class: str):
+        self.product = product
+        # Given as "module.Class", so that the module is only imported once used
+        self.api_class = api_class
+        self.name = product
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: Optional[type] = None) -> LazyProductAPI[T]: ...
+
+    @overload
+    def __get__(self, instance: object, owner: Optional[type] = None) -> T: ...
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        with instance._lock:
+            # Another thread may have built it while this one waited for the lock
+            if self.name not in instance.__dict__:
+                api_class = import_attribute(self.api_class, __package__)
+                instance.__dict__[self.name] = instance.build_product_api(self.product, api_class)
+
+        return instance.__dict__[self.name]
+
+
+class BaseAPIClient(abc.ABC):
+    """The configuration shared by `APIClient` and `AsyncAPIClient`.
+
+    Subclasses build the connection pool and the transports of the product APIs.
+    """
+
+    transport: Any
 
     def __init__(
         self,
@@ -101,123 +278,228 @@ class APIClient:
         number_verification_base_url: Optional[str] = None,
         call_forwarding_base_url: Optional[str] = None,
         env_mode: Optional[str] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreakerPolicy] = None,
+        timeout: Optional[TimeoutTypes] = None,
+        timeouts: Optional[Dict[str, TimeoutTypes]] = None,
+        proxy: Optional[httpx.Proxy | str] = None,
+        trust_env: bool = True,
+        transport: Any = None,
+        event_hooks: Optional[Dict[str, List[Callable]]] = None,
+        request_hooks: Optional[List[RequestHook]] = None,
+        opentelemetry: bool = False,
+        metrics: Optional[MetricsRegistry] = None,
+        device_status_cache: Optional[CachePolicy] = None,
+        location_cache: Optional[CachePolicy] = None,
     ):
-        base_url = environment_base_url(env_mode)
-
-        hostname = environment_hostname(env_mode)
-
-        if not qos_base_url:
-            qos_base_url = f"{base_url}{QOS_URL}"
-
-        if not location_verify_base_url:
-            location_verify_base_url = f"{base_url}{LOCATION_VERIFY_URL}"
-
-        if not location_retrieve_base_url:
-            location_retrieve_base_url = f"{base_url}{LOCATION_RETRIEVE_URL}"
-
-        if not slice_base_url:
-            slice_base_url = f"{base_url}{SLICE_URL}"
-
-        if not slice_attach_base_url:
-            slice_attach_base_url = f"{base_url}{SLICE_ATTACH_URL}"
-
-        if not device_status_base_url:
-            device_status_base_url = f"{base_url}{DEVICE_STATUS_URL}"
-
-        if not congestion_base_url:
-            congestion_base_url = f"{base_url}{CONGESTION_URL}"
-
-        if not sim_swap_base_url:
-            sim_swap_base_url = f"{base_url}{SIM_SWAP_URL}"
-
-        if not geofencing_base_url:
-            geofencing_base_url = f"{base_url}{GEOFENCING_URL}"
-
-        if not number_verification_base_url:
-            number_verification_base_url = f"{base_url}{NUMBER_VERIFICATION_URL}"
-
-        if not credentials_base_url:
-            credentials_base_url = f"{base_url}{CREDENTIALS_URL}"
-
-        if not authorization_base_url:
-            authorization_base_url = f"{base_url}{AUTHORIZATION_URL}"
-
-        if not call_forwarding_base_url:
-            call_forwarding_base_url = f"{base_url}{CALL_FORWARDING_URL}"
-
-        self.sessions = QodAPI(
-            base_url=qos_base_url,
-            rapid_key=token,
-            rapid_host=hostname,
-        )
-
-        self.devicestatus = DeviceStatusAPI(
-            base_url=device_status_base_url,
-            rapid_key=token,
-            rapid_host=hostname,
-        )
-
-        self.location_verify = LocationVerifyAPI(
-            base_url=location_verify_base_url,
-            rapid_key=token,
-            rapid_host=hostname,
-        )
-        self.location_retrieve = LocationRetrievalAPI(
-            base_url=location_retrieve_base_url,
-            rapid_key=token,
-            rapid_host=hostname,
-        )
-
-        self.slicing = SliceAPI(
-            base_url=slice_base_url,
-            rapid_key=token,
-            rapid_host=hostname,
-        )
-
-        self.slice_attach = AttachAPI(
-            base_url=slice_attach_base_url,
-            rapid_key=token,
-            rapid_host=hostname,
-        )
-
-        self.congestion = CongestionAPI(
-            base_url=congestion_base_url,
-            rapid_key=token,
-            rapid_host=hostname,
-        )
-
-        self.sim_swap = SimSwapAPI(
-            base_url=sim_swap_base_url,
-            rapid_key=token,
-            rapid_host=hostname,
-        )
-
-        self.geofencing = GeofencingAPI(
-            base_url=geofencing_base_url,
-            rapid_key=token,
-            rapid_host=hostname,
-        )
-
-        self.number_verification = NumberVerificationAPI(
-            base_url = number_verification_base_url,
-            rapid_key = token,
-            rapid_host=hostname,
-        )
-
-        self.credentials = CredentialsAPI(
-            base_url = credentials_base_url,
-            rapid_key = token,
-            rapid_host=hostname,
-        )
-
-        self.authorization = AuthorizationAPI(
-            base_url = authorization_base_url,
-            rapid_key = token,
-            rapid_host=hostname,
-        )
-
-        self.call_forwarding = CallForwardingAPI(
-            base_url = call_forwarding_base_url,
-            rapid_key = token,
-            rapid_host=hostname,
-        )
+        urls = product_base_urls(env_mode, {
+            "qos": qos_base_url,
+            "location_verify": location_verify_base_url,
+            "location_retrieve": location_retrieve_base_url,
+            "slice": slice_base_url,
+            "slice_attach": slice_attach_base_url,
+            "device_status": device_status_base_url,
+            "congestion": congestion_base_url,
+            "sim_swap": sim_swap_base_url,
+            "geofencing": geofencing_base_url,
+            "credentials": credentials_base_url,
+            "authorization": authorization_base_url,
+            "number_verification": number_verification_base_url,
+            "call_forwarding": call_forwarding_base_url,
+        })
+
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        # Circuit breakers by product name
+        self.circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self.timeouts = product_timeouts(timeout, timeouts)
+        self.metrics = metrics
+        self.device_status_cache = ReadThroughCache.from_policy(device_status_cache)
+        self.location_cache = TTLCache.from_policy(location_cache)
+        # Attachments of every slice by slice name, from the latest attachment listing,
+        # dropped whenever a device is attached or detached
+        self.attachment_index = TTLCache(ATTACHMENT_INDEX_TTL, max_size=1)
+        self.instrumentation = client_instrumentation(urls, request_hooks, opentelemetry, metrics)
+        options = pool_options(transport, limits, http2, proxy)
+        if transport is None:
+            transport = self._build_pool(options, environment_proxies(trust_env, options))
+        self.transport = transport
+        self.hostname = environment_hostname(env_mode)
+        self._urls = urls
+        self._token = token
+        self._event_hooks = event_hooks
+        self._lock = threading.Lock()
+
+    def build_product_api(self, product: str, api_class: Callable):
+        """Builds the API of a product, sending its requests through the shared pool"""
+        transport = self._product_transport(product)
+        if product == "token":
+            product_api = api_class(transport)
+        else:
+            product_api = api_class(self._urls[product], self._token, self.hostname, transport)
+
+        if self._event_hooks:
+            product_api.client.event_hooks = self._event_hooks
+
+        return product_api
+
+    @abc.abstractmethod
+    def _build_pool(self, options: Dict[str, Any], proxies: Dict[str, str]) -> Any:
+        """Returns the connection pool shared by the product APIs"""
+
+    @abc.abstractmethod
+    def _product_transport(self, product: str) -> Any:
+        """Returns the transport of a product API, sending its requests through the pool"""
+
+
+class APIClient(BaseAPIClient):
+    """A client for communicating with Network as Code APIs.
+
+    ### Args:
+        token (str): Authentication token for the Network as Code API.
+        base_url (str): Base URL for the Network as Code API.
+        testmode (bool): Whether to use simulated or real resources.
+        limits (httpx.Limits): Connection pool limits (max connections, keep-alive expiry)
+        http2 (bool): Whether to multiplex requests over HTTP/2. Requires the `h2` package.
+        retry (RetryPolicy): Policy for retrying transient failures. Requests are not retried by default.
+        rate_limiter (RateLimiter): Limiter keeping requests under the API quota. Unlimited by default.
+        circuit_breaker (CircuitBreakerPolicy): Settings of a circuit breaker per product API,
+        which fails requests fast with `CircuitOpenError` while the product is failing. None by default.
+        timeout (float | httpx.Timeout): Timeouts of every request, 30 seconds by default.
+        An `httpx.Timeout` sets the connect, read, write and pool timeouts separately.
+        timeouts (dict): Timeouts by product name, such as "location_retrieve" or "slice",
+        overriding `timeout` for those products.
+        proxy (httpx.Proxy | str): Proxy to send the requests through.
+        trust_env (bool): Whether to send requests through the proxies set by the `HTTP_PROXY`,
+        `HTTPS_PROXY`, `ALL_PROXY` and `NO_PROXY` environment variables when no `proxy` is given.
+        True by default, as for HTTPX clients.
+        transport (httpx.BaseTransport): Custom transport sending the requests instead of
+        the connection pool of the SDK, such as a mock transport for testing or benchmarking.
+        Cannot be combined with `limits`, `http2` or `proxy`.
+        event_hooks (dict): HTTPX event hooks installed on the client of every product API,
+        as in `{"request": [...], "response": [...]}`.
+        request_hooks (list): Callables receiving a `RequestEvent` with the product, endpoint,
+        status, duration, retries and sizes of every request once its response has been read.
+        opentelemetry (bool): Whether to record an OpenTelemetry span and duration metric of
+        every request. Requires the `opentelemetry-api` package.
+        metrics (MetricsRegistry): Registry collecting request counters and latency histograms
+        by product and route.
+        device_status_cache (CachePolicy): Settings of a cache of the connectivity and roaming
+        status of devices, reused for `ttl` seconds. Callers asking for the same status at
+        once share a single request. Off by default.
+        location_cache (CachePolicy): Settings of a cache of the locations of devices, kept for
+        at most `ttl` seconds. A location is reused for calls whose `max_age` it is younger than,
+        counting from when the network located the device. Off by default.
+
+    The timeouts of the requests sent within a block can be overridden with
+    `network_as_code.api.request_timeout`.
+
+    All of the product APIs share a single connection pool, so that requests
+    to different products reuse the same TLS connection to the gateway.
+    """
+
+    sessions: LazyProductAPI[QodAPI] = LazyProductAPI("qos", "qod_api.QodAPI")
+    devicestatus: LazyProductAPI[DeviceStatusAPI] = LazyProductAPI("device_status", "device_status_api.DeviceStatusAPI")
+    location_verify: LazyProductAPI[LocationVerifyAPI] = LazyProductAPI(
+        "location_verify", "location_api.LocationVerifyAPI"
+    )
+    location_retrieve: LazyProductAPI[LocationRetrievalAPI] = LazyProductAPI(
+        "location_retrieve", "location_api.LocationRetrievalAPI"
+    )
+    slicing: LazyProductAPI[SliceAPI] = LazyProductAPI("slice", "slice_api.SliceAPI")
+    slice_attach: LazyProductAPI[AttachAPI] = LazyProductAPI("slice_attach", "slice_api.AttachAPI")
+    congestion: LazyProductAPI[CongestionAPI] = LazyProductAPI("congestion", "congestion_api.CongestionAPI")
+    sim_swap: LazyProductAPI[SimSwapAPI] = LazyProductAPI("sim_swap", "sim_swap_api.SimSwapAPI")
+    geofencing: LazyProductAPI[GeofencingAPI] = LazyProductAPI("geofencing", "geofencing_api.GeofencingAPI")
+    number_verification: LazyProductAPI[NumberVerificationAPI] = LazyProductAPI(
+        "number_verification", "number_verification_api.NumberVerificationAPI"
+    )
+    credentials: LazyProductAPI[CredentialsAPI] = LazyProductAPI("credentials", "credentials_api.CredentialsAPI")
+    authorization: LazyProductAPI[AuthorizationAPI] = LazyProductAPI(
+        "authorization", "authorization_api.AuthorizationAPI"
+    )
+    call_forwarding: LazyProductAPI[CallForwardingAPI] = LazyProductAPI(
+        "call_forwarding", "call_forwarding_api.CallForwardingAPI"
+    )
+    token: LazyProductAPI[TokenAPI] = LazyProductAPI("token", "token_api.TokenAPI")
+
+    transport: httpx.BaseTransport
+
+    def _build_pool(
+        self, options: Dict[str, Any], proxies: Dict[str, str]
+    ) -> httpx.BaseTransport:
+        pool = httpx.HTTPTransport(**options)
+        if not proxies:
+            return pool
+        return ProxyRouter(pool, {
+            scheme: httpx.HTTPTransport(**{**options, "proxy": url})
+            for scheme, url in proxies.items()
+        })
+
+    def _product_transport(self, product: str) -> ProductTransport:
+        return ProductTransport(self.transport, product_policies(self, product))
+
+    def close(self) -> None:
+        """Close the connection pool shared by the product APIs."""
+        self.transport.close()
+
+
+class AsyncAPIClient(BaseAPIClient):
+    """An asyncio client for communicating with Network as Code APIs.
+
+    Takes the same arguments as `APIClient`, but every product API
+    is backed by an `httpx.AsyncClient` and its methods must be awaited.
+    """
+
+    sessions: LazyProductAPI[AsyncQodAPI] = LazyProductAPI("qos", "qod_api.AsyncQodAPI")
+    devicestatus: LazyProductAPI[AsyncDeviceStatusAPI] = LazyProductAPI(
+        "device_status", "device_status_api.AsyncDeviceStatusAPI"
+    )
+    location_verify: LazyProductAPI[AsyncLocationVerifyAPI] = LazyProductAPI(
+        "location_verify", "location_api.AsyncLocationVerifyAPI"
+    )
+    location_retrieve: LazyProductAPI[AsyncLocationRetrievalAPI] = LazyProductAPI(
+        "location_retrieve", "location_api.AsyncLocationRetrievalAPI"
+    )
+    slicing: LazyProductAPI[AsyncSliceAPI] = LazyProductAPI("slice", "slice_api.AsyncSliceAPI")
+    slice_attach: LazyProductAPI[AsyncAttachAPI] = LazyProductAPI("slice_attach", "slice_api.AsyncAttachAPI")
+    congestion: LazyProductAPI[AsyncCongestionAPI] = LazyProductAPI("congestion", "congestion_api.AsyncCongestionAPI")
+    sim_swap: LazyProductAPI[AsyncSimSwapAPI] = LazyProductAPI("sim_swap", "sim_swap_api.AsyncSimSwapAPI")
+    geofencing: LazyProductAPI[AsyncGeofencingAPI] = LazyProductAPI("geofencing", "geofencing_api.AsyncGeofencingAPI")
+    number_verification: LazyProductAPI[AsyncNumberVerificationAPI] = LazyProductAPI(
+        "number_verification", "number_verification_api.AsyncNumberVerificationAPI"
+    )
+    credentials: LazyProductAPI[AsyncCredentialsAPI] = LazyProductAPI(
+        "credentials", "credentials_api.AsyncCredentialsAPI"
+    )
+    authorization: LazyProductAPI[AsyncAuthorizationAPI] = LazyProductAPI(
+        "authorization", "authorization_api.AsyncAuthorizationAPI"
+    )
+    call_forwarding: LazyProductAPI[AsyncCallForwardingAPI] = LazyProductAPI(
+        "call_forwarding", "call_forwarding_api.AsyncCallForwardingAPI"
+    )
+    token: LazyProductAPI[AsyncTokenAPI] = LazyProductAPI("token", "token_api.AsyncTokenAPI")
+
+    transport: httpx.AsyncBaseTransport
+
+    def _build_pool(
+        self, options: Dict[str, Any], proxies: Dict[str, str]
+    ) -> httpx.AsyncBaseTransport:
+        pool = httpx.AsyncHTTPTransport(**options)
+        if not proxies:
+            return pool
+        return AsyncProxyRouter(pool, {
+            scheme: httpx.AsyncHTTPTransport(**{**options, "proxy": url})
+            for scheme, url in proxies.items()
+        })
+
+    def _product_transport(self, product: str) -> AsyncProductTransport:
+        return AsyncProductTransport(self.transport, product_policies(self, product))
+
+    async def aclose(self) -> None:
+        """Close the connection pool shared by the product APIs."""
+        await self.transport.aclose()
@@ -0,0 +1,192 @@
+# Copyright 2023 Nokia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import importlib
+import json as jsonlib
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Union
+
+import httpx
+
+if TYPE_CHECKING:
+    from .instrumentation import RequestTrace
+
+# Codecs in order of preference, the standard library always being available
+CODECS = ["orjson", "msgspec", "json"]
+
+
+class Codec:
+    """Encodes request bodies to JSON and decodes JSON responses.
+
+    ### Args:
+        name (str): Name of the library doing the work.
+        encode (Callable): Returns the JSON of a value as UTF-8 bytes.
+        decode (Callable): Returns the value of JSON given as bytes or a string.
+    """
+
+    def __init__(self, name: str, encode: Callable[[Any], bytes], decode: Callable[[Any], Any]):
+        self.name = name
+        self.encode = encode
+        self.decode = decode
+
+
+def _stdlib_encode(value: Any) -> bytes:
+    # The same compact encoding as HTTPX uses for `json=` bodies
+    return jsonlib.dumps(value, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+def load_codec(name: str) -> Codec:
+    """Returns the codec of the named library, raising `ImportError` if it is not installed"""
+    if name == "json":
+        return Codec("json", _stdlib_encode, jsonlib.loads)
+
+    if name == "orjson":
+        orjson = importlib.import_module("orjson")
+        return Codec("orjson", orjson.dumps, orjson.loads)
+
+    if name == "msgspec":
+        msgspec_json = importlib.import_module("msgspec.json")
+        return Codec("msgspec", msgspec_json.encode, msgspec_json.decode)
+
+    raise ValueError(f"Unknown JSON codec {name}, expected one of {', '.join(CODECS)}")
+
+
+def detect_codec() -> Codec:
+    """Returns the fastest codec installed"""
+    for name in CODECS:
+        try:
+            return load_codec(name)
+        except ImportError:
+            continue
+    raise AssertionError("The json module is always available")
+
+
+_state: Dict[str, Codec] = {"codec": detect_codec()}
+
+
+def current_codec() -> Codec:
+    return _state["codec"]
+
+
+def use_codec(codec: Union[str, Codec]) -> Codec:
+    """Switch the codec used by every client.
+
+    Takes the name of a supported library, such as "json" to opt out of a
+    faster one, or a `Codec` wrapping any other JSON library.
+    """
+    if isinstance(codec, str):
+        codec = load_codec(codec)
+    _state["codec"] = codec
+    return codec
+
+
+def encode_json(value: Any) -> bytes:
+    return _state["codec"].encode(value)
+
+
+def decode_json(content: Any) -> Any:
+    """Decodes JSON with the current codec, raising `ValueError` if it is invalid.
+
+    Not every library raises a `ValueError` for invalid JSON, such as msgspec,
+    so their errors are raised as one, as the standard library does.
+    """
+    try:
+        return _state["codec"].decode(content)
+    except ValueError:
+        raise
+    except Exception as error:
+        raise ValueError(f"Invalid JSON: {error}") from error
+
+
+# Marks a response whose JSON has not been decoded ahead
+_NOT_DECODED = object()
+
+
+class CodecResponse(httpx.Response):
+    """A response decoding its JSON body with the codec of the SDK.
+
+    The decoding of the response to an instrumented request is timed and
+    reported along with the request.
+    """
+
+    trace: Optional["RequestTrace"] = None
+    decoded_json: Any = _NOT_DECODED
+
+    def json(self, **kwargs: Any) -> Any:
+        if kwargs:
+            # Options of json.loads are only understood by the standard library
+            return super().json(**kwargs)
+
+        if self.decoded_json is not _NOT_DECODED:
+            # Handed out once, since the caller may modify it
+            value, self.decoded_json = self.decoded_json, _NOT_DECODED
+            return value
+
+        content = self.content
+        trace, self.trace = self.trace, None
+        if trace is None:
+            return decode_json(content)
+
+        started, started_ns = time.perf_counter(), time.time_ns()
+        try:
+            return decode_json(content)
+        finally:
+            trace.decoded(started, started_ns)
+
+    def decode_ahead(self):
+        """Decodes the body of a successful JSON response for the first call of `json()`"""
+        if not (self.is_success and self.content and "json" in self.headers.get("Content-Type", "")):
+            return
+        try:
+            self.decoded_json = self.json()
+        except ValueError:
+            # Raised again once the SDK decodes the response
+            pass
+
+
+def codec_response(response: httpx.Response) -> httpx.Response:
+    """Returns the response, decoding its body with a faster codec if one is in use"""
+    if _state["codec"].name == "json":
+        return response
+    return traced_response(response, None)
+
+
+def traced_response(response: httpx.Response, trace: Optional["RequestTrace"]) -> CodecResponse:
+    """Returns the response as a `CodecResponse`, reporting its decoding to the trace if given"""
+    wrapped = CodecResponse(
+        status_code=response.status_code,
+        headers=response.headers,
+        stream=response.stream,
+        extensions=response.extensions,
+    )
+    wrapped.trace = trace
+    return wrapped
+
+
+class CodecClientMixin:
+    """Encodes the `json=` bodies of an HTTPX client with the codec of the SDK"""
+
+    def build_request(self, method, url, *, json=None, content=None, **kwargs):
+        if json is not None:
+            content = encode_json(json)
+        return super().build_request(method, url, content=content, **kwargs)  # type: ignore[misc]
+
+
+class CodecClient(CodecClientMixin, httpx.Client):
+    pass
+
+
+class AsyncCodecClient(CodecClientMixin, httpx.AsyncClient):
+    pass
@@ -15,25 +15,58 @@
 
 from typing import Optional
 
-from network_as_code.api.utils import httpx_client
+import httpx
+
+from network_as_code.api.utils import httpx_client, async_httpx_client
 
 from ..errors import error_handler
 
+def build_query_body(device, start: Optional[str] = None, end: Optional[str] = None) -> dict:
+    body = {
+        "device": device.wire_dict()
+    }
 
-class CongestionAPI:
-    def __init__(self, base_url: str, rapid_key: str, rapid_host: str):
-        self.client = httpx_client(base_url, rapid_key, rapid_host)
+    if start:
+        body["start"] = start
 
-    def fetch_congestion(self, device, start: Optional[str] = None, end: Optional[str] = None) -> dict:
-        body = {
-            "device": device.model_dump(mode='json', by_alias=True, exclude_none=True)
-        }
+    if end:
+        body["end"] = end
+
+    return body
+
+
+def build_subscription_body(
+    device,
+    notification_url: str,
+    subscription_expire_time: str,
+    notification_auth_token: Optional[str] = None,
+) -> dict:
+    body = {
+        "device": device.wire_dict(),
+        "webhook": {
+            "notificationUrl": notification_url
+        },
+        "subscriptionExpireTime": subscription_expire_time
+    }
 
-        if start:
-            body["start"] = start
+    if notification_auth_token:
+        body["webhook"]["notificationAuthToken"] = notification_auth_token
 
-        if end:
-            body["end"] = end
+    return body
+
+
+class CongestionAPI:
+    def __init__(
+        self,
+        base_url: str,
+        rapid_key: str,
+        rapid_host: str,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        self.client = httpx_client(base_url, rapid_key, rapid_host, transport)
+
+    def fetch_congestion(self, device, start: Optional[str] = None, end: Optional[str] = None) -> dict:
+        body = build_query_body(device, start, end)
 
         response = self.client.post(url="/query", json=body)
 
@@ -48,16 +81,9 @@ class CongestionAPI:
         subscription_expire_time: str,
         notification_auth_token: Optional[str] = None,
     ) -> dict:
-        body = {
-            "device": device.model_dump(mode='json', by_alias=True, exclude_none=True),
-            "webhook": {
-                "notificationUrl": notification_url
-            },
-            "subscriptionExpireTime": subscription_expire_time
-        }
-
-        if notification_auth_token:
-            body["webhook"]["notificationAuthToken"] = notification_auth_token
+        body = build_subscription_body(
+            device, notification_url, subscription_expire_time, notification_auth_token
+        )
 
         response = self.client.post(url="/subscriptions", json=body)
 
@@ -83,3 +109,59 @@ class CongestionAPI:
         error_handler(response)
 
         return response.json()
+
+
+class AsyncCongestionAPI:
+    def __init__(
+        self,
+        base_url: str,
+        rapid_key: str,
+        rapid_host: str,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.client = async_httpx_client(base_url, rapid_key, rapid_host, transport)
+
+    async def fetch_congestion(self, device, start: Optional[str] = None, end: Optional[str] = None) -> dict:
+        body = build_query_body(device, start, end)
+
+        response = await self.client.post(url="/query", json=body)
+
+        error_handler(response)
+
+        return response.json()
+
+    async def subscribe(
+        self,
+        device,
+        notification_url: str,
+        subscription_expire_time: str,
+        notification_auth_token: Optional[str] = None,
+    ) -> dict:
+        body = build_subscription_body(
+            device, notification_url, subscription_expire_time, notification_auth_token
+        )
+
+        response = await self.client.post(url="/subscriptions", json=body)
+
+        error_handler(response)
+
+        return response.json()
+
+    async def delete_subscription(self, subscription_id):
+        response = await self.client.delete(url=f"/subscriptions/{subscription_id}")
+
+        error_handler(response)
+
+    async def get_subscription(self, subscription_id: str):
+        response = await self.client.get(url=f"/subscriptions/{subscription_id}")
+
+        error_handler(response)
+
+        return response.json()
+
+    async def get_subscriptions(self):
+        response = await self.client.get(url="/subscriptions")
+
+        error_handler(response)
+
+        return response.json()
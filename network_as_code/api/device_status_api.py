@@ -14,16 +14,49 @@
 
 from typing import Optional
 
-
-from ..errors import error_handler
-from .utils import delete_none, httpx_client
+import httpx
 
 
+from ..errors import error_handler
+from .utils import delete_none, httpx_client, async_httpx_client
+
+
+
+def build_subscription_body(
+    device,
+    event_type: str,
+    notification_url: str,
+    notification_auth_token: Optional[str],
+    max_number_of_reports: Optional[int] = None,
+    subscription_expire_time: Optional[str] = None,
+) -> dict:
+    assert device.network_access_id != "None"
+
+    return delete_none(
+        {
+            "subscriptionDetail": {
+                "device": device.wire_dict(),
+                "type": event_type,
+            },
+            "maxNumberOfReports": max_number_of_reports,
+            "subscriptionExpireTime": subscription_expire_time,
+            "webhook": {
+                "notificationUrl": notification_url,
+                "notificationAuthToken": notification_auth_token,
+            },
+        }
+    )
 
 
 class DeviceStatusAPI:
-    def __init__(self, base_url: str, rapid_key: str, rapid_host: str) -> None:
-        self.client = httpx_client(base_url, rapid_key, rapid_host)
+    def __init__(
+        self,
+        base_url: str,
+        rapid_key: str,
+        rapid_host: str,
+        transport: Optional[httpx.BaseTransport] = None,
+    ) -> None:
+        self.client = httpx_client(base_url, rapid_key, rapid_host, transport)
 
 
     def create_subscription(
@@ -35,23 +68,15 @@ class DeviceStatusAPI:
         max_number_of_reports: Optional[int] = None,
         subscription_expire_time: Optional[str] = None,
     ):
-        assert device.network_access_id != "None"
-
         res = self.client.post(
             "/subscriptions",
-            json=delete_none(
-                {
-                    "subscriptionDetail": {
-                        "device": device.model_dump(mode='json', by_alias=True),
-                        "type": event_type,
-                    },
-                    "maxNumberOfReports": max_number_of_reports,
-                    "subscriptionExpireTime": subscription_expire_time,
-                    "webhook": {
-                        "notificationUrl": notification_url,
-                        "notificationAuthToken": notification_auth_token,
-                    },
-                }
+            json=build_subscription_body(
+                device,
+                event_type,
+                notification_url,
+                notification_auth_token,
+                max_number_of_reports,
+                subscription_expire_time,
             ),
         )
         error_handler(res)
@@ -90,3 +115,71 @@ class DeviceStatusAPI:
         error_handler(res)
 
         return res.json()
+
+
+class AsyncDeviceStatusAPI:
+    def __init__(
+        self,
+        base_url: str,
+        rapid_key: str,
+        rapid_host: str,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.client = async_httpx_client(base_url, rapid_key, rapid_host, transport)
+
+    async def create_subscription(
+        self,
+        device,
+        event_type: str,
+        notification_url: str,
+        notification_auth_token: Optional[str],
+        max_number_of_reports: Optional[int] = None,
+        subscription_expire_time: Optional[str] = None,
+    ):
+        res = await self.client.post(
+            "/subscriptions",
+            json=build_subscription_body(
+                device,
+                event_type,
+                notification_url,
+                notification_auth_token,
+                max_number_of_reports,
+                subscription_expire_time,
+            ),
+        )
+        error_handler(res)
+
+        return res.json()
+
+    async def get_subscription(self, id: str):
+        res = await self.client.get(f"/subscriptions/{id}")
+
+        error_handler(res)
+
+        return res.json()
+
+    async def get_subscriptions(self):
+        res = await self.client.get("/subscriptions")
+
+        error_handler(res)
+
+        return res.json()
+
+    async def delete_subscription(self, id: str):
+        res = await self.client.delete(f"/subscriptions/{id}")
+
+        error_handler(res)
+
+    async def get_connectivity(self, device: dict):
+        res = await self.client.post("/connectivity", json={"device": device})
+
+        error_handler(res)
+
+        return res.json()
+
+    async def get_roaming(self, device: dict):
+        res = await self.client.post("/roaming", json={"device": device})
+
+        error_handler(res)
+
+        return res.json()
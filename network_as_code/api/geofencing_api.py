@@ -15,13 +15,70 @@
 from datetime import datetime
 
 from typing import List, Union, Optional, Any
-from network_as_code.api.utils import httpx_client
+
+import httpx
+
+from network_as_code.api.utils import httpx_client, async_httpx_client
 from ..errors import error_handler
 
+
+def build_subscription_body(
+    device,
+    sink: str,
+    typelist: List[str],
+    latitude: float,
+    longitude: float,
+    radius: Union[int, float],
+    sink_credential: Any = None,
+    subscription_expire_time: Union[datetime , str, None] = None,
+    subscription_max_events: Optional[int] = None,
+    initial_event: Optional[bool] = None
+) -> dict:
+    body: dict = {
+        "protocol": "HTTP",
+        "sink": sink,
+        "types": typelist,
+        "config": {
+            "subscriptionDetail": {
+                "device": device.wire_dict(),
+                "area": {
+                    "areaType": "CIRCLE",
+                    "center": {
+                        "latitude": latitude,
+                        "longitude": longitude
+                    },
+                    "radius": radius
+                }
+            }
+        }
+    }
+    if sink_credential:
+        body["sinkCredential"] = {
+            **sink_credential.model_dump(mode='json', by_alias=True)
+        }
+
+    if subscription_expire_time:
+        body["config"]["subscriptionExpireTime"] = subscription_expire_time
+
+    if subscription_max_events:
+        body["config"]["subscriptionMaxEvents"] = subscription_max_events
+
+    if initial_event is not None:
+        body["config"]["initialEvent"] = initial_event
+
+    return body
+
+
 class GeofencingAPI:
 
-    def __init__(self, base_url: str, rapid_key: str, rapid_host: str):
-        self.client = httpx_client(base_url, rapid_key, rapid_host)
+    def __init__(
+        self,
+        base_url: str,
+        rapid_key: str,
+        rapid_host: str,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        self.client = httpx_client(base_url, rapid_key, rapid_host, transport)
 
     def create_subscription(
         self,
@@ -36,38 +93,18 @@ class GeofencingAPI:
         subscription_max_events: Optional[int] = None,
         initial_event: Optional[bool] = None
     ):
-
-        body: dict = {
-            "protocol": "HTTP",
-            "sink": sink,
-            "types": typelist,
-            "config": {
-                "subscriptionDetail": {
-                    "device": device.model_dump(mode='json', by_alias=True, exclude_none=True),
-                    "area": {
-                        "areaType": "CIRCLE",
-                        "center": {
-                            "latitude": latitude,
-                            "longitude": longitude
-                        },
-                        "radius": radius
-                    }
-                }
-            }
-        }
-        if sink_credential:
-            body["sinkCredential"] = {
-                **sink_credential.model_dump(mode='json', by_alias=True)
-            }
-
-        if subscription_expire_time:
-            body["config"]["subscriptionExpireTime"] = subscription_expire_time
-
-        if subscription_max_events:
-            body["config"]["subscriptionMaxEvents"] = subscription_max_events
-
-        if initial_event is not None:
-            body["config"]["initialEvent"] = initial_event
+        body = build_subscription_body(
+            device=device,
+            sink=sink,
+            typelist=typelist,
+            latitude=latitude,
+            longitude=longitude,
+            radius=radius,
+            sink_credential=sink_credential,
+            subscription_expire_time=subscription_expire_time,
+            subscription_max_events=subscription_max_events,
+            initial_event=initial_event,
+        )
 
         response = self.client.post(url="/subscriptions", json=body)
 
@@ -93,3 +130,66 @@ class GeofencingAPI:
         error_handler(resp)
 
         return resp.json()
+
+
+class AsyncGeofencingAPI:
+
+    def __init__(
+        self,
+        base_url: str,
+        rapid_key: str,
+        rapid_host: str,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.client = async_httpx_client(base_url, rapid_key, rapid_host, transport)
+
+    async def create_subscription(
+        self,
+        device,
+        sink: str,
+        typelist: List[str],
+        latitude: float,
+        longitude: float,
+        radius: Union[int, float],
+        sink_credential: Any = None,
+        subscription_expire_time: Union[datetime , str, None] = None,
+        subscription_max_events: Optional[int] = None,
+        initial_event: Optional[bool] = None
+    ):
+        body = build_subscription_body(
+            device=device,
+            sink=sink,
+            typelist=typelist,
+            latitude=latitude,
+            longitude=longitude,
+            radius=radius,
+            sink_credential=sink_credential,
+            subscription_expire_time=subscription_expire_time,
+            subscription_max_events=subscription_max_events,
+            initial_event=initial_event,
+        )
+
+        response = await self.client.post(url="/subscriptions", json=body)
+
+        error_handler(response)
+
+        return response.json()
+
+    async def delete_subscription(self,subscription_id):
+        resp = await self.client.delete(url=f"/subscriptions/{subscription_id}")
+
+        error_handler(resp)
+
+    async def get_subscription(self, subscription_id: str):
+        resp = await self.client.get(url=f"/subscriptions/{subscription_id}")
+
+        error_handler(resp)
+
+        return resp.json()
+
+    async def get_subscriptions(self):
+        resp = await self.client.get(url="/subscriptions")
+
+        error_handler(resp)
+
+        return resp.json()
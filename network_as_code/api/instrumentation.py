@@ -0,0 +1,349 @@
+# Copyright 2023 Nokia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import importlib
+import inspect
+import logging
+import time
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TypeVar
+
+import httpx
+
+if TYPE_CHECKING:
+    from .codec import CodecResponse
+
+logger = logging.getLogger(__name__)
+
+# Path segments followed by the ID of a resource, as in "/sessions/{id}"
+RESOURCE_COLLECTIONS = {"sessions", "slices", "attachments", "subscriptions"}
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Traces of the requests sent by the SDK call building models in this context
+_building: ContextVar[Optional[List["RequestTrace"]]] = ContextVar("building", default=None)
+
+
+def route_template(path: str, base_path: str = "") -> str:
+    """Returns the route of a path within its product API, with resource IDs replaced by `{id}`.
+
+    For example "/slice/v1/slices/my-slice/activate" within "/slice/v1" is "/slices/{id}/activate".
+    """
+    if base_path and path.startswith(base_path):
+        path = path[len(base_path):] or "/"
+    segments = path.split("/")
+    for index in range(1, len(segments)):
+        if segments[index - 1] in RESOURCE_COLLECTIONS and segments[index]:
+            segments[index] = "{id}"
+    return "/".join(segments)
+
+
+class RequestEvent:
+    """A request made to a product API, as passed to the request hooks of the client.
+
+    #### Public Attributes:
+        product (str): Name of the product API, such as "location_retrieve".
+        method (str): HTTP method of the request.
+        endpoint (str): Path of the requested URL, such as "/qod/v0/sessions/1234".
+        route (str): Endpoint within the product API, with resource IDs replaced, such as "/sessions/{id}".
+        status_code (int | None): Status of the final response, None if no response was received.
+        duration (float): Seconds from sending the request until its response was read,
+        including every retry.
+        retries (int): Number of times the request was retried.
+        request_bytes (int): Size of the request body.
+        response_bytes (int): Size of the response body.
+        error (Exception | None): Error which failed the request, such as a timeout.
+        decode_duration (float): Seconds spent decoding the JSON of the response, 0 if it was not decoded.
+        build_duration (float): Seconds spent building models from the response once it was decoded,
+        0 if the SDK call built none.
+    """
+
+    def __init__(
+        self,
+        product: str,
+        method: str,
+        endpoint: str,
+        route: str,
+        status_code: Optional[int],
+        duration: float,
+        retries: int,
+        request_bytes: int,
+        response_bytes: int,
+        error: Optional[BaseException] = None,
+        decode_duration: float = 0.0,
+        build_duration: float = 0.0,
+    ):
+        self.product = product
+        self.method = method
+        self.endpoint = endpoint
+        self.route = route
+        self.status_code = status_code
+        self.duration = duration
+        self.retries = retries
+        self.request_bytes = request_bytes
+        self.response_bytes = response_bytes
+        self.error = error
+        self.decode_duration = decode_duration
+        self.build_duration = build_duration
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestEvent({self.product} {self.method} {self.route} -> {self.status_code}, "
+            f"{self.duration * 1000:.1f} ms, {self.retries} retries)"
+        )
+
+
+RequestHook = Callable[[RequestEvent], Any]
+
+
+class Instrumentation:
+    """Reports the requests of a client to its request hooks and OpenTelemetry.
+
+    ### Args:
+        hooks (list): Callables receiving a `RequestEvent` once every request completes.
+        Exceptions raised by a hook are logged instead of failing the request.
+        opentelemetry (bool): Whether to record a span and a duration metric of every request
+        with the global OpenTelemetry providers. Requires the `opentelemetry-api` package.
+        base_paths (dict): Path of the base URL of every product API, by product name,
+        for telling the route of a request within its product.
+    """
+
+    def __init__(
+        self,
+        hooks: Optional[List[RequestHook]] = None,
+        opentelemetry: bool = False,
+        base_paths: Optional[Dict[str, str]] = None,
+    ):
+        self.hooks = list(hooks or [])
+        self.base_paths = base_paths or {}
+        self.tracer = None
+        self.duration_histogram = None
+        if opentelemetry:
+            # Raises ImportError right away if OpenTelemetry is not installed
+            trace = importlib.import_module("opentelemetry.trace")
+            metrics = importlib.import_module("opentelemetry.metrics")
+            self.tracer = trace.get_tracer("network_as_code")
+            self.duration_histogram = metrics.get_meter("network_as_code").create_histogram(
+                "http.client.request.duration",
+                unit="s",
+                description="Duration of the requests made to the Network as Code API",
+            )
+
+    def start(self, product: str, request: httpx.Request) -> "RequestTrace":
+        return RequestTrace(self, product, request)
+
+
+def builds_models(func: F) -> F:
+    """Decorates an SDK call building models from the responses to its requests.
+
+    The requests sent within the call are reported once it returns, the last
+    one decoded with the time spent building the models from its response.
+    Works for coroutine functions as well, and nested calls are timed once.
+    """
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            traces, token = _building.get(), None
+            if traces is None:
+                traces = []
+                token = _building.set(traces)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                if token is not None:
+                    _building.reset(token)
+                    report_built(traces)
+        return async_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        traces, token = _building.get(), None
+        if traces is None:
+            traces = []
+            token = _building.set(traces)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            if token is not None:
+                _building.reset(token)
+                report_built(traces)
+    return wrapper  # type: ignore[return-value]
+
+
+def report_built(traces: List["RequestTrace"]):
+    """Reports the requests of an SDK call once it has built its models"""
+    built_at = time.perf_counter()
+    decoded = [trace for trace in traces if trace.decoded_at is not None]
+    if decoded:
+        last = max(decoded, key=lambda trace: trace.decoded_at or 0.0)
+        last.build_duration = built_at - (last.decoded_at or built_at)
+    for trace in traces:
+        trace.call = None
+        if trace.finished:
+            trace.report()
+
+
+class RequestTrace:
+    """Follows a single request from being sent until its response has been decoded.
+
+    The response is read and, if it is JSON, decoded before it is handed to
+    the SDK, so that the event tells where the time of an SDK call went.
+    Requests sent by a call building models are reported once it returns.
+    """
+
+    def __init__(self, instrumentation: Instrumentation, product: str, request: httpx.Request):
+        self.instrumentation = instrumentation
+        self.product = product
+        self.request = request
+        self.route = route_template(request.url.path, instrumentation.base_paths.get(product, ""))
+        self.attempts = 0
+        self.started = time.perf_counter()
+        self.finished = False
+        self.reported = False
+        self.status_code: Optional[int] = None
+        self.response_bytes = 0
+        self.error: Optional[BaseException] = None
+        self.duration = 0.0
+        self.decode_duration = 0.0
+        self.decoded_at: Optional[float] = None
+        self.build_duration = 0.0
+        # Wall clock times of the decoding, for its span
+        self.decode_times: Optional[tuple] = None
+        # The requests of the SDK call building models from this response
+        self.call = _building.get()
+        if self.call is not None:
+            self.call.append(self)
+        self.span = None
+        if instrumentation.tracer is not None:
+            self.span = instrumentation.tracer.start_span(
+                f"{request.method} {product}",
+                kind=importlib.import_module("opentelemetry.trace").SpanKind.CLIENT,
+                attributes={
+                    "http.request.method": request.method,
+                    "url.full": str(request.url),
+                    "http.route": self.route,
+                    "server.address": request.url.host,
+                    "network_as_code.product": product,
+                },
+            )
+
+    def failed(self, error: BaseException):
+        """Reports a request which failed without a response"""
+        self.finish(None, 0, error)
+
+    def received(self, response: "CodecResponse"):
+        """Reports the request once its response has been read, and decoded if it is JSON"""
+        self.finish(response.status_code, response.num_bytes_downloaded)
+        response.decode_ahead()
+        self.release()
+
+    def finish(self, status_code: Optional[int], response_bytes: int, error: Optional[BaseException] = None):
+        """Records the end of the request, reporting it right away if it failed"""
+        if self.finished:
+            return
+        self.finished = True
+        self.duration = time.perf_counter() - self.started
+        self.status_code = status_code
+        self.response_bytes = response_bytes
+        self.error = error
+        if error is not None:
+            self.release()
+
+    def decoded(self, started: float, started_ns: int):
+        """Records the decoding of the JSON of the response, which started at the given times"""
+        self.decoded_at = time.perf_counter()
+        self.decode_duration = self.decoded_at - started
+        self.decode_times = (started_ns, time.time_ns())
+
+    def release(self):
+        """Reports the request, unless the SDK call it was sent by is still building models"""
+        if self.finished and self.call is None:
+            self.report()
+
+    def report(self):
+        if self.reported:
+            return
+        self.reported = True
+
+        event = RequestEvent(
+            product=self.product,
+            method=self.request.method,
+            endpoint=self.request.url.path,
+            route=self.route,
+            status_code=self.status_code,
+            duration=self.duration,
+            retries=max(self.attempts - 1, 0),
+            request_bytes=int(self.request.headers.get("Content-Length", 0)),
+            response_bytes=self.response_bytes,
+            error=self.error,
+            decode_duration=self.decode_duration,
+            build_duration=self.build_duration,
+        )
+        # Failing to report a request must not fail the request itself
+        try:
+            self._record_opentelemetry(event)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Failed to record request %r with OpenTelemetry", event)
+        for hook in self.instrumentation.hooks:
+            try:
+                hook(event)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Request hook %r failed for %r", hook, event)
+
+    def _record_opentelemetry(self, event: RequestEvent):
+        if self.span is not None:
+            self._end_span(event)
+        if self.instrumentation.duration_histogram is not None:
+            attributes: Dict[str, Any] = {
+                "http.request.method": event.method,
+                "network_as_code.product": event.product,
+            }
+            if event.status_code is not None:
+                attributes["http.response.status_code"] = event.status_code
+            self.instrumentation.duration_histogram.record(event.duration, attributes)
+
+    def _end_span(self, event: RequestEvent):
+        span = self.span
+        assert span is not None
+        if self.decode_times is not None:
+            self._child_span(span, "decode", *self.decode_times)
+            if event.build_duration:
+                decoded_ns = self.decode_times[1]
+                self._child_span(span, "build", decoded_ns, decoded_ns + int(event.build_duration * 1e9))
+        span.set_attribute("http.request.resend_count", event.retries)
+        span.set_attribute("http.response.body.size", event.response_bytes)
+        if event.status_code is not None:
+            span.set_attribute("http.response.status_code", event.status_code)
+        if event.error is not None or (event.status_code or 0) >= 400:
+            status = importlib.import_module("opentelemetry.trace").StatusCode.ERROR
+            span.set_status(status)
+            span.set_attribute(
+                "error.type", type(event.error).__name__ if event.error else str(event.status_code)
+            )
+            if event.error is not None:
+                span.record_exception(event.error)
+        span.end()
+
+    def _child_span(self, parent: Any, phase: str, started_ns: int, ended_ns: int):
+        trace = importlib.import_module("opentelemetry.trace")
+        tracer = self.instrumentation.tracer
+        assert tracer is not None
+        child = tracer.start_span(
+            f"{phase} {self.product}",
+            context=trace.set_span_in_context(parent),
+            start_time=started_ns,
+            attributes={"network_as_code.product": self.product},
+        )
+        child.end(end_time=ended_ns)
@@ -12,30 +12,52 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import cast
+from typing import Optional, cast
 
-from network_as_code.api.utils import httpx_client
+import httpx
+
+from network_as_code.api.utils import httpx_client, async_httpx_client
 
 from ..errors import error_handler
 
 
+def build_verify_body(latitude, longitude, device, radius, max_age=60) -> dict:
+    body = {
+        "device": device.wire_dict(),
+        "area": {
+            "areaType": "CIRCLE",
+            "center": {"latitude": latitude, "longitude": longitude},
+            "radius": radius,
+        },
+    }
+
+    if max_age:
+        body["maxAge"] = cast(int, max_age)
+
+    return body
+
+
+def build_retrieve_body(device, max_age=60) -> dict:
+    body = {"device": device.wire_dict()}
+
+    if max_age:
+        body["maxAge"] = cast(int, max_age)
+
+    return body
+
 
 class LocationVerifyAPI:
-    def __init__(self, base_url: str, rapid_key: str, rapid_host: str):
-        self.client = httpx_client(base_url, rapid_key, rapid_host)
+    def __init__(
+        self,
+        base_url: str,
+        rapid_key: str,
+        rapid_host: str,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        self.client = httpx_client(base_url, rapid_key, rapid_host, transport)
 
     def verify_location(self, latitude, longitude, device, radius, max_age=60):
-        body = {
-            "device": device.model_dump(mode='json', by_alias=True, exclude_none=True),
-            "area": {
-                "areaType": "CIRCLE",
-                "center": {"latitude": latitude, "longitude": longitude},
-                "radius": radius,
-            },
-        }
-
-        if max_age:
-            body["maxAge"] = cast(int, max_age)
+        body = build_verify_body(latitude, longitude, device, radius, max_age)
 
         response = self.client.post(url="/verify", json=body)
 
@@ -45,17 +67,60 @@ class LocationVerifyAPI:
 
 
 class LocationRetrievalAPI:
-    def __init__(self, base_url: str, rapid_key: str, rapid_host: str):
-        self.client = httpx_client(base_url, rapid_key, rapid_host)
+    def __init__(
+        self,
+        base_url: str,
+        rapid_key: str,
+        rapid_host: str,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        self.client = httpx_client(base_url, rapid_key, rapid_host, transport)
 
     def get_location(self, device, max_age=60):
-        body = {"device": device.model_dump(mode='json', by_alias=True, exclude_none=True)}
-
-        if max_age:
-            body["maxAge"] = cast(int, max_age)
+        body = build_retrieve_body(device, max_age)
 
         response = self.client.post(url="/retrieve", json=body)
 
         error_handler(response)
 
         return response.json()
+
+
+class AsyncLocationVerifyAPI:
+    def __init__(
+        self,
+        base_url: str,
+        rapid_key: str,
+        rapid_host: str,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.client = async_httpx_client(base_url, rapid_key, rapid_host, transport)
+
+    async def verify_location(self, latitude, longitude, device, radius, max_age=60):
+        body = build_verify_body(latitude, longitude, device, radius, max_age)
+
+        response = await self.client.post(url="/verify", json=body)
+
+        error_handler(response)
+
+        return response.json()
+
+
+class AsyncLocationRetrievalAPI:
+    def __init__(
+        self,
+        base_url: str,
+        rapid_key: str,
+        rapid_host: str,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.client = async_httpx_client(base_url, rapid_key, rapid_host, transport)
+
+    async def get_location(self, device, max_age=60):
+        body = build_retrieve_body(device, max_age)
+
+        response = await self.client.post(url="/retrieve", json=body)
+
+        error_handler(response)
+
+        return response.json()
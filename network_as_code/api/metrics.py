@@ -0,0 +1,180 @@
+# Copyright 2023 Nokia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import threading
+from typing import Dict, List, Tuple
+
+from .instrumentation import RequestEvent
+
+# Buckets per doubling of the latency, keeping every bucket within 4.5% of its lower bound
+SUB_BUCKETS = 16
+
+# Shortest latency told apart from zero, in seconds
+MIN_LATENCY = 1e-6
+
+# Quantiles exported to Prometheus
+EXPORTED_QUANTILES = [0.5, 0.9, 0.99]
+
+
+class LatencyHistogram:
+    """Counts latencies in logarithmic buckets, in the manner of an HDR histogram.
+
+    Quantiles are accurate to a few percent from microseconds to hours, while
+    taking a fixed amount of memory no matter how many latencies are recorded.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self._buckets: Dict[int, int] = {}
+
+    def record(self, latency: float):
+        bucket = math.floor(math.log2(max(latency, MIN_LATENCY)) * SUB_BUCKETS)
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.sum += latency
+        self.min = min(self.min, latency)
+        self.max = max(self.max, latency)
+
+    def quantile(self, quantile: float) -> float:
+        """Returns the latency in seconds which the given share of the latencies don't exceed"""
+        if not self.count:
+            return 0.0
+
+        rank = max(math.ceil(quantile * self.count), 1)
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                # The upper bound of the bucket, but never beyond the latencies seen
+                return min(max(2 ** ((bucket + 1) / SUB_BUCKETS), self.min), self.max)
+        return self.max
+
+
+class EndpointMetrics:
+    """The metrics of the requests made to a single route of a product API.
+
+    #### Public Attributes:
+        requests (int): Number of requests made.
+        retries (int): Number of times the requests were retried.
+        statuses (dict): Number of requests by response status, "error" if no response was received.
+        latency (LatencyHistogram): Latencies of the requests in seconds, including retries.
+    """
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.retries = 0
+        self.statuses: Dict[str, int] = {}
+        self.latency = LatencyHistogram()
+
+    @property
+    def errors(self) -> int:
+        """Number of requests which received no response or an error status"""
+        return sum(
+            count for status, count in self.statuses.items()
+            if status == "error" or int(status) >= 400
+        )
+
+
+class MetricsRegistry:
+    """Collects the counters and latencies of the requests of a client, by product and route.
+
+    Metrics are keyed as "product:METHOD /route", such as "slice:GET /slices/{id}",
+    where resource IDs in the route are replaced by `{id}`.
+
+    #### Example:
+        ```python
+        metrics = MetricsRegistry()
+        client = NetworkAsCodeClient(token="<token>", metrics=metrics)
+        ...
+        print(metrics.get("location_retrieve:POST /retrieve").latency.quantile(0.99))
+        print(metrics.to_prometheus())
+        ```
+    """
+
+    def __init__(self) -> None:
+        self._endpoints: Dict[Tuple[str, str, str], EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def record(self, event: RequestEvent):
+        """Records a completed request, usable as a request hook of a client"""
+        key = (event.product, event.method, event.route)
+        status = "error" if event.status_code is None else str(event.status_code)
+        with self._lock:
+            metrics = self._endpoints.get(key)
+            if metrics is None:
+                metrics = self._endpoints[key] = EndpointMetrics()
+            metrics.requests += 1
+            metrics.retries += event.retries
+            metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+            metrics.latency.record(event.duration)
+
+    def get(self, key: str) -> EndpointMetrics:
+        """Returns the metrics of a "product:METHOD /route" key, empty if nothing was recorded"""
+        with self._lock:
+            for (product, method, route), metrics in self._endpoints.items():
+                if f"{product}:{method} {route}" == key:
+                    return metrics
+        return EndpointMetrics()
+
+    def keys(self) -> List[str]:
+        """Returns the "product:METHOD /route" keys with recorded metrics"""
+        with self._lock:
+            return [f"{product}:{method} {route}" for product, method, route in self._endpoints]
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+    def to_prometheus(self) -> str:
+        """Returns the metrics in the Prometheus text exposition format.
+
+        Latencies are exported as a summary with the 50th, 90th and 99th percentiles.
+        """
+        requests = [
+            "# HELP network_as_code_requests_total Requests made to the Network as Code API.",
+            "# TYPE network_as_code_requests_total counter",
+        ]
+        retries = [
+            "# HELP network_as_code_request_retries_total Retries of requests to the Network as Code API.",
+            "# TYPE network_as_code_request_retries_total counter",
+        ]
+        latency = [
+            "# HELP network_as_code_request_duration_seconds Duration of requests, including retries.",
+            "# TYPE network_as_code_request_duration_seconds summary",
+        ]
+
+        with self._lock:
+            for (product, method, route), metrics in sorted(self._endpoints.items()):
+                labels = f'product="{escape(product)}",method="{method}",route="{escape(route)}"'
+                for status, count in sorted(metrics.statuses.items()):
+                    requests.append(f'network_as_code_requests_total{{{labels},status="{status}"}} {count}')
+                retries.append(f"network_as_code_request_retries_total{{{labels}}} {metrics.retries}")
+                for quantile in EXPORTED_QUANTILES:
+                    latency.append(
+                        f'network_as_code_request_duration_seconds{{{labels},quantile="{quantile}"}} '
+                        f"{metrics.latency.quantile(quantile):.6g}"
+                    )
+                latency.append(f"network_as_code_request_duration_seconds_sum{{{labels}}} {metrics.latency.sum:.6g}")
+                latency.append(f"network_as_code_request_duration_seconds_count{{{labels}}} {metrics.latency.count}")
+
+        return "\n".join(requests + retries + latency) + "\n"
+
+
+def escape(label_value: str) -> str:
+    """Escapes a label value for the Prometheus text format"""
+    return label_value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
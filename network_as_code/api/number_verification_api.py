@@ -13,12 +13,22 @@
 # limitations under the License.
 
 
-from network_as_code.api.utils import httpx_client
+from typing import Optional
+
+import httpx
+
+from network_as_code.api.utils import httpx_client, async_httpx_client
 from ..errors import error_handler
 
 class NumberVerificationAPI:
-    def __init__(self, base_url: str, rapid_key: str, rapid_host: str):
-        self.client = httpx_client(base_url, rapid_key, rapid_host)
+    def __init__(
+        self,
+        base_url: str,
+        rapid_key: str,
+        rapid_host: str,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        self.client = httpx_client(base_url, rapid_key, rapid_host, transport)
 
     def verify_number(self, payload: dict, headers: dict) -> bool:
 
@@ -34,4 +44,31 @@ class NumberVerificationAPI:
 
         error_handler(response)
 
-        return response.json()["devicePhoneNumber"]
\ No newline at end of file
+        return response.json()["devicePhoneNumber"]
+
+
+class AsyncNumberVerificationAPI:
+    def __init__(
+        self,
+        base_url: str,
+        rapid_key: str,
+        rapid_host: str,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.client = async_httpx_client(base_url, rapid_key, rapid_host, transport)
+
+    async def verify_number(self, payload: dict, headers: dict) -> bool:
+
+        response = await self.client.post(url="/verify", json=payload, headers=headers)
+
+        error_handler(response)
+
+        return bool(response.json()["devicePhoneNumberVerified"])
+
+    async def get_phone_number(self, headers:dict) -> str:
+
+        response = await self.client.get(url="/device-phone-number", headers=headers)
+
+        error_handler(response)
+
+        return response.json()["devicePhoneNumber"]
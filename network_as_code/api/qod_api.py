@@ -12,27 +12,74 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Union, List, Any
-from .utils import httpx_client
+from typing import Union, List, Any, Optional
+
+import httpx
+
+from .utils import httpx_client, async_httpx_client
 
 
 from .. import errors
 
 
+def build_session_resource(
+    device,
+    profile,
+    duration,
+    service_ipv4,
+    service_ipv6=None,
+    device_ports: Union[None, Any] = None,
+    service_ports: Union[None, Any] = None,
+    notification_url=None,
+    notification_auth_token=None,
+) -> dict:
+    """Builds the request body for the create session endpoint"""
+    session_resource = {
+        "qosProfile": profile,
+        "device": device.wire_dict(),
+        "applicationServer": {"ipv4Address": service_ipv4},
+        "duration": duration
+    }
+
+    if device_ports:
+        session_resource["devicePorts"] = device_ports.model_dump(by_alias=True, exclude_none=True)
+
+    if service_ports:
+        session_resource["applicationServerPorts"] = service_ports.model_dump(by_alias=True, exclude_none=True)
+
+    if service_ipv6:
+        session_resource["applicationServer"]["ipv6Address"] = service_ipv6
+
+    if notification_url:
+        session_resource["webhook"] = { "notificationUrl": notification_url }
+
+        if notification_auth_token:
+            session_resource["webhook"]["notificationAuthToken"] = "Bearer " + notification_auth_token
+
+    return session_resource
+
+
 class QodAPI:
     """
     Qod API, that sends requests to the API via httpx calls
     """
 
-    def __init__(self, base_url: str, rapid_key: str, rapid_host: str) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        rapid_key: str,
+        rapid_host: str,
+        transport: Optional[httpx.BaseTransport] = None,
+    ) -> None:
         """Methods takes rapid_host, rapid_key, and base_url. Then initialized the httpx client
 
         Args:
             rapid_host (str): RapidAPI Host
             rapid_key (str): RapidAPI Key
             base_url (str): URL for the httpx client
+            transport (optional): Connection pool shared with the other API clients
         """
-        self.client = httpx_client(base_url, rapid_key, rapid_host)
+        self.client = httpx_client(base_url, rapid_key, rapid_host, transport)
 
     def create_session(
         self,
@@ -62,27 +109,17 @@ class QodAPI:
         Returns:
             Session: response of the endpoint, ideally a Session
         """
-        session_resource = {
-            "qosProfile": profile,
-            "device": device.model_dump(mode='json', by_alias=True, exclude_none=True),
-            "applicationServer": {"ipv4Address": service_ipv4},
-            "duration": duration
-        }
-
-        if device_ports:
-            session_resource["devicePorts"] = device_ports.model_dump(by_alias=True, exclude_none=True)
-
-        if service_ports:
-            session_resource["applicationServerPorts"] = service_ports.model_dump(by_alias=True, exclude_none=True)
-
-        if service_ipv6:
-            session_resource["applicationServer"]["ipv6Address"] = service_ipv6
-
-        if notification_url:
-            session_resource["webhook"] = { "notificationUrl": notification_url }
-
-            if notification_auth_token:
-                session_resource["webhook"]["notificationAuthToken"] = "Bearer " + notification_auth_token
+        session_resource = build_session_resource(
+            device=device,
+            profile=profile,
+            duration=duration,
+            service_ipv4=service_ipv4,
+            service_ipv6=service_ipv6,
+            device_ports=device_ports,
+            service_ports=service_ports,
+            notification_url=notification_url,
+            notification_auth_token=notification_auth_token,
+        )
 
         response = self.client.post(url="/sessions", json=session_resource)
         errors.error_handler(response)
@@ -99,7 +136,7 @@ class QodAPI:
             list: returns list of session
         """
         response = self.client.post(url="/retrieve-sessions", json = {
-            "device": device.model_dump(mode='json', by_alias=True, exclude_none=True)
+            "device": device.wire_dict()
         })
 
         errors.error_handler(response)
@@ -149,4 +186,90 @@ class QodAPI:
         errors.error_handler(response)
 
         return response
-    
\ No newline at end of file
+
+
+class AsyncQodAPI:
+    """
+    Qod API, that sends requests to the API via httpx async calls
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        rapid_key: str,
+        rapid_host: str,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.client = async_httpx_client(base_url, rapid_key, rapid_host, transport)
+
+    async def create_session(
+        self,
+        device,
+        profile,
+        duration,
+        service_ipv4,
+        service_ipv6=None,
+        device_ports: Union[None, Any] = None,
+        service_ports: Union[None, Any] = None,
+        notification_url=None,
+        notification_auth_token=None,
+    ):
+        """Function that hits the create session endpoint with the data
+
+        Returns:
+            Session: response of the endpoint, ideally a Session
+        """
+        session_resource = build_session_resource(
+            device=device,
+            profile=profile,
+            duration=duration,
+            service_ipv4=service_ipv4,
+            service_ipv6=service_ipv6,
+            device_ports=device_ports,
+            service_ports=service_ports,
+            notification_url=notification_url,
+            notification_auth_token=notification_auth_token,
+        )
+
+        response = await self.client.post(url="/sessions", json=session_resource)
+        errors.error_handler(response)
+
+        return response
+
+    async def get_all_sessions(self, device) -> list:
+        """This function retrieves all sessions given a device"""
+        response = await self.client.post(url="/retrieve-sessions", json = {
+            "device": device.wire_dict()
+        })
+
+        errors.error_handler(response)
+
+        session_list: List[dict] = response.json()
+
+        return session_list
+
+    async def get_session(self, session_id: str):
+        """Returns a session given session ID"""
+        response = await self.client.get(url=f"/sessions/{session_id}")
+
+        errors.error_handler(response)
+
+        return response
+
+    async def delete_session(self, id: str):
+        """Deletes a session given session ID"""
+        response = await self.client.delete(url=f"/sessions/{id}")
+
+        errors.error_handler(response)
+
+        return response
+
+    async def extend_session(self, id: str, additional_duration: int):
+        """Extends a session given session ID"""
+        response = await self.client.post(url=f"/sessions/{id}/extend", json={
+            "requestedAdditionalDuration": additional_duration
+        })
+
+        errors.error_handler(response)
+
+        return response
@@ -0,0 +1,108 @@
+# Copyright 2023 Nokia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """A token bucket allowing `rate` requests per second on average,
+    with bursts of up to `burst` requests.
+
+    Callers reserve a token up front and wait until it is due, so waiting
+    callers are served in order and the lock is never held while sleeping.
+    The bucket can be shared by threads and asyncio tasks alike.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst else max(rate, 1.0)
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token, returning how many seconds to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+
+class RateLimiter:
+    """Keeps the requests of a client under the quota of the API.
+
+    ### Args:
+        rate (float): Requests per second allowed over all products, unlimited if not given.
+        burst (float): Requests allowed at once over all products, `rate` by default.
+        product_rates (Dict[str, float]): Requests per second allowed for single products,
+        by product name such as "qos" or "location_retrieve".
+
+    Raises `ValueError` if `product_rates` names an unknown product.
+
+    The same limiter can be shared by several clients, both sync and async,
+    to keep them all under one quota.
+
+    #### Example:
+        ```python
+        limiter = RateLimiter(rate=50, product_rates={"location_retrieve": 10})
+        client = NetworkAsCodeClient(token, rate_limiter=limiter)
+        ```
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        product_rates: Optional[Dict[str, float]] = None,
+    ):
+        # Imported here since the client module builds on this one
+        from .client import PRODUCT_URLS  # pylint: disable=import-outside-toplevel
+
+        product_rates = product_rates or {}
+        unknown = set(product_rates) - set(PRODUCT_URLS) - {"token"}
+        if unknown:
+            raise ValueError(f"Unknown products in product_rates: {', '.join(sorted(unknown))}")
+
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.product_buckets = {
+            product: TokenBucket(product_rate)
+            for product, product_rate in product_rates.items()
+        }
+
+    def reserve(self, product: str) -> float:
+        """Take a token from the global and product buckets, returning the wait in seconds"""
+        delay = self.bucket.reserve() if self.bucket else 0.0
+        product_bucket = self.product_buckets.get(product)
+        if product_bucket:
+            delay = max(delay, product_bucket.reserve())
+        return delay
+
+    def acquire(self, product: str):
+        """Block until a request to the product is allowed"""
+        delay = self.reserve(product)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, product: str):
+        """Wait until a request to the product is allowed"""
+        delay = self.reserve(product)
+        if delay > 0:
+            await asyncio.sleep(delay)
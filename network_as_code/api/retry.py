@@ -0,0 +1,159 @@
+# Copyright 2023 Nokia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Collection, Optional
+
+import httpx
+
+from .backoff import backoff_delay
+
+# Methods which can be repeated without changing the result on the server
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Gateway and throttling statuses which are usually gone on a second try
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+
+# Errors raised before the request reached the server, safe to retry for any method
+UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class RetryBudget:
+    """Limits retries to a share of the requests made, so that an outage
+    doesn't multiply the load on the API.
+
+    Every request deposits `ratio` of a retry and every retry withdraws one.
+    `min_retries` are available on top of that, for clients which only make
+    a few requests.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self._balance = float(min_retries)
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            # Cap the savings so a long quiet period can't fund a retry storm
+            self._balance = min(self._balance + self.ratio, self.min_retries + 100 * self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class RetryPolicy:
+    """Decides which failed requests are retried and how long to wait before retrying.
+
+    ### Args:
+        max_retries (int): Maximum number of retries of a single request.
+        backoff (float): Delay in seconds before the first retry, doubled on every retry.
+        max_backoff (float): Longest delay between retries in seconds.
+        max_retry_after (float): Longest `Retry-After` delay honoured, in seconds.
+        A response asking to wait longer is returned to the caller.
+        statuses (Collection[int]): Response statuses which are retried.
+        methods (Collection[str]): HTTP methods which are retried after a response
+        or a timeout. Connection failures are retried for every method, since the
+        request never reached the server.
+        budget (RetryBudget): Shared limit for the retries of a client.
+
+    #### Example:
+        ```python
+        client = NetworkAsCodeClient(token, retry=RetryPolicy(max_retries=5))
+        ```
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        max_retry_after: float = 60.0,
+        statuses: Collection[int] = RETRYABLE_STATUSES,
+        methods: Collection[str] = IDEMPOTENT_METHODS,
+        budget: Optional[RetryBudget] = None,
+    ):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.budget = budget if budget else RetryBudget()
+
+    def retry_delay(
+        self,
+        request: httpx.Request,
+        attempt: int,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """Returns the delay before retrying the given attempt, counting from zero,
+        or None if the request should not be retried"""
+        if attempt >= self.max_retries or not self._retryable(request, response, error):
+            return None
+
+        delay = backoff_delay(attempt, self.backoff, self.max_backoff)
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                if retry_after > self.max_retry_after:
+                    return None
+                delay = retry_after
+
+        if not self.budget.withdraw():
+            return None
+
+        return delay
+
+    def _retryable(
+        self, request: httpx.Request, response: Optional[httpx.Response], error: Optional[Exception]
+    ) -> bool:
+        if error is not None:
+            return isinstance(error, UNSENT_ERRORS) or (
+                isinstance(error, httpx.TransportError) and request.method in self.methods
+            )
+
+        if response is None or response.status_code not in self.statuses:
+            return False
+
+        # A throttled request was rejected before it was processed
+        return response.status_code == 429 or request.method in self.methods
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Returns the delay in seconds asked for by a `Retry-After` header"""
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -15,14 +15,33 @@
 
 from typing import Optional, Any
 
-from network_as_code.api.utils import httpx_client
+import httpx
+
+from network_as_code.api.utils import httpx_client, async_httpx_client
 
 from ..errors import error_handler
 
 
+def build_check_body(phone_number: str, max_age: Optional[int]) -> dict:
+    body: dict[str, Any] = {
+        "phoneNumber": phone_number,
+    }
+
+    if max_age:
+        body["maxAge"] = max_age
+
+    return body
+
+
 class SimSwapAPI:
-    def __init__(self, base_url: str, rapid_key: str, rapid_host: str):
-        self.client = httpx_client(base_url, rapid_key, rapid_host)
+    def __init__(
+        self,
+        base_url: str,
+        rapid_key: str,
+        rapid_host: str,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        self.client = httpx_client(base_url, rapid_key, rapid_host, transport)
 
     def fetch_sim_swap_date(self, phone_number):
         body = {"phoneNumber": phone_number}
@@ -34,15 +53,39 @@ class SimSwapAPI:
         return response.json()
 
     def verify_sim_swap(self, phone_number: str, max_age: Optional[int]) -> bool:
-        body: dict[str, Any] = {
-            "phoneNumber": phone_number,
-        }
-
-        if max_age:
-            body["maxAge"] = max_age
+        body = build_check_body(phone_number, max_age)
 
         response = self.client.post(url="/check", json=body)
 
         error_handler(response)
 
         return bool(response.json()['swapped'])
+
+
+class AsyncSimSwapAPI:
+    def __init__(
+        self,
+        base_url: str,
+        rapid_key: str,
+        rapid_host: str,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.client = async_httpx_client(base_url, rapid_key, rapid_host, transport)
+
+    async def fetch_sim_swap_date(self, phone_number):
+        body = {"phoneNumber": phone_number}
+
+        response = await self.client.post(url="/retrieve-date", json=body)
+
+        error_handler(response)
+
+        return response.json()
+
+    async def verify_sim_swap(self, phone_number: str, max_age: Optional[int]) -> bool:
+        body = build_check_body(phone_number, max_age)
+
+        response = await self.client.post(url="/check", json=body)
+
+        error_handler(response)
+
+        return bool(response.json()['swapped'])
@@ -14,10 +14,11 @@
 
 from typing import Union, Optional, Any
 
+import httpx
 from pydantic import BaseModel
 
 from ..errors import InvalidParameter, error_handler
-from .utils import delete_none, httpx_client
+from .utils import delete_none, httpx_client, async_httpx_client
 
 
 class Throughput(BaseModel):
@@ -33,9 +34,103 @@ class Throughput(BaseModel):
     maximum: Optional[float] = None
 
 
+def area_of_service_to_dict(area_of_service) -> dict:
+    """Converts an area of service object to its API representation"""
+    polygons = []
+
+    for point in area_of_service.polygon:
+        polygons.append({"lat": point.latitude, "lon": point.longitude})
+
+    return {"polygon": polygons}
+
+
+def build_slice_body(
+    network_id,
+    slice_info,
+    notification_url,
+    name: Optional[str] = None,
+    notification_auth_token: Optional[str] = None,
+    area_of_service: Optional[Any] = None,
+    slice_downlink_throughput: Optional[Throughput] = None,
+    slice_uplink_throughput: Optional[Throughput] = None,
+    device_downlink_throughput: Optional[Throughput] = None,
+    device_uplink_throughput: Optional[Throughput] = None,
+    max_data_connections: Optional[int] = None,
+    max_devices: Optional[int] = None,
+) -> dict:
+    """Builds the request body for the create slice endpoint"""
+    body = {
+        "networkIdentifier": dict(network_id),
+        "sliceInfo": slice_info.model_dump(mode='json', by_alias=True, exclude_none=True),
+        "notificationUrl": notification_url,
+    }
+
+    if name:
+        body["name"] = name
+
+    if area_of_service:
+        body["areaOfService"] = area_of_service_to_dict(area_of_service)
+
+    if notification_auth_token:
+        body["notificationAuthToken"] = notification_auth_token
+
+    if max_data_connections:
+        body["maxDataConnections"] = max_data_connections
+
+    if max_devices:
+        body["maxDevices"] = max_devices
+
+    if slice_downlink_throughput:
+        body["sliceDownlinkThroughput"] = slice_downlink_throughput.model_dump(mode='json')
+
+    if slice_uplink_throughput:
+        body["sliceUplinkThroughput"] = slice_uplink_throughput.model_dump(mode='json')
+
+    if device_uplink_throughput:
+        body["deviceUplinkThroughput"] = device_uplink_throughput.model_dump(mode='json')
+
+    if device_downlink_throughput:
+        body["deviceDownlinkThroughput"] = device_downlink_throughput.model_dump(mode='json')
+
+    return body
+
+
+def build_attach_payload(
+    device,
+    customer,
+    slice_id: str,
+    traffic_categories: Union[Any, None],
+    notification_url: Union[str, None],
+    notification_auth_token: Union[str, None],
+) -> dict:
+    """Builds the request body for the create attachment endpoint"""
+    if device.phone_number is None:
+        raise InvalidParameter("Device phone number is required.")
+    payload = {
+        "sliceId": slice_id,
+        "device": device.wire_dict()
+    }
+    if customer:
+        payload['customer'] = customer.model_dump(mode='json', by_alias=True, exclude_none=True)
+    if traffic_categories:
+        payload['traffic_categories'] = {"apps": traffic_categories.apps.__dict__}
+    if notification_url:
+        payload['webhook'] = {}
+        payload['webhook']['notificationUrl'] = notification_url
+        payload['webhook']['notificationAuthToken'] = notification_auth_token
+
+    return delete_none(payload)
+
+
 class SliceAPI:
-    def __init__(self, base_url: str, rapid_key: str, rapid_host: str) -> None:
-        self.client = httpx_client(base_url, rapid_key, rapid_host)
+    def __init__(
+        self,
+        base_url: str,
+        rapid_key: str,
+        rapid_host: str,
+        transport: Optional[httpx.BaseTransport] = None,
+    ) -> None:
+        self.client = httpx_client(base_url, rapid_key, rapid_host, transport)
 
     def create(
         self,
@@ -52,38 +147,20 @@ class SliceAPI:
         max_data_connections: Optional[int] = None,
         max_devices: Optional[int] = None,
     ):
-        body = {
-            "networkIdentifier": dict(network_id),
-            "sliceInfo": slice_info.model_dump(mode='json', by_alias=True, exclude_none=True),
-            "notificationUrl": notification_url,
-        }
-
-        if name:
-            body["name"] = name
-
-        if area_of_service:
-            body["areaOfService"] = self.convert_area_of_service_obj(area_of_service)
-
-        if notification_auth_token:
-            body["notificationAuthToken"] = notification_auth_token
-
-        if max_data_connections:
-            body["maxDataConnections"] = max_data_connections
-
-        if max_devices:
-            body["maxDevices"] = max_devices
-
-        if slice_downlink_throughput:
-            body["sliceDownlinkThroughput"] = slice_downlink_throughput.model_dump(mode='json')
-
-        if slice_uplink_throughput:
-            body["sliceUplinkThroughput"] = slice_uplink_throughput.model_dump(mode='json')
-
-        if device_uplink_throughput:
-            body["deviceUplinkThroughput"] = device_uplink_throughput.model_dump(mode='json')
-
-        if device_downlink_throughput:
-            body["deviceDownlinkThroughput"] = device_downlink_throughput.model_dump(mode='json')
+        body = build_slice_body(
+            network_id,
+            slice_info,
+            notification_url,
+            name,
+            notification_auth_token,
+            area_of_service,
+            slice_downlink_throughput,
+            slice_uplink_throughput,
+            device_downlink_throughput,
+            device_uplink_throughput,
+            max_data_connections,
+            max_devices,
+        )
 
         response = self.client.post(url="/slices", json=body)
 
@@ -133,17 +210,18 @@ class SliceAPI:
         return res
 
     def convert_area_of_service_obj(self, area_of_service):
-        polygons = []
-
-        for point in area_of_service.polygon:
-            polygons.append({"lat": point.latitude, "lon": point.longitude})
-
-        return {"polygon": polygons}
+        return area_of_service_to_dict(area_of_service)
 
 
 class AttachAPI:
-    def __init__(self, base_url: str, rapid_key: str, rapid_host: str) -> None:
-        self.client = httpx_client(base_url, rapid_key, rapid_host)
+    def __init__(
+        self,
+        base_url: str,
+        rapid_key: str,
+        rapid_host: str,
+        transport: Optional[httpx.BaseTransport] = None,
+    ) -> None:
+        self.client = httpx_client(base_url, rapid_key, rapid_host, transport)
 
     def attach(
         self,
@@ -154,24 +232,18 @@ class AttachAPI:
         notification_url: Union[str, None],
         notification_auth_token: Union[str, None],
     ):
-        if device.phone_number is None:
-            raise InvalidParameter("Device phone number is required.")
-        payload = {
-            "sliceId": slice_id,
-            "device": device.model_dump(mode='json', by_alias=True, exclude_none=True)
-        }
-        if customer:
-            payload['customer'] = customer.model_dump(mode='json', by_alias=True, exclude_none=True)
-        if traffic_categories:
-            payload['traffic_categories'] = {"apps": traffic_categories.apps.__dict__}
-        if notification_url:
-            payload['webhook'] = {}
-            payload['webhook']['notificationUrl'] = notification_url
-            payload['webhook']['notificationAuthToken'] = notification_auth_token
+        payload = build_attach_payload(
+            device,
+            customer,
+            slice_id,
+            traffic_categories,
+            notification_url,
+            notification_auth_token,
+        )
 
         res = self.client.post(
             url="/attachments",
-            json=delete_none(payload),
+            json=payload,
         )
 
         error_handler(res)
@@ -196,3 +268,133 @@ class AttachAPI:
     def detach(self, id):
         res = self.client.delete(url=f"/attachments/{id}")
         error_handler(res)
+
+
+class AsyncSliceAPI:
+    def __init__(
+        self,
+        base_url: str,
+        rapid_key: str,
+        rapid_host: str,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.client = async_httpx_client(base_url, rapid_key, rapid_host, transport)
+
+    async def create(
+        self,
+        network_id,
+        slice_info,
+        notification_url,
+        name: Optional[str] = None,
+        notification_auth_token: Optional[str] = None,
+        area_of_service: Optional[Any] = None,
+        slice_downlink_throughput: Optional[Throughput] = None,
+        slice_uplink_throughput: Optional[Throughput] = None,
+        device_downlink_throughput: Optional[Throughput] = None,
+        device_uplink_throughput: Optional[Throughput] = None,
+        max_data_connections: Optional[int] = None,
+        max_devices: Optional[int] = None,
+    ):
+        body = build_slice_body(
+            network_id,
+            slice_info,
+            notification_url,
+            name,
+            notification_auth_token,
+            area_of_service,
+            slice_downlink_throughput,
+            slice_uplink_throughput,
+            device_downlink_throughput,
+            device_uplink_throughput,
+            max_data_connections,
+            max_devices,
+        )
+
+        response = await self.client.post(url="/slices", json=body)
+
+        error_handler(response)
+
+        return response
+
+    async def get_all(self):
+        res = await self.client.get(url="/slices")
+
+        error_handler(res)
+
+        return res
+
+    async def get(self, slice_id: str):
+        res = await self.client.get(url=f"/slices/{slice_id}")
+
+        error_handler(res)
+
+        return res
+
+    async def activate(self, slice_id: str):
+        res = await self.client.post(url=f"/slices/{slice_id}/activate")
+
+        error_handler(res)
+
+        return res
+
+    async def deactivate(self, slice_id: str):
+        return await self.client.post(url=f"/slices/{slice_id}/deactivate")
+
+    async def delete(self, slice_id: str):
+        res = await self.client.delete(url=f"/slices/{slice_id}")
+
+        error_handler(res)
+
+        return res
+
+
+class AsyncAttachAPI:
+    def __init__(
+        self,
+        base_url: str,
+        rapid_key: str,
+        rapid_host: str,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.client = async_httpx_client(base_url, rapid_key, rapid_host, transport)
+
+    async def attach(
+        self,
+        device,
+        customer,
+        slice_id: str,
+        traffic_categories: Union[Any, None],
+        notification_url: Union[str, None],
+        notification_auth_token: Union[str, None],
+    ):
+        payload = build_attach_payload(
+            device,
+            customer,
+            slice_id,
+            traffic_categories,
+            notification_url,
+            notification_auth_token,
+        )
+
+        res = await self.client.post(url="/attachments", json=payload)
+
+        error_handler(res)
+        return res
+
+    async def get_attachments(self):
+        res = await self.client.get(url="/attachments")
+
+        error_handler(res)
+
+        return res
+
+    async def get(self, id: str):
+        res = await self.client.get(url=f"/attachments/{id}")
+
+        error_handler(res)
+
+        return res
+
+    async def detach(self, id):
+        res = await self.client.delete(url=f"/attachments/{id}")
+        error_handler(res)
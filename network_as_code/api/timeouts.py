@@ -0,0 +1,54 @@
+# Copyright 2023 Nokia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Union
+
+import httpx
+
+# A single number sets the connect, read, write and pool timeouts alike
+TimeoutTypes = Union[float, httpx.Timeout]
+
+DEFAULT_TIMEOUT = httpx.Timeout(30.0)
+
+_call_timeout: ContextVar[Optional[httpx.Timeout]] = ContextVar("call_timeout", default=None)
+
+
+@contextmanager
+def request_timeout(timeout: TimeoutTypes) -> Iterator[httpx.Timeout]:
+    """Override the timeouts of the requests sent within the block.
+
+    Takes precedence over the timeouts configured on the client, so that a
+    latency-sensitive call can fail fast without reconfiguring the client.
+    The override follows the calling thread or asyncio task, including the
+    bulk operations started from it.
+
+    #### Example:
+        ```python
+        with request_timeout(httpx.Timeout(2.0, connect=0.5)):
+            status = device.get_connectivity()
+        ```
+    """
+    value = httpx.Timeout(timeout)
+    token = _call_timeout.set(value)
+    try:
+        yield value
+    finally:
+        _call_timeout.reset(token)
+
+
+def call_timeout() -> Optional[httpx.Timeout]:
+    """Returns the timeout set with `request_timeout`, if any"""
+    return _call_timeout.get()
@@ -0,0 +1,45 @@
+# Copyright 2025 Nokia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Optional
+
+import httpx
+
+from network_as_code.api.timeouts import DEFAULT_TIMEOUT
+from network_as_code.api.utils import tokenizer, async_tokenizer
+
+
+class TokenAPI:
+    """Exchanges authorization codes at the token endpoint of the operator.
+
+    The token endpoint is given per call, since it is discovered from the
+    OpenID configuration. Requests share the connection pool of the SDK
+    instead of opening a new connection for every exchange.
+    """
+
+    def __init__(self, transport: Optional[httpx.BaseTransport] = None):
+        self.client = httpx.Client(timeout=DEFAULT_TIMEOUT, transport=transport)
+
+    def fetch_token(self, token_endpoint: str, data: dict):
+        return tokenizer(token_endpoint, data, self.client)
+
+
+class AsyncTokenAPI:
+    """Exchanges authorization codes at the token endpoint of the operator over asyncio."""
+
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.client = httpx.AsyncClient(timeout=DEFAULT_TIMEOUT, transport=transport)
+
+    async def fetch_token(self, token_endpoint: str, data: dict):
+        return await async_tokenizer(token_endpoint, data, self.client)
@@ -0,0 +1,296 @@
+# Copyright 2023 Nokia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+import urllib.request
+from datetime import timedelta
+from typing import Dict, Optional, Tuple, TypeVar
+
+import httpx
+
+from .circuit_breaker import CircuitBreaker
+from .codec import codec_response, traced_response
+from .instrumentation import Instrumentation, RequestTrace
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .timeouts import call_timeout
+
+T = TypeVar("T")
+
+
+class ProductPolicies:
+    """The client policies applied to the requests of a single product API.
+
+    ### Args:
+        product (str): Name of the product API, such as "location_retrieve".
+        retry (RetryPolicy): Policy for retrying failed requests, none if not given.
+        rate_limiter (RateLimiter): Limiter the requests wait on, unlimited if not given.
+        circuit_breaker (CircuitBreaker): Breaker failing requests fast while the product is failing.
+        timeout (httpx.Timeout): Timeouts of the requests, those of the HTTPX client if not given.
+        instrumentation (Instrumentation): Reports the completed requests, if given.
+    """
+
+    def __init__(
+        self,
+        product: str,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        timeout: Optional[httpx.Timeout] = None,
+        instrumentation: Optional[Instrumentation] = None,
+    ):
+        self.product = product
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.timeout = timeout
+        self.instrumentation = instrumentation
+
+    def start(self, request: httpx.Request) -> Optional[RequestTrace]:
+        """Called once per request, before its first attempt.
+
+        Returns the trace of the request if the client is instrumented.
+        """
+        timeout = call_timeout() or self.timeout
+        if timeout is not None:
+            request.extensions["timeout"] = timeout.as_dict()
+        if self.retry:
+            self.retry.budget.deposit()
+        if self.instrumentation:
+            return self.instrumentation.start(self.product, request)
+        return None
+
+    def before_attempt(self) -> bool:
+        """Called before sending every attempt, raises `CircuitOpenError` to fail fast"""
+        if self.circuit_breaker:
+            return self.circuit_breaker.before_request()
+        return False
+
+    def after_attempt(self, probe: bool, started: float, response: Optional[httpx.Response] = None):
+        """Called after every attempt, without a response if it failed to complete"""
+        if self.circuit_breaker:
+            self.circuit_breaker.record(probe, time.monotonic() - started, response)
+
+    def abandon_attempt(self, probe: bool):
+        """Called instead of `after_attempt` for attempts interrupted by cancellation or unexpected errors"""
+        if self.circuit_breaker:
+            self.circuit_breaker.release(probe)
+
+    def retry_delay(
+        self,
+        request: httpx.Request,
+        attempt: int,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        if self.retry is None:
+            return None
+        return self.retry.retry_delay(request, attempt, response, error)
+
+
+class ProductTransport(httpx.BaseTransport):
+    """The transport of a single product API.
+
+    Requests are sent through the connection pool shared by every product,
+    applying the policies configured on the client on the way.
+
+    ### Args:
+        pool (httpx.BaseTransport): The shared transport actually sending requests.
+        policies (ProductPolicies): Policies of the product.
+    """
+
+    def __init__(self, pool: httpx.BaseTransport, policies: ProductPolicies):
+        self.pool = pool
+        self.policies = policies
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        trace = self.policies.start(request)
+        if trace is None:
+            return codec_response(self._send(request))
+
+        try:
+            response = traced_response(self._send(request, trace), trace)
+            # Read here rather than by the client, for the trace to cover decoding it
+            response.read()
+        except BaseException as error:
+            trace.failed(error)
+            raise
+        response.elapsed = timedelta(seconds=time.perf_counter() - trace.started)
+        trace.received(response)
+        return response
+
+    def _send(self, request: httpx.Request, trace: Optional[RequestTrace] = None) -> httpx.Response:
+        policies = self.policies
+        attempt = 0
+        while True:
+            if policies.rate_limiter:
+                policies.rate_limiter.acquire(policies.product)
+
+            probe = policies.before_attempt()
+            if trace:
+                trace.attempts += 1
+            started = time.monotonic()
+            try:
+                response = self.pool.handle_request(request)
+            except httpx.TransportError as error:
+                policies.after_attempt(probe, started)
+                delay = policies.retry_delay(request, attempt, error=error)
+                if delay is None:
+                    raise
+            except BaseException:
+                policies.abandon_attempt(probe)
+                raise
+            else:
+                policies.after_attempt(probe, started, response)
+                delay = policies.retry_delay(request, attempt, response=response)
+                if delay is None:
+                    return response
+                response.close()
+
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        # The shared pool is closed by the client owning it
+        pass
+
+
+class AsyncProductTransport(httpx.AsyncBaseTransport):
+    """The transport of a single product API over asyncio.
+
+    Takes the same arguments as `ProductTransport`.
+    """
+
+    def __init__(self, pool: httpx.AsyncBaseTransport, policies: ProductPolicies):
+        self.pool = pool
+        self.policies = policies
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        trace = self.policies.start(request)
+        if trace is None:
+            return codec_response(await self._send(request))
+
+        try:
+            response = traced_response(await self._send(request, trace), trace)
+            # Read here rather than by the client, for the trace to cover decoding it
+            await response.aread()
+        except BaseException as error:
+            trace.failed(error)
+            raise
+        response.elapsed = timedelta(seconds=time.perf_counter() - trace.started)
+        trace.received(response)
+        return response
+
+    async def _send(self, request: httpx.Request, trace: Optional[RequestTrace] = None) -> httpx.Response:
+        policies = self.policies
+        attempt = 0
+        while True:
+            if policies.rate_limiter:
+                await policies.rate_limiter.acquire_async(policies.product)
+
+            probe = policies.before_attempt()
+            if trace:
+                trace.attempts += 1
+            started = time.monotonic()
+            try:
+                response = await self.pool.handle_async_request(request)
+            except httpx.TransportError as error:
+                policies.after_attempt(probe, started)
+                delay = policies.retry_delay(request, attempt, error=error)
+                if delay is None:
+                    raise
+            except BaseException:
+                # Such as the cancellation of the task by `asyncio.wait_for`
+                policies.abandon_attempt(probe)
+                raise
+            else:
+                policies.after_attempt(probe, started, response)
+                delay = policies.retry_delay(request, attempt, response=response)
+                if delay is None:
+                    return response
+                await response.aclose()
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        # The shared pool is closed by the client owning it
+        pass
+
+
+
+def proxy_for(mounts: Dict[str, T], routes: Dict[Tuple[str, str], Optional[T]], url: httpx.URL) -> Optional[T]:
+    """Returns the proxy mounted for the scheme of a URL, None if its host is excluded by `NO_PROXY`.
+
+    Proxies are mounted by scheme, "all" standing for any scheme, as `urllib.request.getproxies()`
+    returns them. Routes are memoised by scheme and host, since checking `NO_PROXY` reads the
+    environment.
+    """
+    key = (url.scheme, url.host)
+    if key not in routes:
+        proxy = mounts.get(url.scheme) or mounts.get("all")
+        routes[key] = None if proxy is None or urllib.request.proxy_bypass(url.host) else proxy
+    return routes[key]
+
+
+class ProxyRouter(httpx.BaseTransport):
+    """Sends every request through the proxy mounted for its URL, or the pool if there is none.
+
+    HTTPX ignores the proxies set in the environment once a client is given a
+    transport, so the shared pool routes requests to them itself.
+
+    ### Args:
+        pool (httpx.BaseTransport): The transport sending requests directly.
+        mounts (dict): Proxy transports by URL scheme, "all" for any scheme.
+    """
+
+    def __init__(self, pool: httpx.BaseTransport, mounts: Dict[str, httpx.BaseTransport]):
+        self.pool = pool
+        self.mounts = mounts
+        self._routes: Dict[Tuple[str, str], Optional[httpx.BaseTransport]] = {}
+
+    def transport_for(self, url: httpx.URL) -> httpx.BaseTransport:
+        return proxy_for(self.mounts, self._routes, url) or self.pool
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self.transport_for(request.url).handle_request(request)
+
+    def close(self) -> None:
+        self.pool.close()
+        for transport in self.mounts.values():
+            transport.close()
+
+
+class AsyncProxyRouter(httpx.AsyncBaseTransport):
+    """Routes requests to the proxies set in the environment over asyncio.
+
+    Takes the same arguments as `ProxyRouter`.
+    """
+
+    def __init__(self, pool: httpx.AsyncBaseTransport, mounts: Dict[str, httpx.AsyncBaseTransport]):
+        self.pool = pool
+        self.mounts = mounts
+        self._routes: Dict[Tuple[str, str], Optional[httpx.AsyncBaseTransport]] = {}
+
+    def transport_for(self, url: httpx.URL) -> httpx.AsyncBaseTransport:
+        return proxy_for(self.mounts, self._routes, url) or self.pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.transport_for(request.url).handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self.pool.aclose()
+        for transport in self.mounts.values():
+            await transport.aclose()
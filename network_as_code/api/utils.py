@@ -1,6 +1,10 @@
 
+from typing import Optional
+
 import httpx
 from ..errors import error_handler
+from .codec import AsyncCodecClient, CodecClient
+from .timeouts import DEFAULT_TIMEOUT
 
 def delete_none(_dict):
     """Delete None values recursively from all of the dictionaries"""
@@ -17,18 +21,53 @@ def delete_none(_dict):
     return _dict
 
 
-def httpx_client(base_url: str, rapid_key: str, rapid_host: str):
-    return httpx.Client(
+def rapid_headers(rapid_key: str, rapid_host: str) -> dict:
+    return {
+        "content-type": "application/json",
+        "X-RapidAPI-Key": rapid_key,
+        "X-RapidAPI-Host": rapid_host,
+    }
+
+
+def httpx_client(
+    base_url: str,
+    rapid_key: str,
+    rapid_host: str,
+    transport: Optional[httpx.BaseTransport] = None,
+):
+    return CodecClient(
         base_url=base_url,
-        timeout=30.0,
-        headers={
-                "content-type": "application/json",
-                "X-RapidAPI-Key": rapid_key,
-                "X-RapidAPI-Host": rapid_host,
-        },
+        timeout=DEFAULT_TIMEOUT,
+        headers=rapid_headers(rapid_key, rapid_host),
+        transport=transport,
     )
 
-def tokenizer(base_url: str, data: dict):
-    response = httpx.post(url=base_url, data=data)
+def async_httpx_client(
+    base_url: str,
+    rapid_key: str,
+    rapid_host: str,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+):
+    return AsyncCodecClient(
+        base_url=base_url,
+        timeout=DEFAULT_TIMEOUT,
+        headers=rapid_headers(rapid_key, rapid_host),
+        transport=transport,
+    )
+
+def tokenizer(base_url: str, data: dict, client: Optional[httpx.Client] = None):
+    if client is None:
+        response = httpx.post(url=base_url, data=data)
+    else:
+        response = client.post(url=base_url, data=data)
+    error_handler(response)
+    return response
+
+async def async_tokenizer(base_url: str, data: dict, client: Optional[httpx.AsyncClient] = None):
+    if client is None:
+        async with httpx.AsyncClient() as one_off_client:
+            response = await one_off_client.post(url=base_url, data=data)
+    else:
+        response = await client.post(url=base_url, data=data)
     error_handler(response)
     return response
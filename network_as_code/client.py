@@ -12,14 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .api import APIClient
-from .namespaces import Devices
-from .namespaces import Sessions
-from .namespaces import Slices
-from .namespaces import Connectivity
-from .namespaces import NetworkInsights
-from .namespaces import Geofencing
-from .namespaces import Authorization
+from functools import cached_property
+
+from .api import APIClient, AsyncAPIClient
+# Namespaces are imported when first used, see `namespaces/__init__.py`
+from . import namespaces
 
 class NetworkAsCodeClient:
     """A client for working with Network as Code.
@@ -35,72 +32,155 @@ class NetworkAsCodeClient:
 
     ### Args:
         token (str): Authentication token for the Network as Code API.
-        Any additional keyword arguments will be directly passed to the underlying HTTPX client.
+        Any additional keyword arguments are passed to `APIClient`, such as `limits`, `http2`,
+        `proxy`, `trust_env`, `transport`, `event_hooks` and `timeout` for tuning the HTTP connections,
+        `request_hooks`, `opentelemetry` and `metrics` for following the time spent on requests,
+        or `device_status_cache` and `location_cache` for reusing recent responses.
     """
 
     def __init__(self, token: str, **kwargs):
         self._api = APIClient(token=token, **kwargs)
-        self._devices = Devices(self._api)
-        self._sessions = Sessions(self._api)
-        self._slices = Slices(self._api)
-        self._connectivity = Connectivity(self._api)
-        self._insights = NetworkInsights(self._api)
-        self._geofencing = Geofencing(self._api)
-        self._authorization = Authorization(self._api)
     #### NAMESPACES
 
-    @property
+    @cached_property
     def devices(self):
         """Namespace containing functionalities related to deivce.
 
         Returns NAC devices 
         """
-        return self._devices
+        return namespaces.Devices(self._api)
 
-    @property
+    @cached_property
     def sessions(self):
         """Namespace containing functionalities related to mobile subscriptions.
 
         Returns NAC sessions 
         """
-        return self._sessions
+        return namespaces.Sessions(self._api)
 
-    @property
+    @cached_property
     def slices(self):
         """Namespace containing functionalities related to network slicing.
 
         Returns NAC slices
         """
-        return self._slices
+        return namespaces.Slices(self._api)
 
-    @property
+    @cached_property
     def connectivity(self):
         """Namespace containing functionalities related to device status.
 
         Returns NAC device status
         """
-        return self._connectivity
+        return namespaces.Connectivity(self._api)
 
-    @property
+    @cached_property
     def insights(self):
         """Namespace containing functionalities related to congestion insights.
 
         Returns NAC congestion insights
         """
-        return self._insights
+        return namespaces.NetworkInsights(self._api)
 
-    @property
+    @cached_property
     def geofencing(self):
         """Namespace containing functionalities related to geofencing.
 
         Returns NAC geofencing
         """
-        return self._geofencing
+        return namespaces.Geofencing(self._api)
 
-    @property
+    @cached_property
     def authorization(self):
         """Namespace containing functionalities related to authorization.
 
         Returns NAC authorization
         """
-        return self._authorization
+        return namespaces.Authorization(self._api)
+
+    @property
+    def metrics(self):
+        """The `MetricsRegistry` given to the client, None if metrics are not collected."""
+        return self._api.metrics
+
+    def close(self):
+        """Close the connections held open by the client."""
+        self._api.close()
+
+
+class AsyncNetworkAsCodeClient:
+    """An asyncio client for working with Network as Code.
+
+    Mirrors `NetworkAsCodeClient`, but every method which talks to
+    the Network as Code API is a coroutine, so that many requests
+    can be in flight at once from a single event loop.
+
+    ### Example:
+    ```python
+    from network_as_code import AsyncNetworkAsCodeClient
+
+    async with AsyncNetworkAsCodeClient(token="your_api_token") as client:
+        device = client.devices.get(phone_number="+3670123456")
+        print(await device.location())
+    ```
+
+    ### Args:
+        token (str): Authentication token for the Network as Code API.
+        Any additional keyword arguments are passed to `AsyncAPIClient`, which takes the same
+        arguments as `APIClient`, except that `transport` and `event_hooks` must be asynchronous.
+    """
+
+    def __init__(self, token: str, **kwargs):
+        self._api = AsyncAPIClient(token=token, **kwargs)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    @property
+    def metrics(self):
+        """The `MetricsRegistry` given to the client, None if metrics are not collected."""
+        return self._api.metrics
+
+    async def aclose(self):
+        """Close the connections held open by the client."""
+        await self._api.aclose()
+
+    #### NAMESPACES
+
+    @cached_property
+    def devices(self):
+        """Namespace containing functionalities related to device."""
+        return namespaces.AsyncDevices(self._api)
+
+    @cached_property
+    def sessions(self):
+        """Namespace containing functionalities related to QoD sessions."""
+        return namespaces.AsyncSessions(self._api)
+
+    @cached_property
+    def slices(self):
+        """Namespace containing functionalities related to network slicing."""
+        return namespaces.AsyncSlices(self._api)
+
+    @cached_property
+    def connectivity(self):
+        """Namespace containing functionalities related to device status."""
+        return namespaces.AsyncConnectivity(self._api)
+
+    @cached_property
+    def insights(self):
+        """Namespace containing functionalities related to congestion insights."""
+        return namespaces.AsyncNetworkInsights(self._api)
+
+    @cached_property
+    def geofencing(self):
+        """Namespace containing functionalities related to geofencing."""
+        return namespaces.AsyncGeofencing(self._api)
+
+    @cached_property
+    def authorization(self):
+        """Namespace containing functionalities related to authorization."""
+        return namespaces.AsyncAuthorization(self._api)
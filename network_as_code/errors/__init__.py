@@ -52,6 +52,11 @@ class InvalidParameter(NaCError):
     """Error for when the user input parameters are invalid"""
 
 
+class CircuitOpenError(NaCError):
+    """Error for when requests to an API product are failed fast,
+    because the product has been failing recently."""
+
+
 def parse_response(response):
     if "application/json" in response.headers.get("Content-Type", ""):
         try:
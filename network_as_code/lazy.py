@@ -0,0 +1,50 @@
+# Copyright 2023 Nokia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def import_attribute(path: str, package: str) -> Any:
+    """Import an attribute given as "module.Name", relative to the package"""
+    module, _, name = path.rpartition(".")
+    return getattr(importlib.import_module(f".{module}", package), name)
+
+
+def lazy_exports(
+    namespace: Dict[str, Any], exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Returns the module `__getattr__` and `__dir__` of a package exporting names lazily.
+
+    `exports` maps each exported name to the submodule defining it, so that
+    a submodule is only imported when one of its names is first used, and
+    importing the package stays cheap for programs using only a few products.
+    """
+    package = namespace["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = import_attribute(f"{module}.{name}", package)
+        # Later lookups find the name without calling back into this function
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted({*namespace, *exports})
+
+    return __getattr__, __dir__
@@ -12,9 +12,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .device import Device, DeviceIpv4Addr
-from .session import QoDSession
-from .location import Location
-from .slice import Slice
 
-QoDSession.model_rebuild()
+from typing import TYPE_CHECKING
+
+from ..lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .device import Device, AsyncDevice, DeviceIpv4Addr
+    from .session import QoDSession, AsyncQoDSession, QoDSessionRow, SessionResult, SessionReport
+    from .location import Location
+    from .slice import Slice, AsyncSlice, SliceRow
+
+# Submodules are imported when one of their names is first used. The session
+# models are completed by the device module, which their fields refer to.
+__getattr__, __dir__ = lazy_exports(globals(), {
+    "Device": "device",
+    "AsyncDevice": "device",
+    "DeviceIpv4Addr": "device",
+    "QoDSession": "device",
+    "AsyncQoDSession": "device",
+    "QoDSessionRow": "device",
+    "SessionResult": "device",
+    "SessionReport": "device",
+    "Location": "location",
+    "Slice": "slice",
+    "AsyncSlice": "slice",
+    "SliceRow": "slice",
+})
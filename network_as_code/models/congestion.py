@@ -12,10 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, PrivateAttr
-from network_as_code.api.client import APIClient
+from network_as_code.api.client import APIClient, AsyncAPIClient
 
 
 
@@ -35,16 +36,85 @@ class Congestion(BaseModel):
     stop: datetime
     confidence: Optional[int]
 
+    @staticmethod
+    def fields_from_json(json) -> dict:
+        """Returns the congestion fields found in a response of the low-level API."""
+        return {
+            "level": json["congestionLevel"],
+            "confidence": json.get("confidenceLevel"),
+            "start": datetime.fromisoformat(json["timeIntervalStart"]),
+            "stop": datetime.fromisoformat(json["timeIntervalStop"]),
+        }
+
     @classmethod
     def from_json(cls, json) -> "Congestion":
-        level = json["congestionLevel"]
-        confidence = json.get("confidenceLevel")
-        start = datetime.fromisoformat(json["timeIntervalStart"])
-        stop = datetime.fromisoformat(json["timeIntervalStop"])
+        return cls(**cls.fields_from_json(json))
+
+
+@dataclass(slots=True)
+class CongestionRow:
+    """
+    A congestion level listed by `Device.get_congestion(rows=True)`.
+
+    Holds the same values as a `Congestion`, without validating them.
+
+    #### Public Attributes:
+        Same as `Congestion`.
+    """
+    level: str
+    start: datetime
+    stop: datetime
+    confidence: Optional[int]
+
+    @staticmethod
+    def from_json(json) -> "CongestionRow":
+        return CongestionRow(**Congestion.fields_from_json(json))
+
+class BaseCongestionSubscription(BaseModel):
+    """
+    Fields shared by the `CongestionSubscription` and `AsyncCongestionSubscription` models.
+    """
+    id: Optional[str] = None
+    starts_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+
+    @staticmethod
+    def fields_from_json(json_data) -> dict:
+        """Returns the subscription fields found in a response of the low-level API."""
+        return {
+            "id": json_data.get("subscriptionId"),
+            "starts_at": (
+                datetime.fromisoformat(json_data.get("startedAt"))
+                if json_data.get("startedAt")
+                else None
+            ),
+            "expires_at": (
+                datetime.fromisoformat(json_data.get("expiresAt"))
+                if json_data.get("expiresAt")
+                else None
+            ),
+        }
 
-        return cls(level=level, confidence=confidence, start=start, stop=stop)
+@dataclass(slots=True)
+class CongestionSubscriptionRow:
+    """
+    A subscription listed by `NetworkInsights.get_congestion_subscriptions(rows=True)`.
+
+    Holds the same values as a `CongestionSubscription`, but they are not
+    validated and the row cannot delete the subscription.
+
+    #### Public Attributes:
+        Same as `CongestionSubscription`.
+    """
+    id: Optional[str]
+    starts_at: Optional[datetime]
+    expires_at: Optional[datetime]
 
-class CongestionSubscription(BaseModel):
+    @staticmethod
+    def from_json(json_data) -> "CongestionSubscriptionRow":
+        return CongestionSubscriptionRow(**BaseCongestionSubscription.fields_from_json(json_data))
+
+class CongestionSubscription(BaseCongestionSubscription):
     """
     A class representing the `CongestionSubscription` model.
 
@@ -58,10 +128,7 @@ class CongestionSubscription(BaseModel):
     #### Public Methods:
         delete (None): Delete congestion insights subscription.
     """
-    id: Optional[str] = None
     _api: APIClient = PrivateAttr()
-    starts_at: Optional[datetime] = None
-    expires_at: Optional[datetime] = None
 
     def __init__(self, api: APIClient, **data):
         super().__init__(**data)
@@ -70,3 +137,21 @@ class CongestionSubscription(BaseModel):
     def delete(self):
         """Delete congestion insights subscription"""
         self._api.congestion.delete_subscription(self.id)
+
+
+class AsyncCongestionSubscription(BaseCongestionSubscription):
+    """
+    A class representing the `CongestionSubscription` model, with methods to be awaited.
+
+    #### Private Attributes:
+        _api(AsyncAPIClient): An asyncio API client object.
+    """
+    _api: AsyncAPIClient = PrivateAttr()
+
+    def __init__(self, api: AsyncAPIClient, **data):
+        super().__init__(**data)
+        self._api = api
+
+    async def delete(self):
+        """Delete congestion insights subscription"""
+        await self._api.congestion.delete_subscription(self.id)
@@ -12,16 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Union, Optional
+import time
+from typing import Awaitable, Callable, List, Literal, Union, Optional, Tuple, overload
 from datetime import datetime
 from pydantic import BaseModel, Field, PrivateAttr
 
-from ..api import APIClient
-from ..models.session import QoDSession, PortsSpec
+from ..api import APIClient, AsyncAPIClient
+from ..api.instrumentation import builds_models
+from ..models.session import QoDSession, AsyncQoDSession, QoDSessionRow, PortsSpec, SessionResult, SessionReport
 from ..models.location import Location, VerificationResult
-from ..models.congestion import Congestion
+from ..models.congestion import Congestion, CongestionRow
 from ..models.number_verification import AccessToken
-from ..api.utils import tokenizer
 from ..errors import InvalidParameter, NotFound
 
 class RoamingStatus(BaseModel):
@@ -29,6 +30,14 @@ class RoamingStatus(BaseModel):
     country_code: Optional[int] = None
     country_name: Optional[List[str]] = None
 
+    @classmethod
+    def from_json(cls, json) -> "RoamingStatus":
+        return cls(
+            roaming=json["roaming"],
+            country_code=json.get("countryCode"),
+            country_name=json.get("countryName"),
+        )
+
 class DeviceIpv4Addr(BaseModel):
     """
     A class representing the `DeviceIpv4Addr` model.
@@ -43,7 +52,103 @@ class DeviceIpv4Addr(BaseModel):
     private_address: Optional[str] = Field(default=None, serialization_alias="privateAddress")
     public_port: Optional[int] = Field(default=None, serialization_alias="publicPort")
 
-class Device(BaseModel):
+def located_at(location_json: dict) -> float:
+    """Returns when the device was located as a POSIX timestamp, now if the response doesn't tell"""
+    if "lastLocationTime" in location_json:
+        return datetime.fromisoformat(location_json["lastLocationTime"]).timestamp()
+    return time.time()
+
+def serialization_aliases(model_class: type[BaseModel]) -> List[Tuple[str, str]]:
+    """Returns the names of the fields of a model along with their names in request bodies"""
+    return [
+        (name, field.serialization_alias or name)
+        for name, field in model_class.model_fields.items()
+    ]
+
+IPV4_ALIASES = serialization_aliases(DeviceIpv4Addr)
+
+def wire_fields(model: BaseModel, aliases: List[Tuple[str, str]]) -> dict:
+    """Returns the fields of a model that are set, by their names in request bodies"""
+    values = model.__dict__
+    return {alias: values[name] for name, alias in aliases if values[name] is not None}
+
+def address_key(address: Optional[DeviceIpv4Addr]) -> Optional[tuple]:
+    """Returns the values of an IPv4 address, for telling whether it has changed"""
+    if address is None:
+        return None
+    return (address.public_address, address.private_address, address.public_port)
+
+class BaseDevice(BaseModel):
+    """
+    Device identifiers shared by the `Device` and `AsyncDevice` models.
+    """
+    network_access_identifier: Union[str, None] = Field(
+        None, serialization_alias="networkAccessIdentifier"
+    )
+    phone_number: Optional[str] = Field(None, serialization_alias="phoneNumber")
+    ipv4_address: Union[DeviceIpv4Addr, None] = Field(
+        None, serialization_alias="ipv4Address"
+    )
+    ipv6_address: Union[str, None] = Field(None, serialization_alias="ipv6Address")
+    imsi: Optional[int] = Field(None, serialization_alias="imsi")
+
+    @property
+    def network_access_id(self) -> Union[str, None]:
+        return self.network_access_identifier
+
+    def wire_dict(self) -> dict:
+        """Returns the device identifiers as sent in request bodies.
+
+        Same as `model_dump(mode="json", by_alias=True, exclude_none=True)`, but
+        read straight from the fields, since serialising the device with pydantic
+        took a good part of the CPU time of polling requests.
+        """
+        wire = wire_fields(self, DEVICE_ALIASES)
+        if self.ipv4_address is not None:
+            wire["ipv4Address"] = wire_fields(self.ipv4_address, IPV4_ALIASES)
+        return wire
+
+    def identity(self) -> tuple:
+        """Returns the identifiers of the device, for keying the responses cached for it"""
+        return (
+            self.network_access_identifier,
+            self.phone_number,
+            address_key(self.ipv4_address),
+            self.ipv6_address,
+            self.imsi,
+        )
+
+    @staticmethod
+    def fields_from_json(device_json) -> dict:
+        """Returns the device identifiers found in a response of the low-level API."""
+        fields = {
+            "network_access_identifier": device_json.get("networkAccessIdentifier"),
+            "phone_number": device_json.get("phoneNumber"),
+            "ipv6_address": device_json.get("ipv6Address"),
+            "imsi": device_json.get("imsi"),
+        }
+        if "ipv4Address" in device_json:
+            fields["ipv4_address"] = DeviceIpv4Addr(
+                public_address=device_json["ipv4Address"].get("publicAddress"),
+                private_address=device_json["ipv4Address"].get("privateAddress"),
+                public_port=device_json["ipv4Address"].get("publicPort"),
+            )
+        return fields
+
+
+def token_request_data(credentials: dict, code: str) -> dict:
+    """Returns the form data for exchanging an authorization code to an access token"""
+    return {
+        "client_id": credentials['client_id'],
+        "client_secret": credentials['client_secret'],
+        "grant_type": "authorization_code",
+        "code": code,
+    }
+
+
+DEVICE_ALIASES = serialization_aliases(BaseDevice)
+
+class Device(BaseDevice):
     """
     A class representing the `Device` model.
 
@@ -73,25 +178,13 @@ class Device(BaseModel):
     """
     _api: APIClient = PrivateAttr()
     _sessions: List[QoDSession] = PrivateAttr()
-    network_access_identifier: Union[str, None] = Field(
-        None, serialization_alias="networkAccessIdentifier"
-    )
-    phone_number: Optional[str] = Field(None, serialization_alias="phoneNumber")
-    ipv4_address: Union[DeviceIpv4Addr, None] = Field(
-        None, serialization_alias="ipv4Address"
-    )
-    ipv6_address: Union[str, None] = Field(None, serialization_alias="ipv6Address")
-    imsi: Optional[int] = Field(None, serialization_alias="imsi")
 
     def __init__(self, api: APIClient, **data) -> None:
         super().__init__(**data)
         self._api = api
         self._sessions = []
 
-    @property
-    def network_access_id(self) -> Union[str, None]:
-        return self.network_access_identifier
-
+    @builds_models
     def create_qod_session(
         self,
         profile,
@@ -140,9 +233,20 @@ class Device(BaseModel):
         )
         return QoDSession.convert_session_model(self._api, self, session.json())
 
-    def sessions(self) -> List[QoDSession]:
+    @overload
+    def sessions(self, rows: Literal[False] = False) -> List[QoDSession]: ...
+
+    @overload
+    def sessions(self, rows: Literal[True]) -> List[QoDSessionRow]: ...
+
+    @builds_models
+    def sessions(self, rows: bool = False) -> Union[List[QoDSession], List[QoDSessionRow]]:
         """List sessions of the device. TODO change the name to get_sessions
 
+        #### Args:
+            rows (bool): List the sessions as `QoDSessionRow` objects, which are
+            faster to build than the models, but not validated and without methods.
+
         #### Example:
             ```python
             sessions = device.sessions()
@@ -150,6 +254,8 @@ class Device(BaseModel):
         """
         try:
             sessions = self._api.sessions.get_all_sessions(self)
+            if rows:
+                return [QoDSessionRow.from_json(self, session) for session in sessions]
             return list(
                 map(
                      self.__convert_session_model,
@@ -168,9 +274,15 @@ class Device(BaseModel):
     def __convert_session_model(self, session) -> QoDSession:
         return QoDSession.convert_session_model(self._api, self, session)
 
-    def location(self, max_age: int = 60) -> Location:
+    @builds_models
+    def location(self, max_age: Optional[int] = 60) -> Location:
         """Returns the location of the device.
 
+        If the client has a location cache, a location of the device found no
+        longer than `max_age` seconds ago is returned without asking the network.
+        Without a `max_age` the network is always asked, since it decides
+        how old the location may be.
+
          #### Args:
             max_age : Max acceptable age for location info in seconds
 
@@ -179,19 +291,20 @@ class Device(BaseModel):
             location = device.location(max_age=60)
             ```
         """
-        response = self._api.location_retrieve.get_location(self, max_age)
-        body = response
+        cache = self._api.location_cache
+        # A falsy max_age is left out of the request, as in `build_retrieve_body`
+        if cache is None or not max_age:
+            return Location.from_json(self._api.location_retrieve.get_location(self, max_age))
 
-        longitude = body["area"]["center"]["longitude"]
-        latitude = body["area"]["center"]["latitude"]
-        radius = body["area"]["radius"]
+        cached = cache.get(self.identity(), accept=lambda entry: time.time() - entry[0] <= max_age)
+        if cached is None:
+            response = self._api.location_retrieve.get_location(self, max_age)
+            cached = (located_at(response), response)
+            cache.set(self.identity(), cached)
 
-        return Location(
-            longitude=longitude,
-            latitude=latitude,
-            radius=radius,
-        )
+        return Location.from_json(cached[1])
 
+    @builds_models
     def verify_location(
         self, longitude: float, latitude: float, radius: float, max_age: int = 60
     ) -> VerificationResult:
@@ -210,57 +323,72 @@ class Device(BaseModel):
             ```
         """
         response = self._api.location_verify.verify_location(latitude, longitude, self, radius, max_age)
-        body = response
-        result_type = body["verificationResult"]
-        match_rate = body["matchRate"] if "matchRate" in body.keys() else None
-        last_location_time = datetime.fromisoformat(
-            body["lastLocationTime"]
-        ) if "lastLocationTime" in body.keys() else None
-
-        return VerificationResult(
-            result_type = result_type,
-            match_rate = match_rate,
-            last_location_time = last_location_time
-        )
+
+        return VerificationResult.from_json(response)
 
     def get_connectivity(self):
-        """Get the connectivity status for the device as a string"""
-        status = self._api.devicestatus.get_connectivity(
-            self.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )["connectivityStatus"]
+        """Get the connectivity status for the device as a string
 
-        return status
+        Served from the device status cache of the client, if it has one.
+        """
+        status = self._device_status("connectivity", self._api.devicestatus.get_connectivity)
+
+        return status["connectivityStatus"]
 
+    @builds_models
     def get_roaming(self) -> RoamingStatus:
         """Get the roaming status for the device
 
+        Served from the device status cache of the client, if it has one.
+
         #### Returns
         Object of RoamingStatus class, which contains the roaming status, country code and country name
         """
-        status = self._api.devicestatus.get_roaming(
-            self.model_dump(mode="json", by_alias=True, exclude_none=True)
-        )
+        status = self._device_status("roaming", self._api.devicestatus.get_roaming)
 
-        return RoamingStatus(
-            roaming=status["roaming"],
-            country_code=status.get("countryCode"),
-            country_name=status.get("countryName"),
-        )
+        return RoamingStatus.from_json(status)
+
+    def _device_status(self, kind: str, fetch: Callable[[dict], dict]) -> dict:
+        cache = self._api.device_status_cache
+        if cache is None:
+            return fetch(self.wire_dict())
+        return cache.get_or_load((kind, self.identity()), lambda: fetch(self.wire_dict()))
 
     # TODO:                                                              # pylint: disable=fixme
     #       In the future this won't be possible without first creating a CongestionSubscription
     #       Either this needs to be migrated to CongestionSubscription, needs to take a valid
     #       CongestionSubscription as a parameter or needs to be documented as having that requirement
+    @overload
     def get_congestion(
         self,
         start: Union[datetime, str, None] = None,
         end: Union[datetime, str, None] = None,
-    ) -> List[Congestion]:
+        rows: Literal[False] = False,
+    ) -> List[Congestion]: ...
+
+    @overload
+    def get_congestion(
+        self,
+        start: Union[datetime, str, None] = None,
+        end: Union[datetime, str, None] = None,
+        *,
+        rows: Literal[True],
+    ) -> List[CongestionRow]: ...
+
+    @builds_models
+    def get_congestion(
+        self,
+        start: Union[datetime, str, None] = None,
+        end: Union[datetime, str, None] = None,
+        rows: bool = False,
+    ) -> Union[List[Congestion], List[CongestionRow]]:
         """Get the congestion level this device is experiencing
 
         #### Args:
              start (Union[datetime, str]): Beginning of the time range to access historical or predicted congestion
              end (Union[datetime, str]): End of the time range to access historical or predicted congestion
+             rows (bool): List the congestion levels as `CongestionRow` objects,
+             which are faster to build than the models, but not validated.
         #### Returns
              Congestion object containing congestion level ("low", "medium", "high")
         """
@@ -271,6 +399,8 @@ class Device(BaseModel):
 
         assert isinstance(json, list)
 
+        if rows:
+            return [CongestionRow.from_json(congestion_json) for congestion_json in json]
         return [Congestion.from_json(congestion_json) for congestion_json in json]
 
     def get_sim_swap_date(self) -> Union[datetime, None]:
@@ -304,6 +434,7 @@ class Device(BaseModel):
             raise InvalidParameter("Device phone number is required.")
         return self._api.sim_swap.verify_sim_swap(self.phone_number, max_age)
 
+    @builds_models
     def _get_single_use_access_token(self, code: str) -> AccessToken:
         """Get Access Token for number verification API
 
@@ -312,29 +443,13 @@ class Device(BaseModel):
         #### Returns
              AccessToken object containing access token, token type and expiration time
         """
-        grant_type = "authorization_code"
         credentials = self._api.credentials.fetch_credentials()
         token_endpoint = self._api.authorization.fetch_endpoints().get(
             "token_endpoint"
         )
-        data = {
-            "client_id": credentials['client_id'],
-            "client_secret": credentials['client_secret'],
-            "grant_type": grant_type,
-            "code": code,
-        }
-        response = tokenizer(token_endpoint, data=data)
-        body = response.json()
-        access_token = body["access_token"]
-        token_type = body["token_type"]
-        expires_in = body["expires_in"]
-
-        single_use_token = AccessToken(
-            access_token=access_token,
-            token_type=token_type,
-            expires_in=expires_in
-        )
-        return single_use_token
+        response = self._api.token.fetch_token(token_endpoint, token_request_data(credentials, code))
+
+        return AccessToken.from_json(response.json())
 
     def verify_number(self, code: str) -> bool:
         """Verifies users phone number.
@@ -392,15 +507,258 @@ class Device(BaseModel):
 
     @staticmethod
     def convert_to_device_model(api, device_json):
-        device = Device(api=api)
-        device.network_access_identifier = device_json.get("networkAccessIdentifier")
-        device.phone_number = device_json.get("phoneNumber")
-        device.ipv6_address = device_json.get("ipv6Address")
-        device.imsi = device_json.get("imsi")
-        if "ipv4Address" in device_json:
-            device.ipv4_address = DeviceIpv4Addr(
-                public_address=device_json["ipv4Address"].get("publicAddress"),
-                private_address=device_json["ipv4Address"].get("privateAddress"),
-                public_port=device_json["ipv4Address"].get("publicPort"),
-            )
-        return device
+        return Device(api=api, **Device.fields_from_json(device_json))
+
+
+class AsyncDevice(BaseDevice):
+    """
+    A class representing the `Device` model, with methods to be awaited.
+
+    #### Private Attributes:
+        _api(AsyncAPIClient): An asyncio API client object.
+
+    #### Public Attributes:
+        Same as `Device`.
+
+    #### Public Methods:
+        Same as `Device`, except that every method talking to the
+        Network as Code API is a coroutine.
+    """
+    _api: AsyncAPIClient = PrivateAttr()
+
+    def __init__(self, api: AsyncAPIClient, **data) -> None:
+        super().__init__(**data)
+        self._api = api
+
+    @builds_models
+    async def create_qod_session(
+        self,
+        profile,
+        duration,
+        service_ipv4=None,
+        service_ipv6=None,
+        device_ports: Union[None, PortsSpec] = None,
+        service_ports: Union[None, PortsSpec] = None,
+        notification_url=None,
+        notification_auth_token=None,
+    ) -> AsyncQoDSession:
+        """Creates a session for the device.
+
+        #### Example:
+            ```python
+            session = await device.create_qod_session(profile="QOS_L", duration=3600,
+            service_ipv4="5.6.7.8")
+            ```
+        """
+        # Checks if at least one parameter is set
+        if not service_ipv4 and not service_ipv6:
+            raise ValueError("At least one of IP parameters must be provided")
+
+        session = await self._api.sessions.create_session(
+            self,
+            profile,
+            duration,
+            service_ipv4,
+            service_ipv6,
+            device_ports,
+            service_ports,
+            notification_url,
+            notification_auth_token,
+        )
+        return AsyncQoDSession.convert_session_model(self._api, self, session.json())
+
+    @overload
+    async def sessions(self, rows: Literal[False] = False) -> List[AsyncQoDSession]: ...
+
+    @overload
+    async def sessions(self, rows: Literal[True]) -> List[QoDSessionRow]: ...
+
+    @builds_models
+    async def sessions(self, rows: bool = False) -> Union[List[AsyncQoDSession], List[QoDSessionRow]]:
+        """List sessions of the device.
+
+        Takes the same arguments as `Device.sessions`.
+
+        #### Example:
+            ```python
+            sessions = await device.sessions()
+            ```
+        """
+        try:
+            sessions = await self._api.sessions.get_all_sessions(self)
+        except NotFound:
+            # API will return 404 for a device which has had all of its sessions deleted
+            return []
+
+        if rows:
+            return [QoDSessionRow.from_json(self, session) for session in sessions]
+        return [
+            AsyncQoDSession.convert_session_model(self._api, self, session)
+            for session in sessions
+        ]
+
+    async def clear_sessions(self):
+        """Clears sessions of the device."""
+        for session in await self.sessions():
+            await session.delete()
+
+    @builds_models
+    async def location(self, max_age: Optional[int] = 60) -> Location:
+        """Returns the location of the device, from the location cache of the client if it has one.
+
+        #### Example:
+            ```python
+            location = await device.location(max_age=60)
+            ```
+        """
+        cache = self._api.location_cache
+        # A falsy max_age is left out of the request, as in `build_retrieve_body`
+        if cache is None or not max_age:
+            return Location.from_json(await self._api.location_retrieve.get_location(self, max_age))
+
+        cached = cache.get(self.identity(), accept=lambda entry: time.time() - entry[0] <= max_age)
+        if cached is None:
+            response = await self._api.location_retrieve.get_location(self, max_age)
+            cached = (located_at(response), response)
+            cache.set(self.identity(), cached)
+
+        return Location.from_json(cached[1])
+
+    @builds_models
+    async def verify_location(
+        self, longitude: float, latitude: float, radius: float, max_age: int = 60
+    ) -> VerificationResult:
+        """Verifies the location of the device (Returns VerificationResult object)."""
+        response = await self._api.location_verify.verify_location(latitude, longitude, self, radius, max_age)
+
+        return VerificationResult.from_json(response)
+
+    async def get_connectivity(self):
+        """Get the connectivity status for the device as a string"""
+        status = await self._device_status("connectivity", self._api.devicestatus.get_connectivity)
+
+        return status["connectivityStatus"]
+
+    @builds_models
+    async def get_roaming(self) -> RoamingStatus:
+        """Get the roaming status for the device"""
+        status = await self._device_status("roaming", self._api.devicestatus.get_roaming)
+
+        return RoamingStatus.from_json(status)
+
+    async def _device_status(self, kind: str, fetch: Callable[[dict], Awaitable[dict]]) -> dict:
+        cache = self._api.device_status_cache
+        if cache is None:
+            return await fetch(self.wire_dict())
+        return await cache.get_or_load_async((kind, self.identity()), lambda: fetch(self.wire_dict()))
+
+    @overload
+    async def get_congestion(
+        self,
+        start: Union[datetime, str, None] = None,
+        end: Union[datetime, str, None] = None,
+        rows: Literal[False] = False,
+    ) -> List[Congestion]: ...
+
+    @overload
+    async def get_congestion(
+        self,
+        start: Union[datetime, str, None] = None,
+        end: Union[datetime, str, None] = None,
+        *,
+        rows: Literal[True],
+    ) -> List[CongestionRow]: ...
+
+    @builds_models
+    async def get_congestion(
+        self,
+        start: Union[datetime, str, None] = None,
+        end: Union[datetime, str, None] = None,
+        rows: bool = False,
+    ) -> Union[List[Congestion], List[CongestionRow]]:
+        """Get the congestion level this device is experiencing
+
+        Takes the same arguments as `Device.get_congestion`.
+        """
+        start = start.isoformat() if isinstance(start, datetime) else start
+        end = end.isoformat() if isinstance(end, datetime) else end
+
+        json = await self._api.congestion.fetch_congestion(self, start=start, end=end)
+
+        assert isinstance(json, list)
+
+        if rows:
+            return [CongestionRow.from_json(congestion_json) for congestion_json in json]
+        return [Congestion.from_json(congestion_json) for congestion_json in json]
+
+    async def get_sim_swap_date(self) -> Union[datetime, None]:
+        """Get the latest SIM swap date."""
+        if self.phone_number is None:
+            raise InvalidParameter("Device phone number is required.")
+
+        response = await self._api.sim_swap.fetch_sim_swap_date(self.phone_number)
+
+        if response.get("latestSimChange"):
+            return datetime.fromisoformat(response["latestSimChange"])
+
+        return None
+
+    async def verify_sim_swap(self, max_age: Optional[int] = None) -> bool:
+        """Verify if there was sim swap."""
+        if self.phone_number is None:
+            raise InvalidParameter("Device phone number is required.")
+        return await self._api.sim_swap.verify_sim_swap(self.phone_number, max_age)
+
+    @builds_models
+    async def _get_single_use_access_token(self, code: str) -> AccessToken:
+        """Get Access Token for number verification API"""
+        credentials = await self._api.credentials.fetch_credentials()
+        endpoints = await self._api.authorization.fetch_endpoints()
+        response = await self._api.token.fetch_token(
+            endpoints.get("token_endpoint"), token_request_data(credentials, code)
+        )
+
+        return AccessToken.from_json(response.json())
+
+    async def verify_number(self, code: str) -> bool:
+        """Verifies users phone number."""
+        if self.phone_number is None:
+            raise InvalidParameter("Device phone number is required.")
+        authenticator = await self._get_single_use_access_token(code=code)
+        headers = {'Authorization': f'{authenticator.token_type} {authenticator.access_token}'}
+
+        return await self._api.number_verification.verify_number(
+            payload={"phoneNumber": self.phone_number}, headers=headers
+        )
+
+    async def get_phone_number(self, code: str) -> str:
+        """Gets the users phone number."""
+        authenticator = await self._get_single_use_access_token(code=code)
+        headers = {'Authorization': f'{authenticator.token_type} {authenticator.access_token}'}
+
+        return await self._api.number_verification.get_phone_number(headers=headers)
+
+    async def get_call_forwarding(self) -> List:
+        """Gets information about Call Forwarding Services active for the given device."""
+        if self.phone_number is None:
+            raise InvalidParameter("Device phone number is required.")
+
+        return await self._api.call_forwarding.retrieve_call_forwarding(self.phone_number)
+
+    async def verify_unconditional_forwarding(self) -> bool:
+        """Verify if device has unconditional call forwarding active."""
+        if self.phone_number is None:
+            raise InvalidParameter("Device phone number is required.")
+
+        return await self._api.call_forwarding.verify_unconditional_forwarding(self.phone_number)
+
+    @staticmethod
+    def convert_to_device_model(api, device_json):
+        return AsyncDevice(api=api, **AsyncDevice.fields_from_json(device_json))
+
+
+# The session models refer to the device models, which are only defined now
+QoDSession.model_rebuild()
+AsyncQoDSession.model_rebuild()
+SessionResult.model_rebuild()
+SessionReport.model_rebuild()
@@ -12,13 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Optional, Union
 from pydantic import BaseModel, PrivateAttr
 
-from ..api import APIClient
-from ..models.device import Device
+from ..api import APIClient, AsyncAPIClient
+from ..models.device import Device, AsyncDevice
 
 
 class EventType(Enum):
@@ -35,7 +36,43 @@ class EventType(Enum):
     ROAMING_CHANGE_COUNTRY = "org.camaraproject.device-status.v0.roaming-change-country"
 
 
-class EventSubscription(BaseModel):
+class BaseEventSubscription(BaseModel):
+    """
+    Fields shared by the `EventSubscription` and `AsyncEventSubscription` models.
+    """
+
+    id: str = ''
+    max_num_of_reports: Optional[int] = None
+    event_type: str
+    notification_url: str
+    notification_auth_token: Optional[str] = None
+    starts_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+
+
+@dataclass(slots=True)
+class EventSubscriptionRow:
+    """
+    A subscription listed by `Connectivity.get_subscriptions(rows=True)`.
+
+    Holds the same values as an `EventSubscription`, but they are not
+    validated and the row cannot delete the subscription.
+
+    #### Public Attributes:
+        Same as `EventSubscription`.
+    """
+
+    id: str
+    max_num_of_reports: Optional[int]
+    event_type: str
+    notification_url: str
+    notification_auth_token: Optional[str]
+    device: Union[Device, AsyncDevice]
+    starts_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+
+
+class EventSubscription(BaseEventSubscription):
     """
     A class representing the `ConnectivitySubscription` model.
 
@@ -55,15 +92,8 @@ class EventSubscription(BaseModel):
         delete (None): Deletes device connectivity status subscription.
     """
 
-    id: str = ''
     _api: APIClient = PrivateAttr()
-    max_num_of_reports: Optional[int] = None
-    event_type: str
-    notification_url: str
-    notification_auth_token: Optional[str] = None
     device: Device
-    starts_at: Optional[datetime] = None
-    expires_at: Optional[datetime] = None
 
     def __init__(self, api: APIClient, **data) -> None:
         super().__init__(**data)
@@ -74,3 +104,28 @@ class EventSubscription(BaseModel):
 
         # Error Case: Delete connectivity status
         self._api.devicestatus.delete_subscription(self.id)
+
+
+class AsyncEventSubscription(BaseEventSubscription):
+    """
+    A class representing the `ConnectivitySubscription` model, with methods to be awaited.
+
+    #### Private Attributes:
+        _api(AsyncAPIClient): An asyncio API client object.
+
+    #### Public Attributes:
+        Same as `EventSubscription`, with `device` being an `AsyncDevice`.
+    #### Public Methods:
+        delete (None): Deletes device connectivity status subscription.
+    """
+
+    _api: AsyncAPIClient = PrivateAttr()
+    device: AsyncDevice
+
+    def __init__(self, api: AsyncAPIClient, **data) -> None:
+        super().__init__(**data)
+        self._api = api
+
+    async def delete(self) -> None:
+        """Delete device connectivity status"""
+        await self._api.devicestatus.delete_subscription(self.id)
@@ -13,11 +13,12 @@
 # limitations under the License.
 
 
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Optional, List, Union
 from pydantic import BaseModel, PrivateAttr, Field
-from network_as_code.api.client import APIClient
+from network_as_code.api.client import APIClient, AsyncAPIClient
 
 class EventType(Enum):
     """
@@ -38,9 +39,11 @@ class PlainCredential(BaseModel):
     identifier: str = Field(..., serialization_alias="identifier")
     secret: str = Field(..., serialization_alias="secret")
 
-class GeofencingSubscription(BaseModel):
+class BaseGeofencingSubscription(BaseModel):
+    """
+    Fields shared by the `GeofencingSubscription` and `AsyncGeofencingSubscription` models.
+    """
     event_subscription_id: str
-    _api: APIClient = PrivateAttr()
     protocol: Optional[str] = None
     sink: str
     types: List[str]
@@ -49,6 +52,47 @@ class GeofencingSubscription(BaseModel):
     radius: Union[int, float]
     starts_at: datetime
     sink_credential: Union[PlainCredential, AccessTokenCredential, None] = None
+
+    @staticmethod
+    def fields_from_json(json_data) -> dict:
+        """Returns the subscription fields found in a response of the low-level API."""
+        starts_at = (
+            datetime.fromisoformat(json_data["startsAt"])
+            if json_data.get("startsAt", False)
+            else None
+        )
+        return {
+            "event_subscription_id": json_data["id"],
+            "sink": json_data["sink"],
+            "types": json_data["types"],
+            "latitude": json_data["config"].get("subscriptionDetail").get("area").get("center").get("latitude"),
+            "longitude": json_data["config"].get("subscriptionDetail").get("area").get("center").get("longitude"),
+            "radius": json_data["config"].get("subscriptionDetail").get("area").get("radius"),
+            "starts_at": starts_at,
+        }
+
+@dataclass(slots=True)
+class GeofencingSubscriptionRow:
+    """
+    A subscription listed by `Geofencing.get_all(rows=True)`.
+
+    Holds the values of a `GeofencingSubscription` found in the listing, but
+    they are not validated and the row cannot delete the subscription.
+    """
+    event_subscription_id: str
+    sink: str
+    types: List[str]
+    latitude: float
+    longitude: float
+    radius: Union[int, float]
+    starts_at: Optional[datetime]
+
+    @staticmethod
+    def from_json(json_data) -> 'GeofencingSubscriptionRow':
+        return GeofencingSubscriptionRow(**BaseGeofencingSubscription.fields_from_json(json_data))
+
+class GeofencingSubscription(BaseGeofencingSubscription):
+    _api: APIClient = PrivateAttr()
     def __init__(self, api: APIClient, **data):
         super().__init__(**data)
         self._api = api
@@ -59,18 +103,18 @@ class GeofencingSubscription(BaseModel):
 
     @staticmethod
     def from_json(api: APIClient, json_data) -> 'GeofencingSubscription':
-        starts_at = (
-            datetime.fromisoformat(json_data["startsAt"])
-            if json_data.get("startsAt", False)
-            else None
-        )
-        return GeofencingSubscription(
-            event_subscription_id = json_data["id"],
-            api=api,
-            sink=json_data["sink"],
-            types=json_data["types"],
-            latitude =json_data["config"].get("subscriptionDetail").get("area").get("center").get("latitude"),
-            longitude=json_data["config"].get("subscriptionDetail").get("area").get("center").get("longitude"),
-            radius=json_data["config"].get("subscriptionDetail").get("area").get("radius"),
-            starts_at=starts_at,
-        )
+        return GeofencingSubscription(api=api, **GeofencingSubscription.fields_from_json(json_data))
+
+class AsyncGeofencingSubscription(BaseGeofencingSubscription):
+    _api: AsyncAPIClient = PrivateAttr()
+    def __init__(self, api: AsyncAPIClient, **data):
+        super().__init__(**data)
+        self._api = api
+
+    async def delete(self):
+        """Delete Geofencing subscription"""
+        await self._api.geofencing.delete_subscription(self.event_subscription_id)
+
+    @staticmethod
+    def from_json(api: AsyncAPIClient, json_data) -> 'AsyncGeofencingSubscription':
+        return AsyncGeofencingSubscription(api=api, **AsyncGeofencingSubscription.fields_from_json(json_data))
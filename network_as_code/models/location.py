@@ -29,6 +29,20 @@ class VerificationResult(BaseModel):
     match_rate: Optional[int] = None
     last_location_time: Optional[datetime] = None
 
+    @classmethod
+    def from_json(cls, json) -> "VerificationResult":
+        result_type = json["verificationResult"]
+        match_rate = json["matchRate"] if "matchRate" in json.keys() else None
+        last_location_time = datetime.fromisoformat(
+            json["lastLocationTime"]
+        ) if "lastLocationTime" in json.keys() else None
+
+        return cls(
+            result_type = result_type,
+            match_rate = match_rate,
+            last_location_time = last_location_time
+        )
+
 class Location(BaseModel):
     """
     A class representing the `Location` model.
@@ -37,8 +51,26 @@ class Location(BaseModel):
             longitude (float): the `longitude` of a location object.
             latitude (float): the `latitude` of a location object.
             radius (Optional[float]): the `radius` of a location object.
+            last_location_time (Optional[datetime]): when the network last located the device.
     """
 
     longitude: float
     latitude: float
     radius: Optional[float] = None
+    last_location_time: Optional[datetime] = None
+
+    @classmethod
+    def from_json(cls, json) -> "Location":
+        longitude = json["area"]["center"]["longitude"]
+        latitude = json["area"]["center"]["latitude"]
+        radius = json["area"]["radius"]
+        last_location_time = datetime.fromisoformat(
+            json["lastLocationTime"]
+        ) if "lastLocationTime" in json else None
+
+        return cls(
+            longitude=longitude,
+            latitude=latitude,
+            radius=radius,
+            last_location_time=last_location_time,
+        )
@@ -33,4 +33,12 @@ class AccessToken(BaseModel):
     """
     access_token: str
     token_type: str
-    expires_in: int
\ No newline at end of file
+    expires_in: int
+
+    @classmethod
+    def from_json(cls, json) -> "AccessToken":
+        return cls(
+            access_token=json["access_token"],
+            token_type=json["token_type"],
+            expires_in=json["expires_in"]
+        )
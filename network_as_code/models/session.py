@@ -12,13 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from __future__ import annotations
+from dataclasses import dataclass
 from typing import Union, List, Optional, TYPE_CHECKING
 from datetime import datetime
 
 from pydantic import ConfigDict, BaseModel, PrivateAttr
-from network_as_code.api.client import APIClient
+from network_as_code.api.client import APIClient, AsyncAPIClient
 if TYPE_CHECKING:
-    from network_as_code.models.device import Device
+    from network_as_code.models.device import Device, AsyncDevice
 
 ALIASES = {"start": "from", "end": "to"}
 
@@ -54,7 +55,90 @@ class PortsSpec(BaseModel):
     ports: Optional[List[int]] = None
 
 
-class QoDSession(BaseModel, arbitrary_types_allowed=True):
+class BaseQoDSession(BaseModel, arbitrary_types_allowed=True):
+    """
+    Fields shared by the `QoDSession` and `AsyncQoDSession` models.
+    """
+
+    id: str
+    profile: str
+    status: str
+    duration: Union[int, None] = None
+    started_at: Union[datetime, None] = None
+    expires_at: Union[datetime, None] = None
+    service_ipv4: Union[str, None] = None
+    service_ipv6: Union[str, None] = None
+    device_ports: Union[PortsSpec, None] = None
+    service_ports: Union[PortsSpec, None] = None
+
+    @staticmethod
+    def fields_from_json(session) -> dict:
+        """Returns the session fields found in a response of the low-level API.
+
+        Assigns the startedAt and expiresAt attributes None if their value not found.
+        #### Args:
+            session (any): A `Session` object created by the low-level API.
+        """
+        started_at = (
+            # I really hate having to carry this hack around
+            datetime.fromisoformat(session["startedAt"].replace("Z", "+00:00"))
+            if session.get("startedAt", False)
+            else None
+        )
+        expires_at = (
+            # I might just bump minimum Python version over this
+            datetime.fromisoformat(session["expiresAt"].replace("Z", "+00:00"))
+            if session.get("expiresAt", False)
+            else None
+        )
+        service = session.get("applicationServer")
+        device_ports = session.get('devicePorts')
+        service_ports = session.get('applicationServerPorts')
+        return {
+            "id": session["sessionId"],
+            "device_ports": PortsSpec(**device_ports) if device_ports else None,
+            "service_ipv4": service.get("ipv4Address") if service else None,
+            "service_ipv6": service.get("ipv6Address") if service else None,
+            "service_ports": PortsSpec(**service_ports) if service_ports else None,
+            "profile": session["qosProfile"],
+            "status": session["qosStatus"],
+            "duration": session.get('duration'),
+            "started_at": started_at,
+            "expires_at": expires_at,
+        }
+
+
+@dataclass(slots=True)
+class QoDSessionRow:
+    """
+    A session listed by `Device.sessions(rows=True)`.
+
+    Holds the same values as a `QoDSession`, but they are not
+    validated and the row has none of the methods of the model.
+
+    #### Public Attributes:
+        Same as `QoDSession`, with `device` being the listed device.
+    """
+
+    id: str
+    profile: str
+    status: str
+    duration: Union[int, None]
+    started_at: Union[datetime, None]
+    expires_at: Union[datetime, None]
+    service_ipv4: Union[str, None]
+    service_ipv6: Union[str, None]
+    device_ports: Union[PortsSpec, None]
+    service_ports: Union[PortsSpec, None]
+    device: Union[Device, AsyncDevice]
+
+    @staticmethod
+    def from_json(device, session) -> QoDSessionRow:
+        """Returns a `QoDSessionRow` for a session listed by the low-level API"""
+        return QoDSessionRow(device=device, **BaseQoDSession.fields_from_json(session))
+
+
+class QoDSession(BaseQoDSession):
     """
     A class representing the `Session` model.
 
@@ -81,18 +165,7 @@ class QoDSession(BaseModel, arbitrary_types_allowed=True):
     """
 
     _api: APIClient = PrivateAttr()
-    id: str
-    profile: str
-    status: str
-    duration: Union[int, None] = None
-    started_at: Union[datetime, None] = None
-    expires_at: Union[datetime, None] = None
     device: Device # ForwardRef value is used here
-    service_ipv4: Union[str, None] = None
-    service_ipv6: Union[str, None] = None
-    device_ports: Union[PortsSpec, None] = None
-    service_ports: Union[PortsSpec, None] = None
-
 
     def __init__(self, api: APIClient, **data) -> None:
         super().__init__(**data)
@@ -121,33 +194,107 @@ class QoDSession(BaseModel, arbitrary_types_allowed=True):
             device (Device): A `Device` object.
             session (any): A `Session` object created by the low-level API.
         """
-        started_at = (
-            # I really hate having to carry this hack around
-            datetime.fromisoformat(session["startedAt"].replace("Z", "+00:00"))
-            if session.get("startedAt", False)
-            else None
-        )
-        expires_at = (
-            # I might just bump minimum Python version over this
-            datetime.fromisoformat(session["expiresAt"].replace("Z", "+00:00"))
-            if session.get("expiresAt", False)
-            else None
-        )
-        service = session.get("applicationServer")
-        device_ports = session.get('devicePorts')
-        service_ports = session.get('applicationServerPorts')
         return QoDSession(
             api=api,
-            id=session["sessionId"],
             device=device,
-            device_ports=PortsSpec(**device_ports) if device_ports else None,
-            service_ipv4=service.get("ipv4Address") if service else None,
-            service_ipv6=service.get("ipv6Address") if service else None,
-            service_ports=PortsSpec(**service_ports) if service_ports else None,
-            profile=session["qosProfile"],
-            status=session["qosStatus"],
-            duration=session.get('duration'),
-            started_at=started_at,
-            expires_at=expires_at,
+            **QoDSession.fields_from_json(session),
+        )
+
+
+class AsyncQoDSession(BaseQoDSession):
+    """
+    A class representing the `Session` model, with methods to be awaited.
+
+    #### Private Attributes:
+        _api(AsyncAPIClient): An asyncio API client object.
+
+    #### Public Attributes:
+        Same as `QoDSession`, with `device` being an `AsyncDevice`.
+    #### Public Methods:
+        delete (None): Deletes a given session.
+        extend (None): Extends the duration of a given session.
+    """
+
+    _api: AsyncAPIClient = PrivateAttr()
+    device: AsyncDevice # ForwardRef value is used here
+
+    def __init__(self, api: AsyncAPIClient, **data) -> None:
+        super().__init__(**data)
+        self._api = api
+
+    async def delete(self):
+        """Deletes a given session."""
+        await self._api.sessions.delete_session(self.id)
+
+    async def extend(self, additional_duration: int):
+        """Extends the duration of a given session.
+            #### Args:
+                additional_duration (int): Additional session duration in seconds.
+        """
+        res = await self._api.sessions.extend_session(self.id, additional_duration)
+        self.duration = res.json()['duration']
+
+    @staticmethod
+    def convert_session_model(api, device, session):
+        """Returns an `AsyncQoDSession` instance.
+
+        #### Args:
+            device (AsyncDevice): An `AsyncDevice` object.
+            session (any): A `Session` object created by the low-level API.
+        """
+        return AsyncQoDSession(
+            api=api,
+            device=device,
+            **AsyncQoDSession.fields_from_json(session),
         )
-    
\ No newline at end of file
+
+
+class SessionResult(BaseModel, arbitrary_types_allowed=True):
+    """
+    The outcome of a bulk session operation for a single device.
+
+    #### Public Attributes:
+        device (Device | AsyncDevice): The device the operation was made for.
+        session (QoDSession | AsyncQoDSession | None): The created or deleted session.
+        error (Exception | None): Error raised for the device, None on success.
+    """
+
+    device: Union[Device, AsyncDevice] # ForwardRef value is used here
+    session: Union[QoDSession, AsyncQoDSession, None] = None
+    error: Union[Exception, None] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation succeeded for the device"""
+        return self.error is None
+
+
+class SessionReport(BaseModel, arbitrary_types_allowed=True):
+    """
+    A per-device report of a bulk session operation.
+
+    #### Public Attributes:
+        results (List[SessionResult]): Results in completion order.
+        succeeded (List[SessionResult]): Results of the devices which succeeded.
+        failed (List[SessionResult]): Results of the devices which failed.
+    """
+
+    results: List[SessionResult] = []
+
+    @property
+    def succeeded(self) -> List[SessionResult]:
+        """Results of the devices for which the operation succeeded"""
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> List[SessionResult]:
+        """Results of the devices for which the operation failed"""
+        return [result for result in self.results if not result.ok]
+
+
+
+# The models above refer to the device models, which rebuild them once defined.
+# Importing those last makes the models above usable when this module is
+# imported on its own. When the device module imports this one, it is still
+# partially initialised at this point and rebuilds the models itself.
+from network_as_code.models import device as _device  # pylint: disable=wrong-import-position,unused-import,cyclic-import
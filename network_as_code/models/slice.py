@@ -14,14 +14,20 @@
 
 import asyncio
 import datetime
-from typing import Dict, List, Union, Optional
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Iterable, Iterator, List, Tuple, TypeVar, Union, Optional
 from pydantic import BaseModel, PrivateAttr, Field
 
-from ..api import APIClient
+from ..api import APIClient, AsyncAPIClient
+from ..api.backoff import backoff_delay
+from ..api.bulk import DEFAULT_CONCURRENCY, async_run_bounded, run_bounded
 from ..models.session import QoDSession
-from ..models.device import Device
+from ..models.device import BaseDevice, Device
 from ..errors import NotFound
 
+T = TypeVar("T", bound=BaseDevice)
+
 
 class Customer(BaseModel):
     """
@@ -122,25 +128,365 @@ class TrafficCategories(BaseModel):
 class DeviceAttachment(BaseModel):
     device_phone_number: str
     attachment_id: str
+    network_access_identifier: Optional[str] = None
+    ipv4_address: Optional[str] = None
+    ipv6_address: Optional[str] = None
+
+    @staticmethod
+    def from_json(attachment) -> "DeviceAttachment":
+        """Returns a `DeviceAttachment` instance from an attachment of the low-level API."""
+        device = attachment["resource"]["device"]
+        ipv4_address = device.get("ipv4Address") or {}
+        return DeviceAttachment(
+            device_phone_number=device["phoneNumber"],
+            attachment_id=attachment["nac_resource_id"],
+            network_access_identifier=device.get("networkAccessIdentifier"),
+            ipv4_address=ipv4_address.get("publicAddress"),
+            ipv6_address=device.get("ipv6Address"),
+        )
+
+    @staticmethod
+    def for_device(attachment_id: str, device: BaseDevice) -> "DeviceAttachment":
+        """Returns a `DeviceAttachment` instance for a device which was just attached."""
+        assert isinstance(device.phone_number, str)
+        return DeviceAttachment(
+            device_phone_number=device.phone_number,
+            attachment_id=attachment_id,
+            network_access_identifier=device.network_access_identifier,
+            ipv4_address=device.ipv4_address.public_address if device.ipv4_address else None,
+            ipv6_address=device.ipv6_address,
+        )
+
+    def keys(self) -> List[Tuple[str, str]]:
+        """The device identifiers this attachment can be looked up by"""
+        return device_keys(
+            self.device_phone_number, self.network_access_identifier, self.ipv4_address, self.ipv6_address
+        )
+
+    def agrees_with(self, keys: List[Tuple[str, str]]) -> bool:
+        """Whether none of the given device identifiers differ from those of this attachment"""
+        identifiers = dict(self.keys())
+        return all(identifiers.get(kind, value) == value for kind, value in keys)
+
+
+def device_keys(phone_number, network_access_identifier, ipv4_address, ipv6_address) -> List[Tuple[str, str]]:
+    # Ordered from the most to the least specific identifier
+    identifiers = [
+        ("phoneNumber", phone_number),
+        ("networkAccessIdentifier", network_access_identifier),
+        ("ipv4Address", ipv4_address),
+        ("ipv6Address", ipv6_address),
+    ]
+    return [(kind, value) for kind, value in identifiers if value]
+
+
+class DeviceAttachments:
+    """
+    The device attachments of a slice, indexed by phone number
+    and by network access identifier and IP address when known.
+
+    Looking up or removing the attachment of a device takes constant time.
+    """
+
+    def __init__(self, attachments: Iterable[DeviceAttachment] = ()):
+        self._index: Dict[Tuple[str, str], DeviceAttachment] = {}
+        self._by_phone_number: Dict[str, DeviceAttachment] = {}
+        for attachment in attachments:
+            self.add(attachment)
+
+    def add(self, attachment: DeviceAttachment):
+        """Index an attachment, replacing an older attachment of the same device"""
+        existing = self._by_phone_number.get(attachment.device_phone_number)
+        if existing:
+            self.remove(existing)
+
+        self._by_phone_number[attachment.device_phone_number] = attachment
+        for key in attachment.keys():
+            self._index[key] = attachment
+
+    def find(self, device: BaseDevice) -> Optional[DeviceAttachment]:
+        """Returns the attachment of a device, if it has one.
+
+        A device with a phone number is matched by it alone, since several devices
+        can share an IP address. Other devices are matched by an attachment whose
+        identifiers all agree with those of the device.
+        """
+        if device.phone_number:
+            return self._by_phone_number.get(device.phone_number)
+
+        ipv4_address = device.ipv4_address.public_address if device.ipv4_address else None
+        keys = device_keys(None, device.network_access_identifier, ipv4_address, device.ipv6_address)
+        for key in keys:
+            attachment = self._index.get(key)
+            if attachment and attachment.agrees_with(keys):
+                return attachment
+        return None
+
+    def pop(self, device: BaseDevice) -> Optional[DeviceAttachment]:
+        """Remove and return the attachment of a device, if it has one"""
+        attachment = self.find(device)
+        if attachment:
+            self.remove(attachment)
+        return attachment
+
+    def remove(self, attachment: DeviceAttachment):
+        """Remove an attachment, if it is still indexed"""
+        if self._by_phone_number.get(attachment.device_phone_number) is not attachment:
+            return
+        del self._by_phone_number[attachment.device_phone_number]
+        for key in attachment.keys():
+            if self._index.get(key) is attachment:
+                del self._index[key]
+
+    def __iter__(self) -> Iterator[DeviceAttachment]:
+        return iter(list(self._by_phone_number.values()))
+
+    def __len__(self) -> int:
+        return len(self._by_phone_number)
+
+    def __contains__(self, device: BaseDevice) -> bool:
+        return self.find(device) is not None
+
+
+def find_attachments(
+    slice_attachments: DeviceAttachments, devices: Iterable[T]
+) -> Iterator[Tuple[T, Optional[DeviceAttachment]]]:
+    """Pair each device with its attachment, leaving it in the slice until it has been deleted.
+
+    A device given again after its attachment was paired gets no attachment,
+    so that the attachment is not deleted twice.
+    """
+    paired = set()
+    for device in devices:
+        attachment = slice_attachments.find(device)
+        if attachment is not None and attachment.attachment_id in paired:
+            attachment = None
+        elif attachment is not None:
+            paired.add(attachment.attachment_id)
+        yield device, attachment
+
+
+DEFAULT_MAX_POLL_BACKOFF = datetime.timedelta(seconds=60)
+
+
+async def poll_until(
+    done: Callable[[], bool],
+    refresh: Callable[[], Awaitable[None]],
+    timeout: datetime.timedelta,
+    poll_backoff: datetime.timedelta,
+    max_poll_backoff: datetime.timedelta = DEFAULT_MAX_POLL_BACKOFF,
+):
+    """Refresh until `done` returns True or the timeout runs out.
+
+    The delay between polls starts at `poll_backoff` and doubles, with jitter,
+    up to `max_poll_backoff`.
+    """
+    end = time.monotonic() + timeout.total_seconds()
+    attempt = 0
+    while not done():
+        remaining = end - time.monotonic()
+        if remaining <= 0:
+            return
+        delay = backoff_delay(attempt, poll_backoff.total_seconds(), max_poll_backoff.total_seconds())
+        await asyncio.sleep(min(delay, remaining))
+        await refresh()
+        attempt += 1
+
+
+class BaseSlice(BaseModel, arbitrary_types_allowed=True):
+    """
+    Fields shared by the `Slice` and `AsyncSlice` models.
+    """
+
+    _sessions: List[QoDSession] = PrivateAttr(default_factory=list)
+    sid: Optional[str] = None
+    state: str
+    name: str = Field(
+        default = '',
+        description="""Optional short name for the slice.
+        Must be ASCII characters, digits and dash. 
+        Like name of an event, such as "Concert-2029-Big-Arena".""",
+        min_length=4,
+        max_length=64,
+        pattern="^[a-zA-Z0-9][a-zA-Z0-9-]+[a-zA-Z0-9]$",
+    )
+    network_identifier: NetworkIdentifier
+    slice_info: SliceInfo
+    notification_url: str
+    notification_auth_token: Optional[str] = None
+    area_of_service: Optional[AreaOfService] = Field(
+        None, description="Area which the network slice is intended to serve"
+    )
+    max_data_connections: Optional[int] = Field(
+        None,
+        description="Maximum number of data connection sessions in the slice.",
+        ge=0,
+    )
+    max_devices: Optional[int] = Field(
+        None, description="Maximum number of devices using the slice.", ge=0
+    )
+    slice_downlink_throughput: Optional[Throughput] = None
+    slice_uplink_throughput: Optional[Throughput] = None
+    device_downlink_throughput: Optional[Throughput] = None
+    device_uplink_throughput: Optional[Throughput] = None
+    # None until the attachments have been loaded from the API
+    _attachments: Optional[DeviceAttachments] = PrivateAttr(default=None)
+
+    def set_attachments(self, attachments) -> DeviceAttachments:
+        self._attachments = DeviceAttachments(
+            DeviceAttachment.from_json(attachment) for attachment in attachments
+        )
+        return self._attachments
+
+    def defer_attachments(self):
+        """Load the attachments from the API on first use instead of up front"""
+        self._attachments = None
+
+    def forget_attachment_listing(self):
+        """Drops the attachment listing cached by the client, once the attachments have changed"""
+        self._api.attachment_index.invalidate()
+
+    def set_attachments_from_listing(self, attachments) -> DeviceAttachments:
+        """Picks the attachments of this slice from a listing of all attachments"""
+        return self.set_attachments([
+            attachment
+            for attachment in attachments
+            if attachment["resource"]["sliceId"] == self.name
+        ])
+
+    @staticmethod
+    def network_identifier_from_dict(network_identifier_dict: Optional[Dict[str, str]]):
+        """Returns a `NetworkIdentifier` instance.
 
+        Assigns the `mcc` and `mnc`.
+        #### Args:
+            network_identifier_dict (Dict[str, str]): A Network Identifier object with `mcc` and `mnc` values.
+        """
+        if network_identifier_dict:
+            return NetworkIdentifier(
+                mcc=network_identifier_dict["mcc"], mnc=network_identifier_dict["mnc"]
+            )
 
-def fetch_and_remove(slice_attachments: List[DeviceAttachment], device: Device):
-    for i, attachment in enumerate(slice_attachments):
-        if attachment.device_phone_number == device.phone_number:
-            attachment_id = attachment.attachment_id
-            del slice_attachments[i]
-            return attachment_id
-    return None
+    @staticmethod
+    def slice_info_from_dict(slice_info_dict: Optional[Dict[str, str]]):
+        """Returns a `SliceInfo` instance.
 
+        Assigns the `service_type` and `differentiator`.
+        #### Args:
+            slice_info_dict (Dict[str, str]): A Slice Info object with `service_type` and `differentiator` values.
+        """
+        if slice_info_dict:
+            return SliceInfo(
+                service_type=str(slice_info_dict["serviceType"]),
+                differentiator=slice_info_dict.get("differentiator"),
+            )
 
-class Slice(BaseModel, arbitrary_types_allowed=True):
+    @staticmethod
+    def area_of_service_from_dict(
+        area_of_service_dict: Optional[Dict[str, List[Dict[str, float]]]]
+    ) -> Optional[AreaOfService]:
+        """Returns a `AreaOfService` instance.
+
+        Assigns the `polygon`.
+        #### Args:
+            area_of_service_dict (Dict[str, List[Dict[str, float]]]): An Area Of Service object with polygon list value.
+        """
+        if area_of_service_dict:
+            polygon = area_of_service_dict["polygon"]
+            return AreaOfService(
+                polygon=[
+                    Point(latitude=polygon[0]["lat"], longitude=polygon[0]["lon"]),
+                    Point(latitude=polygon[1]["lat"], longitude=polygon[1]["lon"]),
+                    Point(latitude=polygon[2]["lat"], longitude=polygon[2]["lon"]),
+                    Point(latitude=polygon[3]["lat"], longitude=polygon[3]["lon"]),
+                ]
+            )
+        return None
+
+    @staticmethod
+    def throughput(throughputdict: Optional[Dict[str, float]]):
+        """Returns a `Throughput` instance.
+
+        Assigns the `guaranteed` and `maximum`.
+        #### Args:
+            throughputDict (Dict[str, float]): A Throughput object with `guaranteed` and `maximum` values.
+        """
+        if throughputdict:
+            return Throughput(
+                guaranteed=throughputdict.get("guaranteed"),
+                maximum=throughputdict.get("maximum"),
+            )
+
+    @staticmethod
+    def fields_from_json(slice_json) -> dict:
+        """Returns the slice fields found in a response of the low-level API."""
+        return {
+            "state": slice_json["state"],
+            "name": slice_json["slice"]["name"],
+            "sid": slice_json.get("csi_id"),
+            "network_identifier": BaseSlice.network_identifier_from_dict(
+                slice_json["slice"]["networkIdentifier"]
+            ),
+            "slice_info": BaseSlice.slice_info_from_dict(slice_json["slice"]["sliceInfo"]),
+            "notification_url": slice_json["slice"]["notificationUrl"],
+            "area_of_service": BaseSlice.area_of_service_from_dict(
+                slice_json["slice"].get("areaOfService")
+            ),
+            "max_data_connections": slice_json["slice"].get("maxDataConnections"),
+            "max_devices": slice_json["slice"].get("maxDevices"),
+            "slice_downlink_throughput": BaseSlice.throughput(
+                slice_json["slice"].get("sliceDownlinkThroughput")
+            ),
+            "slice_uplink_throughput": BaseSlice.throughput(
+                slice_json["slice"].get("sliceUplinkThroughput")
+            ),
+            "device_downlink_throughput": BaseSlice.throughput(
+                slice_json["slice"].get("deviceDownlinkThroughput")
+            ),
+            "device_uplink_throughput": BaseSlice.throughput(
+                slice_json["slice"].get("deviceUplinkThroughput")
+            ),
+        }
+
+
+@dataclass(slots=True)
+class SliceRow:
+    """
+    A slice listed by `Slices.get_all(rows=True)`.
+
+    Holds the values of a `Slice` found in the listing, but they are not
+    validated, the attachments of the slice are not listed and the row
+    has none of the methods of the model.
+    """
+
+    state: str
+    name: str
+    sid: Optional[str]
+    network_identifier: NetworkIdentifier
+    slice_info: SliceInfo
+    notification_url: str
+    area_of_service: Optional[AreaOfService]
+    max_data_connections: Optional[int]
+    max_devices: Optional[int]
+    slice_downlink_throughput: Optional[Throughput]
+    slice_uplink_throughput: Optional[Throughput]
+    device_downlink_throughput: Optional[Throughput]
+    device_uplink_throughput: Optional[Throughput]
+
+    @staticmethod
+    def from_json(slice_json) -> "SliceRow":
+        """Returns a `SliceRow` for a slice listed by the low-level API"""
+        return SliceRow(**BaseSlice.fields_from_json(slice_json))
+
+
+class Slice(BaseSlice):
     """
     A class representing the `Slice` model.
 
     #### Private Attributes:
         _api(APIClient): An API client object.
         _sessions(List[Session]): List of device session instances.
-        _attachments(List[DeviceAttachment]): List of device attachments
+        _attachments(DeviceAttachments | None): Device attachments, None until loaded
 
     #### Public Attributes:
         sid (optional): String ID of the slice
@@ -178,44 +524,12 @@ class Slice(BaseModel, arbitrary_types_allowed=True):
     """
 
     _api: APIClient = PrivateAttr()
-    _sessions: List[QoDSession] = PrivateAttr()
-    sid: Optional[str] = None
-    state: str
-    name: str = Field(
-        default = '',
-        description="""Optional short name for the slice.
-        Must be ASCII characters, digits and dash. 
-        Like name of an event, such as "Concert-2029-Big-Arena".""",
-        min_length=4,
-        max_length=64,
-        pattern="^[a-zA-Z0-9][a-zA-Z0-9-]+[a-zA-Z0-9]$",
-    )
-    network_identifier: NetworkIdentifier
-    slice_info: SliceInfo
-    notification_url: str
-    notification_auth_token: Optional[str] = None
-    area_of_service: Optional[AreaOfService] = Field(
-        None, description="Area which the network slice is intended to serve"
-    )
-    max_data_connections: Optional[int] = Field(
-        None,
-        description="Maximum number of data connection sessions in the slice.",
-        ge=0,
-    )
-    max_devices: Optional[int] = Field(
-        None, description="Maximum number of devices using the slice.", ge=0
-    )
-    slice_downlink_throughput: Optional[Throughput] = None
-    slice_uplink_throughput: Optional[Throughput] = None
-    device_downlink_throughput: Optional[Throughput] = None
-    device_uplink_throughput: Optional[Throughput] = None
-    _attachments: List[DeviceAttachment] = PrivateAttr()
 
     def __init__(self, api: APIClient, **data) -> None:
         super().__init__(**data)
         self._api = api
         self._sessions = []
-        self._attachments = []
+        self._attachments = DeviceAttachments()
 
     def activate(self) -> None:
         """Activate network slice.
@@ -256,6 +570,17 @@ class Slice(BaseModel, arbitrary_types_allowed=True):
         """
         self._api.slicing.delete(self.name)
 
+    @property
+    def attachments(self) -> DeviceAttachments:
+        """Devices attached to the slice.
+
+        Slices fetched with `lazy_attachments=True` list their
+        attachments from the API on first access.
+        """
+        if self._attachments is None:
+            return self.set_attachments_from_listing(self._api.slice_attach.get_attachments().json())
+        return self._attachments
+
     def refresh(self) -> None:
         """Refresh state of the network slice.
 
@@ -274,16 +599,23 @@ class Slice(BaseModel, arbitrary_types_allowed=True):
             self,
             desired_state: Optional[str] = None,
             timeout: datetime.timedelta = datetime.timedelta(seconds=3600),
-            poll_backoff: datetime.timedelta = datetime.timedelta(seconds=10)
+            poll_backoff: datetime.timedelta = datetime.timedelta(seconds=10),
+            max_poll_backoff: datetime.timedelta = DEFAULT_MAX_POLL_BACKOFF,
     ) -> str:
         """Wait for an ongoing order to complete.
            I.e. not being in "PENDING" state.
            Returns new state.
 
+        The slice is refreshed in a worker thread, so waiting on many
+        slices at once with `asyncio.gather` doesn't block the event loop.
+        To wait on many slices, prefer `client.slices.wait_all`.
+
         #### Args:
             desired_state (str): if not provided, the AVAILABLE state will be returned.
             timeout (datetime.timedelta): Timeout of waiting. Default is 1h.
-            poll_backoff (datetime.timedelta): Backoff time between polling.
+            poll_backoff (datetime.timedelta): Initial backoff time between polling.
+            max_poll_backoff (datetime.timedelta): The backoff doubles after every poll
+            up to this limit. Default is 1min.
 
         #### Example:
             ```python
@@ -293,22 +625,13 @@ class Slice(BaseModel, arbitrary_types_allowed=True):
         if not desired_state:
             desired_state = "AVAILABLE"
 
-        poll_backoff_seconds = float(poll_backoff.total_seconds())
-        end = datetime.datetime.now() + timeout
-        while self.state != desired_state and datetime.datetime.now() < end:
-            await asyncio.sleep(poll_backoff_seconds)
-            self.refresh()
-        return self.state
+        async def refresh():
+            await asyncio.to_thread(self.refresh)
 
-    def set_attachments(self, attachments):
-        if len(attachments) > 0:
-            self._attachments = [
-                DeviceAttachment(
-                    device_phone_number=attachment["resource"]["device"]["phoneNumber"],
-                    attachment_id=attachment["nac_resource_id"],
-                )
-                for attachment in attachments
-            ]
+        await poll_until(
+            lambda: self.state == desired_state, refresh, timeout, poll_backoff, max_poll_backoff
+        )
+        return self.state
 
     def attach(
         self,
@@ -352,15 +675,11 @@ class Slice(BaseModel, arbitrary_types_allowed=True):
             notification_url,
             notification_auth_token,
         ).json()
+        self.forget_attachment_listing()
 
-        assert isinstance(device.phone_number, str)
-
-        self._attachments.append(
-            DeviceAttachment(
-                attachment_id=new_attachment["nac_resource_id"],
-                device_phone_number=device.phone_number,
-            )
-        )
+        # Attachments which are not loaded yet will include this one once they are
+        if self._attachments is not None:
+            self._attachments.add(DeviceAttachment.for_device(new_attachment["nac_resource_id"], device))
 
         return new_attachment
 
@@ -382,72 +701,209 @@ class Slice(BaseModel, arbitrary_types_allowed=True):
             slice.detach(device)
             ```
         """
-        attachment_id = fetch_and_remove(self._attachments, device)
-
-        if attachment_id:
-            self._api.slice_attach.detach(attachment_id)
-        else:
+        attachments = self.attachments
+        attachment = attachments.find(device)
+        if attachment is None:
             raise NotFound("Attachment not found")
 
-    @staticmethod
-    def network_identifier_from_dict(network_identifier_dict: Optional[Dict[str, str]]):
-        """Returns a `NetworkIdentifier` instance.
+        # Removed only once deleted, so that a failed detach can be retried
+        self._api.slice_attach.detach(attachment.attachment_id)
+        attachments.remove(attachment)
+        self.forget_attachment_listing()
+
+    def detach_many(
+        self, devices: Iterable[Device], concurrency: int = DEFAULT_CONCURRENCY
+    ) -> List[Tuple[Device, Optional[Exception]]]:
+        """Detach many devices from the network slice.
+
+        Up to `concurrency` attachments are deleted at a time. A device which
+        fails to detach is reported with its error, the rest are still detached.
 
-        Assigns the `mcc` and `mnc`.
         #### Args:
-            network_identifier_dict (Dict[str, str]): A Network Identifier object with `mcc` and `mnc` values.
+            devices (Iterable[Device]): Devices to detach
+            concurrency (int): Maximum number of requests in flight.
+
+        #### Example:
+            ```python
+            for device, error in slice.detach_many(devices, concurrency=20):
+                if error:
+                    print(f"{device.phone_number} failed: {error}")
+            ```
+        Returns: List of (Device, Exception | None) pairs in completion order
         """
-        if network_identifier_dict:
-            return NetworkIdentifier(
-                mcc=network_identifier_dict["mcc"], mnc=network_identifier_dict["mnc"]
-            )
+        def detach_attachment(target: Tuple[Device, Optional[DeviceAttachment]]) -> None:
+            if not target[1]:
+                raise NotFound("Attachment not found")
+            self._api.slice_attach.detach(target[1].attachment_id)
+
+        attachments = self.attachments
+        results: List[Tuple[Device, Optional[Exception]]] = []
+        # Results are consumed from the calling thread, so the attachments are never modified concurrently
+        for (device, attachment), outcome in run_bounded(
+            detach_attachment, find_attachments(attachments, devices), concurrency
+        ):
+            if attachment is not None and outcome is None:
+                attachments.remove(attachment)
+            results.append((device, outcome))
+        self.forget_attachment_listing()
+        return results
+
+
+class AsyncSlice(BaseSlice):
+    """
+    A class representing the `Slice` model, with methods to be awaited.
 
-    @staticmethod
-    def slice_info_from_dict(slice_info_dict: Optional[Dict[str, str]]):
-        """Returns a `SliceInfo` instance.
+    #### Private Attributes:
+        _api(AsyncAPIClient): An asyncio API client object.
+        _attachments(DeviceAttachments | None): Device attachments, None until loaded
 
-        Assigns the `service_type` and `differentiator`.
-        #### Args:
-            slice_info_dict (Dict[str, str]): A Slice Info object with `service_type` and `differentiator` values.
+    #### Public Attributes:
+        Same as `Slice`.
+
+    #### Public Methods:
+        Same as `Slice`, except that every method talking to the
+        Network as Code API is a coroutine.
+    """
+
+    _api: AsyncAPIClient = PrivateAttr()
+
+    def __init__(self, api: AsyncAPIClient, **data) -> None:
+        super().__init__(**data)
+        self._api = api
+        self._sessions = []
+        self._attachments = DeviceAttachments()
+
+    async def activate(self) -> None:
+        """Activate network slice."""
+        await self._api.slicing.activate(self.name)
+
+    async def deactivate(self) -> None:
+        """Deactivate network slice."""
+        await self._api.slicing.deactivate(self.name)
+
+    async def delete(self) -> None:
+        """Delete network slice."""
+        await self._api.slicing.delete(self.name)
+
+    @property
+    def attachments(self) -> Optional[DeviceAttachments]:
+        """Devices attached to the slice, None until `load_attachments` has been awaited
+        for slices fetched with `lazy_attachments=True`"""
+        return self._attachments
+
+    async def load_attachments(self) -> DeviceAttachments:
+        """Returns the devices attached to the slice, listing them from the API
+        if they have not been loaded yet."""
+        if self._attachments is None:
+            response = await self._api.slice_attach.get_attachments()
+            return self.set_attachments_from_listing(response.json())
+        return self._attachments
+
+    async def refresh(self) -> None:
+        """Refresh state of the network slice."""
+        slice_data = await self._api.slicing.get(self.name)
+        self.state = slice_data.json()["state"]
+
+    async def wait_for(
+            self,
+            desired_state: Optional[str] = None,
+            timeout: datetime.timedelta = datetime.timedelta(seconds=3600),
+            poll_backoff: datetime.timedelta = datetime.timedelta(seconds=10),
+            max_poll_backoff: datetime.timedelta = DEFAULT_MAX_POLL_BACKOFF,
+    ) -> str:
+        """Wait for an ongoing order to complete.
+           I.e. not being in "PENDING" state.
+           Returns new state.
+
+        Takes the same arguments as `Slice.wait_for`.
+
+        #### Example:
+            ```python
+            new_state = await slice.wait_for()
+            ```
         """
-        if slice_info_dict:
-            return SliceInfo(
-                service_type=str(slice_info_dict["serviceType"]),
-                differentiator=slice_info_dict.get("differentiator"),
-            )
+        if not desired_state:
+            desired_state = "AVAILABLE"
 
-    @staticmethod
-    def area_of_service_from_dict(
-        area_of_service_dict: Optional[Dict[str, List[Dict[str, float]]]]
-    ) -> Optional[AreaOfService]:
-        """Returns a `AreaOfService` instance.
+        await poll_until(
+            lambda: self.state == desired_state, self.refresh, timeout, poll_backoff, max_poll_backoff
+        )
+        return self.state
 
-        Assigns the `polygon`.
-        #### Args:
-            area_of_service_dict (Dict[str, List[Dict[str, float]]]): An Area Of Service object with polygon list value.
+    async def attach(
+        self,
+        device: BaseDevice,
+        customer: Union[Customer, None] = None,
+        traffic_categories: Union[TrafficCategories, None] = None,
+        notification_url: Union[str, None] = None,
+        notification_auth_token: Union[str, None] = None,
+    ):
+        """Attach network slice.
+
+        #### Example:
+            ```python
+            await slice.attach(device)
+            ```
         """
-        if area_of_service_dict:
-            polygon = area_of_service_dict["polygon"]
-            return AreaOfService(
-                polygon=[
-                    Point(latitude=polygon[0]["lat"], longitude=polygon[0]["lon"]),
-                    Point(latitude=polygon[1]["lat"], longitude=polygon[1]["lon"]),
-                    Point(latitude=polygon[2]["lat"], longitude=polygon[2]["lon"]),
-                    Point(latitude=polygon[3]["lat"], longitude=polygon[3]["lon"]),
-                ]
-            )
-        return None
+        response = await self._api.slice_attach.attach(
+            device,
+            customer,
+            self.name,
+            traffic_categories,
+            notification_url,
+            notification_auth_token,
+        )
+        new_attachment = response.json()
+        self.forget_attachment_listing()
 
-    @staticmethod
-    def throughput(throughputdict: Optional[Dict[str, float]]):
-        """Returns a `Throughput` instance.
+        # Attachments which are not loaded yet will include this one once they are
+        if self._attachments is not None:
+            self._attachments.add(DeviceAttachment.for_device(new_attachment["nac_resource_id"], device))
 
-        Assigns the `guaranteed` and `maximum`.
-        #### Args:
-            throughputDict (Dict[str, float]): A Throughput object with `guaranteed` and `maximum` values.
+        return new_attachment
+
+    async def detach(self, device: BaseDevice) -> None:
+        """Detach network slice.
+
+        #### Example:
+            ```python
+            await slice.detach(device)
+            ```
         """
-        if throughputdict:
-            return Throughput(
-                guaranteed=throughputdict.get("guaranteed"),
-                maximum=throughputdict.get("maximum"),
-            )
+        attachments = await self.load_attachments()
+        attachment = attachments.find(device)
+        if attachment is None:
+            raise NotFound("Attachment not found")
+
+        # Removed only once deleted, so that a failed detach can be retried
+        await self._api.slice_attach.detach(attachment.attachment_id)
+        attachments.remove(attachment)
+        self.forget_attachment_listing()
+
+    async def detach_many(
+        self, devices: Iterable[BaseDevice], concurrency: int = DEFAULT_CONCURRENCY
+    ) -> List[Tuple[BaseDevice, Optional[Exception]]]:
+        """Detach many devices from the network slice.
+
+        Takes the same arguments as `Slice.detach_many`.
+
+        #### Example:
+            ```python
+            results = await slice.detach_many(devices, concurrency=20)
+            ```
+        """
+        async def detach_attachment(target: Tuple[BaseDevice, Optional[DeviceAttachment]]) -> None:
+            if not target[1]:
+                raise NotFound("Attachment not found")
+            await self._api.slice_attach.detach(target[1].attachment_id)
+
+        attachments = await self.load_attachments()
+        results: List[Tuple[BaseDevice, Optional[Exception]]] = []
+        async for (device, attachment), outcome in async_run_bounded(
+            detach_attachment, find_attachments(attachments, devices), concurrency
+        ):
+            if attachment is not None and outcome is None:
+                attachments.remove(attachment)
+            results.append((device, outcome))
+        self.forget_attachment_listing()
+        return results
@@ -12,11 +12,37 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .namespace import Namespace
-from .device import Devices
-from .session import Sessions
-from .slice import Slices
-from .device_status import Connectivity
-from .insights import NetworkInsights
-from .geofencing import Geofencing
-from .authorization import Authorization
\ No newline at end of file
+
+from typing import TYPE_CHECKING
+
+from ..lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .namespace import Namespace, AsyncNamespace
+    from .device import Devices, AsyncDevices
+    from .session import Sessions, AsyncSessions
+    from .slice import Slices, AsyncSlices
+    from .device_status import Connectivity, AsyncConnectivity
+    from .insights import NetworkInsights, AsyncNetworkInsights
+    from .geofencing import Geofencing, AsyncGeofencing
+    from .authorization import Authorization, AsyncAuthorization
+
+# Submodules are imported when one of their names is first used
+__getattr__, __dir__ = lazy_exports(globals(), {
+    "Namespace": "namespace",
+    "AsyncNamespace": "namespace",
+    "Devices": "device",
+    "AsyncDevices": "device",
+    "Sessions": "session",
+    "AsyncSessions": "session",
+    "Slices": "slice",
+    "AsyncSlices": "slice",
+    "Connectivity": "device_status",
+    "AsyncConnectivity": "device_status",
+    "NetworkInsights": "insights",
+    "AsyncNetworkInsights": "insights",
+    "Geofencing": "geofencing",
+    "AsyncGeofencing": "geofencing",
+    "Authorization": "authorization",
+    "AsyncAuthorization": "authorization",
+})
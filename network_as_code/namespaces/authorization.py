@@ -15,9 +15,31 @@
 from typing import Optional, Union
 from urllib.parse import urlencode
 
-from . import Namespace
+from . import Namespace, AsyncNamespace
 from ..models.number_verification import Credentials, Endpoints
 
+
+def authentication_link(
+    credentials: Credentials,
+    auth_endpoint: Endpoints,
+    redirect_uri: str,
+    scope: str,
+    login_hint: Union[str, None],
+    state: Optional[str] = None,
+) -> str:
+    """Build the authentication link pointing to the authorization endpoint"""
+    response_type = "code"
+    params = {
+        "scope": scope,
+        "state": state,
+        "response_type": response_type,
+        "client_id": credentials.client_id,
+        "redirect_uri": redirect_uri,
+        "login_hint": login_hint
+    }
+    params = {k: v for k, v in params.items() if v is not None}
+    return f'{auth_endpoint.authorization_endpoint}?{urlencode(params)}'
+
 class Authorization(Namespace):
     """Gain essential components for authentication methods"""
 
@@ -71,15 +93,46 @@ class Authorization(Namespace):
 
         credentials = self.credentials()
         auth_endpoint = self.auth_endpoints()
-        response_type = "code"
-        params = {
-            "scope": scope,
-            "state": state,
-            "response_type": response_type,
-            "client_id": credentials.client_id,
-            "redirect_uri": redirect_uri,
-            "login_hint": login_hint
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-        auth_url = f'{auth_endpoint.authorization_endpoint}?{urlencode(params)}'
-        return auth_url
\ No newline at end of file
+        return authentication_link(credentials, auth_endpoint, redirect_uri, scope, login_hint, state)
+
+
+class AsyncAuthorization(AsyncNamespace):
+    """Gain essential components for authentication methods over asyncio"""
+
+    async def credentials(self) -> Credentials:
+        """Get client credentials
+
+        #### Returns:
+             Credentials object"""
+        body = await self.api.credentials.fetch_credentials()
+
+        return Credentials(
+            client_id=body["client_id"],
+            client_secret=body["client_secret"]
+        )
+
+    async def auth_endpoints(self) -> Endpoints:
+        """Get authorization endpoints
+
+        #### Returns:
+             Endpoints object"""
+        body = await self.api.authorization.fetch_endpoints()
+
+        return Endpoints(
+            authorization_endpoint=body["authorization_endpoint"],
+            token_endpoint=body["token_endpoint"]
+        )
+
+    async def create_authentication_link(self,
+                            redirect_uri: str,
+                            scope: str,
+                            login_hint: Union[str, None],
+                            state: Optional[str] = None,
+                            )-> str:
+        """Create authentication link for user
+
+        #### Returns:
+             authentication URL"""
+        credentials = await self.credentials()
+        auth_endpoint = await self.auth_endpoints()
+        return authentication_link(credentials, auth_endpoint, redirect_uri, scope, login_hint, state)
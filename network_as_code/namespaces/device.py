@@ -12,9 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Union
-from . import Namespace
-from ..models import Device, DeviceIpv4Addr
+from typing import AsyncIterator, Iterable, Iterator, Tuple, Union
+from . import Namespace, AsyncNamespace
+from ..api.bulk import DEFAULT_CONCURRENCY, async_run_bounded, run_bounded
+from ..models import Device, AsyncDevice, DeviceIpv4Addr, Location
+
+
+def normalize_ipv4_address(ipv4_address: Union[None, DeviceIpv4Addr]) -> Union[None, DeviceIpv4Addr]:
+    """Fill in the private address of a device which only has a public IPv4 address"""
+    # If the user only supplied a public IPv4 address without a public address or port, let's assume the
+    # device is not NAT'd and we can just rely on one IP
+    if ipv4_address and (ipv4_address.public_address
+                         and (not ipv4_address.private_address and not ipv4_address.public_port)):
+        ipv4_address.private_address = ipv4_address.public_address
+
+    return ipv4_address
 
 
 class Devices(Namespace):
@@ -55,18 +67,92 @@ class Devices(Namespace):
             [id, ipv4_address, ipv6_address, phone_number]
         ), "At least one parameter must be set."
 
-        # If the user only supplied a public IPv4 address without a public address or port, let's assume the
-        # device is not NAT'd and we can just rely on one IP
-        if ipv4_address and (ipv4_address.public_address
-                             and (not ipv4_address.private_address and not ipv4_address.public_port)):
-            ipv4_address.private_address = ipv4_address.public_address
-
         ret_device = Device(
             api=self.api,
             network_access_identifier=network_access_identifier,
-            ipv4_address=ipv4_address,
+            ipv4_address=normalize_ipv4_address(ipv4_address),
             ipv6_address=ipv6_address,
             phone_number=phone_number,
             imsi=imsi,
         )
         return ret_device
+
+    def locate_many(
+        self,
+        devices: Iterable[Device],
+        max_age: int = 60,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> Iterator[Tuple[Device, Union[Location, Exception]]]:
+        """Retrieve the location of many devices at once.
+
+        Up to `concurrency` location requests are kept in flight over the
+        shared connection pool. Results are streamed in completion order,
+        and a failing device yields its error instead of a `Location`,
+        leaving the rest of the batch running.
+
+        #### Args:
+            devices (Iterable[Device]): Devices to locate, consumed lazily.
+            max_age (int): Max acceptable age for location info in seconds
+            concurrency (int): Maximum number of requests in flight.
+
+        #### Example:
+            ```python
+            for device, location in client.devices.locate_many(devices, max_age=60, concurrency=20):
+                if isinstance(location, Exception):
+                    print(f"{device.phone_number} failed: {location}")
+            ```
+        Returns: Iterator of (Device, Location | Exception) pairs
+        """
+        return run_bounded(lambda device: device.location(max_age), devices, concurrency)
+
+
+class AsyncDevices(AsyncNamespace):
+    """Representation of a mobile subscription over asyncio."""
+
+    def get(
+        self,
+        network_access_identifier: Union[None, str] = None,
+        ipv4_address: Union[None, DeviceIpv4Addr]= None,
+        ipv6_address=None,
+        phone_number=None,
+        imsi=None,
+    ) -> AsyncDevice:
+        """Get a subscription by its external ID.
+
+        Takes the same arguments as `Devices.get`. Building the device
+        does not contact the API, so this method is not a coroutine.
+
+        Returns: AsyncDevice
+        """
+
+        assert any(
+            [network_access_identifier, ipv4_address, ipv6_address, phone_number]
+        ), "At least one parameter must be set."
+
+        return AsyncDevice(
+            api=self.api,
+            network_access_identifier=network_access_identifier,
+            ipv4_address=normalize_ipv4_address(ipv4_address),
+            ipv6_address=ipv6_address,
+            phone_number=phone_number,
+            imsi=imsi,
+        )
+
+    def locate_many(
+        self,
+        devices: Iterable[AsyncDevice],
+        max_age: int = 60,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> AsyncIterator[Tuple[AsyncDevice, Union[Location, Exception]]]:
+        """Retrieve the location of many devices at once.
+
+        Takes the same arguments as `Devices.locate_many`.
+
+        #### Example:
+            ```python
+            async for device, location in client.devices.locate_many(devices, concurrency=20):
+                ...
+            ```
+        Returns: Async iterator of (AsyncDevice, Location | Exception) pairs
+        """
+        return async_run_bounded(lambda device: device.location(max_age), devices, concurrency)
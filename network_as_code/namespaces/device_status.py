@@ -13,10 +13,22 @@
 # limitations under the License.
 
 from datetime import datetime
-from typing import List, Union, Optional
-from . import Namespace
-from ..models.device import Device
-from ..models.device_status import EventSubscription, EventType
+from typing import List, Literal, Union, Optional, overload
+from . import Namespace, AsyncNamespace
+from ..api.instrumentation import builds_models
+from ..models.device import Device, AsyncDevice
+from ..models.device_status import EventSubscription, AsyncEventSubscription, EventSubscriptionRow, EventType
+
+
+def event_subscription_fields(data: dict) -> dict:
+    """Returns the subscription fields found in a response of the low-level API."""
+    return {
+        "id": data["subscriptionId"],
+        "max_num_of_reports": data.get("maxNumberOfReports"),
+        "event_type": data['subscriptionDetail'].get("type"),
+        "notification_url": data["webhook"].get("notificationUrl"),
+        "notification_auth_token": data["webhook"].get("notificationAuthToken"),
+    }
 
 
 class Connectivity(Namespace):
@@ -26,6 +38,7 @@ class Connectivity(Namespace):
     device status can be configured and managed.
     """
 
+    @builds_models
     def subscribe(
         self,
         event_type: Union[EventType, str],
@@ -81,6 +94,7 @@ class Connectivity(Namespace):
 
         return connectivity_subscription
 
+    @builds_models
     def get_subscription(self, id: str) -> EventSubscription:
         """Retrieve a single Device Status event subscription by ID
 
@@ -97,9 +111,20 @@ class Connectivity(Namespace):
 
         return self.__parse_event_subscription(connectivity_data)
 
-    def get_subscriptions(self) -> List[EventSubscription]:
+    @overload
+    def get_subscriptions(self, rows: Literal[False] = False) -> List[EventSubscription]: ...
+
+    @overload
+    def get_subscriptions(self, rows: Literal[True]) -> List[EventSubscriptionRow]: ...
+
+    @builds_models
+    def get_subscriptions(self, rows: bool = False) -> Union[List[EventSubscription], List[EventSubscriptionRow]]:
         """Retrieve list of active Device Status Subscriptions
 
+        #### Args:
+            rows (bool): List the subscriptions as `EventSubscriptionRow` objects, which
+            are faster to build than the models, but not validated and without methods.
+
         #### Example:
              '''python
              subscriptions = client.connectivity.get_subscriptions()
@@ -109,6 +134,14 @@ class Connectivity(Namespace):
         """
         json = self.api.devicestatus.get_subscriptions()
 
+        if rows:
+            return [
+                EventSubscriptionRow(
+                    device=Device.convert_to_device_model(self.api, data["subscriptionDetail"]["device"]),
+                    **event_subscription_fields(data),
+                )
+                for data in json
+            ]
         return list(map(self.__parse_event_subscription, json))
 
     def __parse_event_subscription(self, data: dict) -> EventSubscription:
@@ -117,11 +150,96 @@ class Connectivity(Namespace):
         device = Device.convert_to_device_model(self.api, device_data)
 
         return EventSubscription(
-            id=data["subscriptionId"],
             api=self.api,
-            max_num_of_reports=data.get("maxNumberOfReports"),
-            event_type=data['subscriptionDetail'].get("type"),
-            notification_url=data["webhook"].get("notificationUrl"),
-            notification_auth_token=data["webhook"].get("notificationAuthToken"),
             device=device,
+            **event_subscription_fields(data),
+        )
+
+
+class AsyncConnectivity(AsyncNamespace):
+    """Representation of the status of a device over asyncio."""
+
+    @builds_models
+    async def subscribe(
+        self,
+        event_type: Union[EventType, str],
+        notification_url: str,
+        device: AsyncDevice,
+        max_num_of_reports: Optional[int] = None,
+        notification_auth_token: Optional[str] = None,
+        subscription_expire_time: Union[datetime, str, None] = None,
+    ) -> AsyncEventSubscription:
+        """Create subscription for device connectivity status.
+
+        Takes the same arguments as `Connectivity.subscribe`.
+
+        Returns: AsyncEventSubscription
+        """
+        if isinstance(subscription_expire_time, datetime):
+            subscription_expire_time = subscription_expire_time.isoformat()
+
+        if isinstance(event_type, EventType):
+            event_type = event_type.value
+
+        connectivity_data = await self.api.devicestatus.create_subscription(
+            device,
+            event_type,
+            notification_url,
+            notification_auth_token,
+            max_num_of_reports,
+            subscription_expire_time,
+        )
+
+        return AsyncEventSubscription(
+            id=connectivity_data["subscriptionId"],
+            api=self.api,
+            max_num_of_reports=max_num_of_reports,
+            event_type=event_type,
+            notification_url=notification_url,
+            notification_auth_token=notification_auth_token,
+            device=device,
+            starts_at=connectivity_data.get("startsAt"),
+            expires_at=connectivity_data.get("expiresAt"),
+        )
+
+    @builds_models
+    async def get_subscription(self, id: str) -> AsyncEventSubscription:
+        """Retrieve a single Device Status event subscription by ID"""
+        connectivity_data = await self.api.devicestatus.get_subscription(id)
+
+        return self.__parse_event_subscription(connectivity_data)
+
+    @overload
+    async def get_subscriptions(self, rows: Literal[False] = False) -> List[AsyncEventSubscription]: ...
+
+    @overload
+    async def get_subscriptions(self, rows: Literal[True]) -> List[EventSubscriptionRow]: ...
+
+    @builds_models
+    async def get_subscriptions(
+        self, rows: bool = False
+    ) -> Union[List[AsyncEventSubscription], List[EventSubscriptionRow]]:
+        """Retrieve list of active Device Status Subscriptions
+
+        Takes the same arguments as `Connectivity.get_subscriptions`.
+        """
+        json = await self.api.devicestatus.get_subscriptions()
+
+        if rows:
+            return [
+                EventSubscriptionRow(
+                    device=AsyncDevice.convert_to_device_model(self.api, data["subscriptionDetail"]["device"]),
+                    **event_subscription_fields(data),
+                )
+                for data in json
+            ]
+        return list(map(self.__parse_event_subscription, json))
+
+    def __parse_event_subscription(self, data: dict) -> AsyncEventSubscription:
+        device = AsyncDevice.convert_to_device_model(self.api, data["subscriptionDetail"]["device"])
+
+        return AsyncEventSubscription(
+            api=self.api,
+            device=device,
+            **event_subscription_fields(data),
         )
@@ -12,14 +12,34 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Union, Optional
+from typing import List, Literal, Union, Optional, overload
 from datetime import datetime
-from . import Namespace
-from ..models.device import Device
-from ..models.geofencing import GeofencingSubscription, PlainCredential, AccessTokenCredential, EventType
+from . import Namespace, AsyncNamespace
+from ..api.instrumentation import builds_models
+from ..models.device import Device, AsyncDevice
+from ..models.geofencing import (
+    GeofencingSubscription,
+    AsyncGeofencingSubscription,
+    GeofencingSubscriptionRow,
+    PlainCredential,
+    AccessTokenCredential,
+    EventType,
+)
+
+
+def event_type_values(types: Union[List[EventType] | List[str]]) -> List[str]:
+    """Convert a list of event types to their string values"""
+    typelist = []
+    for item in types:
+        if isinstance(item, EventType):
+            typelist.append(item.value)
+        else:
+            typelist.append(item)
+    return typelist
 
 class Geofencing(Namespace):
 
+    @builds_models
     def subscribe(
         self, device: Device,
         sink: str,
@@ -39,12 +59,7 @@ class Geofencing(Namespace):
             else subscription_expire_time
         )
 
-        typelist = []
-        for item in types:
-            if isinstance(item, EventType):
-                typelist.append(item.value)
-            else:
-                typelist.append(item)
+        typelist = event_type_values(types)
 
         json_data = self.api.geofencing.create_subscription(
             device,
@@ -61,14 +76,93 @@ class Geofencing(Namespace):
 
         return GeofencingSubscription.from_json(self.api, json_data)
 
+    @builds_models
     def get(self, subscription_id:str) -> GeofencingSubscription:
 
         json_data = self.api.geofencing.get_subscription(subscription_id)
 
         return GeofencingSubscription.from_json(self.api, json_data)
 
-    def get_all(self) -> List[GeofencingSubscription]:
+    @overload
+    def get_all(self, rows: Literal[False] = False) -> List[GeofencingSubscription]: ...
+
+    @overload
+    def get_all(self, rows: Literal[True]) -> List[GeofencingSubscriptionRow]: ...
 
+    @builds_models
+    def get_all(self, rows: bool = False) -> Union[List[GeofencingSubscription], List[GeofencingSubscriptionRow]]:
+        """Retrieve list of active Geofencing subscriptions
+
+        #### Args:
+            rows (bool): List the subscriptions as `GeofencingSubscriptionRow` objects, which
+            are faster to build than the models, but not validated and without methods.
+        """
         json_data = self.api.geofencing.get_subscriptions()
 
+        if rows:
+            return [GeofencingSubscriptionRow.from_json(json_object) for json_object in json_data]
         return list(map(lambda json_object: GeofencingSubscription.from_json(self.api, json_object), json_data))
+
+
+class AsyncGeofencing(AsyncNamespace):
+
+    @builds_models
+    async def subscribe(
+        self, device: AsyncDevice,
+        sink: str,
+        types: Union[List[EventType] | List[str]],
+        latitude: float,
+        longitude: float,
+        radius: Union[int, float],
+        sink_credential: Union[PlainCredential, AccessTokenCredential, None] = None,
+        subscription_expire_time: Union[datetime , str, None] = None,
+        subscription_max_events: Optional[int] = None,
+        initial_event: Optional[bool] = None,
+    ) -> AsyncGeofencingSubscription:
+
+        if isinstance(subscription_expire_time, datetime):
+            subscription_expire_time = subscription_expire_time.isoformat()
+
+        typelist = event_type_values(types)
+
+        json_data = await self.api.geofencing.create_subscription(
+            device,
+            sink,
+            typelist,
+            latitude,
+            longitude,
+            radius,
+            sink_credential,
+            subscription_expire_time,
+            subscription_max_events,
+            initial_event,
+        )
+
+        return AsyncGeofencingSubscription.from_json(self.api, json_data)
+
+    @builds_models
+    async def get(self, subscription_id:str) -> AsyncGeofencingSubscription:
+
+        json_data = await self.api.geofencing.get_subscription(subscription_id)
+
+        return AsyncGeofencingSubscription.from_json(self.api, json_data)
+
+    @overload
+    async def get_all(self, rows: Literal[False] = False) -> List[AsyncGeofencingSubscription]: ...
+
+    @overload
+    async def get_all(self, rows: Literal[True]) -> List[GeofencingSubscriptionRow]: ...
+
+    @builds_models
+    async def get_all(
+        self, rows: bool = False
+    ) -> Union[List[AsyncGeofencingSubscription], List[GeofencingSubscriptionRow]]:
+        """Retrieve list of active Geofencing subscriptions
+
+        Takes the same arguments as `Geofencing.get_all`.
+        """
+        json_data = await self.api.geofencing.get_subscriptions()
+
+        if rows:
+            return [GeofencingSubscriptionRow.from_json(json_object) for json_object in json_data]
+        return [AsyncGeofencingSubscription.from_json(self.api, json_object) for json_object in json_data]
@@ -13,15 +13,17 @@
 # limitations under the License.
 
 from datetime import datetime
-from typing import List, Union, Optional
-from . import Namespace
-from ..models.device import Device
-from ..models.congestion import CongestionSubscription
+from typing import List, Literal, Union, Optional, overload
+from . import Namespace, AsyncNamespace
+from ..api.instrumentation import builds_models
+from ..models.device import Device, AsyncDevice
+from ..models.congestion import CongestionSubscription, AsyncCongestionSubscription, CongestionSubscriptionRow
 
 
 class NetworkInsights(Namespace):
     """Gain insights from network analytics"""
 
+    @builds_models
     def subscribe_to_congestion_info(
         self,
         device: Device,
@@ -50,6 +52,7 @@ class NetworkInsights(Namespace):
 
         return self._parse_congestion_subscription(json_data)
 
+    @builds_models
     def get_congestion_subscription(self, subscription_id: str) -> CongestionSubscription:
         """Retrieve an active congestion subscription by id
 
@@ -61,28 +64,95 @@ class NetworkInsights(Namespace):
 
         return self._parse_congestion_subscription(json_data)
 
-    def get_congestion_subscriptions(self) -> List[CongestionSubscription]:
+    @overload
+    def get_congestion_subscriptions(self, rows: Literal[False] = False) -> List[CongestionSubscription]: ...
+
+    @overload
+    def get_congestion_subscriptions(self, rows: Literal[True]) -> List[CongestionSubscriptionRow]: ...
+
+    @builds_models
+    def get_congestion_subscriptions(
+        self, rows: bool = False
+    ) -> Union[List[CongestionSubscription], List[CongestionSubscriptionRow]]:
         """Retrieve list of all active congestion subscriptions
 
+        #### Args:
+             rows (bool): List the subscriptions as `CongestionSubscriptionRow` objects, which
+             are faster to build than the models, but not validated and without methods.
         #### Returns:
              List of Subscription objects"""
 
         json_data = self.api.congestion.get_subscriptions()
 
+        if rows:
+            return [CongestionSubscriptionRow.from_json(subscription) for subscription in json_data]
         return list(map(self._parse_congestion_subscription, json_data))
 
     def _parse_congestion_subscription(self, json_data) -> CongestionSubscription:
         return CongestionSubscription(
             api=self.api,
-            id=json_data.get("subscriptionId"),
-            starts_at=(
-                datetime.fromisoformat(json_data.get("startedAt"))
-                if json_data.get("startedAt")
-                else None
-            ),
-            expires_at=(
-                datetime.fromisoformat(json_data.get("expiresAt"))
-                if json_data.get("expiresAt")
-                else None
-            )
+            **CongestionSubscription.fields_from_json(json_data),
+        )
+
+
+class AsyncNetworkInsights(AsyncNamespace):
+    """Gain insights from network analytics over asyncio"""
+
+    @builds_models
+    async def subscribe_to_congestion_info(
+        self,
+        device: AsyncDevice,
+        notification_url: str,
+        subscription_expire_time: Union[datetime, str],
+        notification_auth_token: Optional[str] = None,
+    ) -> AsyncCongestionSubscription:
+        """Subscribe to congestion notifications
+
+        #### Returns:
+             Subscription object"""
+        subscription_expire_time = (
+            subscription_expire_time.isoformat()
+            if isinstance(subscription_expire_time, datetime)
+            else subscription_expire_time
+        )
+
+        json_data = await self.api.congestion.subscribe(
+            device, notification_url, subscription_expire_time, notification_auth_token
+        )
+
+        return self._parse_congestion_subscription(json_data)
+
+    @builds_models
+    async def get_congestion_subscription(self, subscription_id: str) -> AsyncCongestionSubscription:
+        """Retrieve an active congestion subscription by id"""
+        json_data = await self.api.congestion.get_subscription(subscription_id)
+
+        return self._parse_congestion_subscription(json_data)
+
+    @overload
+    async def get_congestion_subscriptions(
+        self, rows: Literal[False] = False
+    ) -> List[AsyncCongestionSubscription]: ...
+
+    @overload
+    async def get_congestion_subscriptions(self, rows: Literal[True]) -> List[CongestionSubscriptionRow]: ...
+
+    @builds_models
+    async def get_congestion_subscriptions(
+        self, rows: bool = False
+    ) -> Union[List[AsyncCongestionSubscription], List[CongestionSubscriptionRow]]:
+        """Retrieve list of all active congestion subscriptions
+
+        Takes the same arguments as `NetworkInsights.get_congestion_subscriptions`.
+        """
+        json_data = await self.api.congestion.get_subscriptions()
+
+        if rows:
+            return [CongestionSubscriptionRow.from_json(subscription) for subscription in json_data]
+        return list(map(self._parse_congestion_subscription, json_data))
+
+    def _parse_congestion_subscription(self, json_data) -> AsyncCongestionSubscription:
+        return AsyncCongestionSubscription(
+            api=self.api,
+            **AsyncCongestionSubscription.fields_from_json(json_data),
         )
@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from abc import ABC
-from ..api import APIClient
+from ..api import APIClient, AsyncAPIClient
 
 
 class Namespace(ABC):
@@ -22,3 +22,11 @@ class Namespace(ABC):
     def __init__(self, api: APIClient):
         # An APIClient object which provides access to the Network as Code API.
         self.api = api
+
+
+class AsyncNamespace(ABC):
+    """A base class for representing a single resource instance over asyncio."""
+
+    def __init__(self, api: AsyncAPIClient):
+        # An AsyncAPIClient object which provides access to the Network as Code API.
+        self.api = api
@@ -12,9 +12,48 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from . import Namespace
-from ..models import QoDSession
-from ..models import Device
+from typing import Iterable, Union
+from . import Namespace, AsyncNamespace
+from ..api.bulk import DEFAULT_CONCURRENCY, async_run_bounded, run_bounded
+from ..api.instrumentation import builds_models
+from ..models import QoDSession, AsyncQoDSession, SessionResult, SessionReport
+from ..models import Device, AsyncDevice
+from ..models.session import PortsSpec
+
+
+def session_options(
+    profile, duration, service_ipv4, service_ipv6,
+    device_ports, service_ports, notification_url, notification_auth_token,
+) -> dict:
+    """Collect the `create_qod_session` arguments shared by every device of a batch"""
+    # Reject the batch up front instead of failing it for every device
+    if not service_ipv4 and not service_ipv6:
+        raise ValueError("At least one of IP parameters must be provided")
+
+    return {
+        "profile": profile,
+        "duration": duration,
+        "service_ipv4": service_ipv4,
+        "service_ipv6": service_ipv6,
+        "device_ports": device_ports,
+        "service_ports": service_ports,
+        "notification_url": notification_url,
+        "notification_auth_token": notification_auth_token,
+    }
+
+
+def created_result(device, outcome) -> SessionResult:
+    if isinstance(outcome, Exception):
+        return SessionResult(device=device, error=outcome)
+    return SessionResult(device=device, session=outcome)
+
+
+def deleted_result(session, outcome) -> SessionResult:
+    return SessionResult(
+        device=session.device,
+        session=session,
+        error=outcome if isinstance(outcome, Exception) else None,
+    )
 
 
 class Sessions(Namespace):
@@ -24,6 +63,7 @@ class Sessions(Namespace):
     subscription can be configured on the network.
     """
 
+    @builds_models
     def get(self, id: str) -> QoDSession:
         """Get a QoS Session by its ID.
 
@@ -34,4 +74,130 @@ class Sessions(Namespace):
         device_json = session_object.json()['device']
         device = Device.convert_to_device_model(self.api, device_json)
         return QoDSession.convert_session_model(self.api, device, session_object.json())
-    
\ No newline at end of file
+
+    def create_many(
+        self,
+        devices: Iterable[Device],
+        profile: str,
+        duration: int,
+        service_ipv4=None,
+        service_ipv6=None,
+        device_ports: Union[None, PortsSpec] = None,
+        service_ports: Union[None, PortsSpec] = None,
+        notification_url=None,
+        notification_auth_token=None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> SessionReport:
+        """Create a QoD session with the same parameters for many devices.
+
+        Up to `concurrency` sessions are created at a time over the shared
+        connection pool. A device for which the creation fails is recorded
+        in the report and does not stop the rest of the batch.
+
+        #### Args:
+            devices (Iterable[Device]): Devices to create a session for.
+            concurrency (int): Maximum number of requests in flight.
+            The rest of the arguments are the same as in `Device.create_qod_session`.
+
+        #### Example:
+            ```python
+            report = client.sessions.create_many(devices, profile="QOS_L",
+            duration=3600, service_ipv4="5.6.7.8", concurrency=50)
+            for result in report.failed:
+                print(result.device.phone_number, result.error)
+            ```
+        Returns: SessionReport
+        """
+        options = session_options(
+            profile, duration, service_ipv4, service_ipv6,
+            device_ports, service_ports, notification_url, notification_auth_token,
+        )
+
+        def create(device: Device) -> QoDSession:
+            return device.create_qod_session(**options)
+
+        return SessionReport(results=[
+            created_result(device, outcome)
+            for device, outcome in run_bounded(create, devices, concurrency)
+        ])
+
+    def delete_many(
+        self, sessions: Iterable[QoDSession], concurrency: int = DEFAULT_CONCURRENCY
+    ) -> SessionReport:
+        """Delete many QoD sessions, up to `concurrency` at a time.
+
+        #### Args:
+            sessions (Iterable[QoDSession]): Sessions to delete.
+            concurrency (int): Maximum number of requests in flight.
+
+        #### Example:
+            ```python
+            client.sessions.delete_many(result.session for result in report.succeeded)
+            ```
+        Returns: SessionReport
+        """
+        return SessionReport(results=[
+            deleted_result(session, outcome)
+            for session, outcome in run_bounded(lambda session: session.delete(), sessions, concurrency)
+        ])
+
+
+class AsyncSessions(AsyncNamespace):
+    """Representation of QoD sessions over asyncio."""
+
+    @builds_models
+    async def get(self, id: str) -> AsyncQoDSession:
+        """Get a QoS Session by its ID.
+
+        Args:
+            id (str): ID of the QoS Session
+        """
+        session_object = await self.api.sessions.get_session(id)
+        device = AsyncDevice.convert_to_device_model(self.api, session_object.json()['device'])
+        return AsyncQoDSession.convert_session_model(self.api, device, session_object.json())
+
+    async def create_many(
+        self,
+        devices: Iterable[AsyncDevice],
+        profile: str,
+        duration: int,
+        service_ipv4=None,
+        service_ipv6=None,
+        device_ports: Union[None, PortsSpec] = None,
+        service_ports: Union[None, PortsSpec] = None,
+        notification_url=None,
+        notification_auth_token=None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> SessionReport:
+        """Create a QoD session with the same parameters for many devices.
+
+        Takes the same arguments as `Sessions.create_many`.
+
+        Returns: SessionReport
+        """
+        options = session_options(
+            profile, duration, service_ipv4, service_ipv6,
+            device_ports, service_ports, notification_url, notification_auth_token,
+        )
+
+        async def create(device: AsyncDevice) -> AsyncQoDSession:
+            return await device.create_qod_session(**options)
+
+        return SessionReport(results=[
+            created_result(device, outcome)
+            async for device, outcome in async_run_bounded(create, devices, concurrency)
+        ])
+
+    async def delete_many(
+        self, sessions: Iterable[AsyncQoDSession], concurrency: int = DEFAULT_CONCURRENCY
+    ) -> SessionReport:
+        """Delete many QoD sessions, up to `concurrency` at a time.
+
+        Returns: SessionReport
+        """
+        return SessionReport(results=[
+            deleted_result(session, outcome)
+            async for session, outcome in async_run_bounded(
+                lambda session: session.delete(), sessions, concurrency
+            )
+        ])
@@ -12,17 +12,51 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Optional, Union
+import asyncio
+import datetime
+from typing import Dict, List, Literal, Optional, Sequence, Union, overload
 
-from . import Namespace
+from . import Namespace, AsyncNamespace
 from ..models.slice import (
+    DEFAULT_MAX_POLL_BACKOFF,
+    BaseSlice,
     Slice,
+    AsyncSlice,
+    SliceRow,
     NetworkIdentifier,
     SliceInfo,
     Throughput,
     AreaOfService,
+    poll_until,
 )
 from ..api import Throughput as ApiThroughput
+from ..api.instrumentation import builds_models
+
+
+def to_api_throughput(throughput: Optional[Throughput]) -> Optional[ApiThroughput]:
+    if throughput is None:
+        return None
+    return ApiThroughput(guaranteed=throughput.guaranteed, maximum=throughput.maximum)
+
+
+# Key of the attachment listing in the cache of the client
+ATTACHMENT_INDEX_KEY = "attachments"
+
+
+def index_attachments(attachments: list) -> Dict[str, list]:
+    """Group a list of all attachments by the name of the slice they belong to"""
+    index: Dict[str, list] = {}
+    for attachment in attachments:
+        index.setdefault(attachment["resource"]["sliceId"], []).append(attachment)
+    return index
+
+
+def update_slice_states(slices: Sequence[BaseSlice], slice_data: list):
+    """Update the state of the given slices from a listing of all slices"""
+    states = {slice_json["slice"]["name"]: slice_json["state"] for slice_json in slice_data}
+    for slice_instance in slices:
+        if slice_instance.name in states:
+            slice_instance.state = states[slice_instance.name]
 
 
 class Slices(Namespace):
@@ -33,10 +67,14 @@ class Slices(Namespace):
     """
 
     def _to_api_throughput(self, throughput: Optional[Throughput]) -> Optional[ApiThroughput]:
-        if throughput is None:
-            return None
-        return ApiThroughput(guaranteed=throughput.guaranteed, maximum=throughput.maximum)
+        return to_api_throughput(throughput)
 
+    def _fetch_attachment_index(self) -> Dict[str, list]:
+        index = index_attachments(self.api.slice_attach.get_attachments().json())
+        self.api.attachment_index.set(ATTACHMENT_INDEX_KEY, index)
+        return index
+
+    @builds_models
     def create(
         self,
         network_id: NetworkIdentifier,
@@ -127,11 +165,19 @@ class Slices(Namespace):
 
         return new_slice
 
-    def get(self, id: str) -> Union[Slice, None]:
+    @builds_models
+    def get(
+        self, id: str, cached_attachments: bool = False, lazy_attachments: bool = False
+    ) -> Union[Slice, None]:
         """Get network slice by id.
 
         #### Args:
             id (str): Resource id.
+            cached_attachments (bool): Reuse the attachments listed by a `get` or `get_all`
+            call within the last minute instead of listing them again. Attaching or
+            detaching a device lists them again.
+            lazy_attachments (bool): List the attachments of the slice only when
+            they are first used.
 
         #### Example:
             ```python
@@ -139,52 +185,36 @@ class Slices(Namespace):
             ```
         """
         slice_data = self.api.slicing.get(id).json()
-        existing_slice = Slice(
-            api=self.api,
-            sid=slice_data.get("csi_id"),
-            state=slice_data["state"],
-            name=slice_data["slice"]["name"],
-            network_identifier=Slice.network_identifier_from_dict(
-                slice_data["slice"]["networkIdentifier"]
-            ),
-            notification_url=slice_data["slice"]["notificationUrl"],
-            slice_info=Slice.slice_info_from_dict(slice_data["slice"]["sliceInfo"]),
-            area_of_service=Slice.area_of_service_from_dict(
-                slice_data["slice"].get("areaOfService")
-            ),
-            max_data_connections=slice_data["slice"].get("maxDataConnections"),
-            max_devices=slice_data["slice"].get("maxDevices"),
-            slice_downlink_throughput=Slice.throughput(
-                slice_data["slice"].get("sliceDownlinkThroughput")
-            ),
-            slice_uplink_throughput=Slice.throughput(
-                slice_data["slice"].get("sliceUplinkThroughput")
-            ),
-            device_downlink_throughput=Slice.throughput(
-                slice_data["slice"].get("deviceDownlinkThroughput")
-            ),
-            device_uplink_throughput=Slice.throughput(
-                slice_data["slice"].get("deviceUplinkThroughput")
-            ),
-        )
+        existing_slice = Slice(api=self.api, **Slice.fields_from_json(slice_data))
 
-        attachments = self.api.slice_attach.get_attachments().json()
+        index = self.api.attachment_index.get(ATTACHMENT_INDEX_KEY) if cached_attachments else None
+        if lazy_attachments and index is None:
+            existing_slice.defer_attachments()
+            return existing_slice
 
-        slice_attachments = [
-            attachment
-            for attachment in attachments
-            if attachment["resource"]["sliceId"] == existing_slice.name
-        ]
+        if index is None:
+            index = self._fetch_attachment_index()
 
-        existing_slice.set_attachments(slice_attachments)
+        existing_slice.set_attachments(index.get(existing_slice.name, []))
 
         return existing_slice
 
-    def get_all(self) -> List[Slice]:
+    @overload
+    def get_all(self, lazy_attachments: bool = False, rows: Literal[False] = False) -> List[Slice]: ...
+
+    @overload
+    def get_all(self, lazy_attachments: bool = False, *, rows: Literal[True]) -> List[SliceRow]: ...
+
+    @builds_models
+    def get_all(self, lazy_attachments: bool = False, rows: bool = False) -> Union[List[Slice], List[SliceRow]]:
         """Get All slices by id.
 
         #### Args:
-            None
+            lazy_attachments (bool): Skip listing the attachments, each slice
+            lists its own attachments when they are first used.
+            rows (bool): List the slices as `SliceRow` objects, which are faster
+            to build than the models, but not validated and without methods.
+            Their attachments are never listed.
 
         #### Example:
             ```python
@@ -192,11 +222,57 @@ class Slices(Namespace):
             ```
         """
         slice_data = self.api.slicing.get_all()
+        if rows:
+            return [SliceRow.from_json(slice_json) for slice_json in slice_data.json()]
+        index = None if lazy_attachments else self._fetch_attachment_index()
 
-        slices = [self._convert_to_slice_model(slice_json) for slice_json in slice_data.json()]
+        slices = [self._convert_to_slice_model(slice_json, index) for slice_json in slice_data.json()]
 
         return slices
 
+    async def wait_all(
+        self,
+        slices: Sequence[Slice],
+        desired_state: Optional[str] = None,
+        timeout: datetime.timedelta = datetime.timedelta(seconds=3600),
+        poll_backoff: datetime.timedelta = datetime.timedelta(seconds=10),
+        max_poll_backoff: datetime.timedelta = DEFAULT_MAX_POLL_BACKOFF,
+    ) -> List[str]:
+        """Wait for many slices to reach a state.
+
+        Instead of polling every slice separately, all slices are listed
+        with a single request per poll.
+
+        #### Args:
+            slices (Sequence[Slice]): Slices to wait for.
+            desired_state (str): if not provided, the AVAILABLE state is waited for.
+            timeout (datetime.timedelta): Timeout of waiting. Default is 1h.
+            poll_backoff (datetime.timedelta): Initial backoff time between polling.
+            max_poll_backoff (datetime.timedelta): The backoff doubles after every poll
+            up to this limit. Default is 1min.
+
+        #### Example:
+            ```python
+            states = await nac_client.slices.wait_all(slices, desired_state="OPERATING")
+            ```
+        Returns: The new states of the slices, in the given order
+        """
+        if not desired_state:
+            desired_state = "AVAILABLE"
+
+        async def refresh():
+            slice_data = await asyncio.to_thread(self.api.slicing.get_all)
+            update_slice_states(slices, slice_data.json())
+
+        await poll_until(
+            lambda: all(slice_instance.state == desired_state for slice_instance in slices),
+            refresh,
+            timeout,
+            poll_backoff,
+            max_poll_backoff,
+        )
+        return [slice_instance.state for slice_instance in slices]
+
     def get_attachment(self, id: str) -> None:
         """Get Application Attachment Instance
 
@@ -223,44 +299,194 @@ class Slices(Namespace):
         """
         return self.api.slice_attach.get_attachments().json()
 
-    def _convert_to_slice_model(self, slice_json):
-        slice_instance = Slice(
+    def _convert_to_slice_model(self, slice_json, attachment_index: Optional[Dict[str, list]]):
+        slice_instance = Slice(api=self.api, **Slice.fields_from_json(slice_json))
+
+        if attachment_index is None:
+            slice_instance.defer_attachments()
+        else:
+            slice_instance.set_attachments(attachment_index.get(slice_instance.name, []))
+
+        return slice_instance
+
+
+class AsyncSlices(AsyncNamespace):
+    """Representation of a 5G network slice over asyncio.
+
+    Takes the same arguments as `Slices`, but every method
+    talking to the Network as Code API is a coroutine.
+    """
+
+    async def _fetch_attachment_index(self) -> Dict[str, list]:
+        index = index_attachments((await self.api.slice_attach.get_attachments()).json())
+        self.api.attachment_index.set(ATTACHMENT_INDEX_KEY, index)
+        return index
+
+    @builds_models
+    async def create(
+        self,
+        network_id: NetworkIdentifier,
+        slice_info: SliceInfo,
+        notification_url: str,
+        area_of_service: Optional[AreaOfService] = None,
+        name: Optional[str] = None,
+        notification_auth_token: Optional[str] = None,
+        slice_downlink_throughput: Optional[Throughput] = None,
+        slice_uplink_throughput: Optional[Throughput] = None,
+        device_downlink_throughput: Optional[Throughput] = None,
+        device_uplink_throughput: Optional[Throughput] = None,
+        max_data_connections: Optional[int] = None,
+        max_devices: Optional[int] = None,
+    ) -> AsyncSlice:
+        """Create a slice with its network identifier, slice info, area of service, and notification url.
+
+        #### Example:
+        ```python
+        new_slice = await nac_client.slices.create(
+            network_id = network_id,
+            slice_info = slice_info,
+            notification_url = notification_url
+        )
+        ```
+        """
+        new_slice = AsyncSlice(
             api=self.api,
-            state=slice_json["state"],
-            name=slice_json["slice"]["name"],
-            sid=slice_json.get("csi_id"),
-            network_identifier=Slice.network_identifier_from_dict(
-                slice_json["slice"]["networkIdentifier"]
-            ),
-            slice_info=Slice.slice_info_from_dict(slice_json["slice"]["sliceInfo"]),
-            notification_url=slice_json["slice"]["notificationUrl"],
-            area_of_service=Slice.area_of_service_from_dict(
-                slice_json["slice"].get("areaOfService")
-            ),
-            max_data_connections=slice_json["slice"].get("maxDataConnections"),
-            max_devices=slice_json["slice"].get("maxDevices"),
-            slice_downlink_throughput=Slice.throughput(
-                slice_json["slice"].get("sliceDownlinkThroughput")
-            ),
-            slice_uplink_throughput=Slice.throughput(
-                slice_json["slice"].get("sliceUplinkThroughput")
-            ),
-            device_downlink_throughput=Slice.throughput(
-                slice_json["slice"].get("deviceDownlinkThroughput")
-            ),
-            device_uplink_throughput=Slice.throughput(
-                slice_json["slice"].get("deviceUplinkThroughput")
-            ),
+            sid=None,
+            state="NOT_SUBMITTED",
+            name=name,
+            network_identifier=network_id,
+            slice_info=slice_info,
+            notification_url=notification_url,
+            notification_auth_token=notification_auth_token,
+            area_of_service=area_of_service,
+            max_data_connections=max_data_connections,
+            max_devices=max_devices,
+            slice_downlink_throughput=slice_downlink_throughput,
+            slice_uplink_throughput=slice_uplink_throughput,
+            device_downlink_throughput=device_downlink_throughput,
+            device_uplink_throughput=device_uplink_throughput,
+        )
+
+        slice_data = await self.api.slicing.create(
+            network_id=network_id,
+            slice_info=slice_info,
+            notification_url=notification_url,
+            area_of_service=area_of_service,
+            name=name,
+            notification_auth_token=notification_auth_token,
+            slice_downlink_throughput=to_api_throughput(slice_downlink_throughput),
+            slice_uplink_throughput=to_api_throughput(slice_uplink_throughput),
+            device_downlink_throughput=to_api_throughput(device_downlink_throughput),
+            device_uplink_throughput=to_api_throughput(device_uplink_throughput),
+            max_data_connections=max_data_connections,
+            max_devices=max_devices,
         )
+        new_slice.sid = slice_data.json().get("csi_id")
+        new_slice.state = slice_data.json()["state"]
 
-        attachments = self.api.slice_attach.get_attachments().json()
+        return new_slice
 
-        slice_attachments = [
-            attachment
-            for attachment in attachments
-            if attachment["resource"]["sliceId"] == slice_instance.name
-        ]
+    @builds_models
+    async def get(
+        self, id: str, cached_attachments: bool = False, lazy_attachments: bool = False
+    ) -> AsyncSlice:
+        """Get network slice by id.
 
-        slice_instance.set_attachments(slice_attachments)
+        Takes the same arguments as `Slices.get`.
 
-        return slice_instance
+        #### Example:
+            ```python
+            fetched_slice = await nac_client.slices.get(id)
+            ```
+        """
+        slice_data = (await self.api.slicing.get(id)).json()
+        existing_slice = AsyncSlice(api=self.api, **AsyncSlice.fields_from_json(slice_data))
+
+        index = self.api.attachment_index.get(ATTACHMENT_INDEX_KEY) if cached_attachments else None
+        if lazy_attachments and index is None:
+            existing_slice.defer_attachments()
+            return existing_slice
+
+        if index is None:
+            index = await self._fetch_attachment_index()
+
+        existing_slice.set_attachments(index.get(existing_slice.name, []))
+
+        return existing_slice
+
+    @overload
+    async def get_all(self, lazy_attachments: bool = False, rows: Literal[False] = False) -> List[AsyncSlice]: ...
+
+    @overload
+    async def get_all(self, lazy_attachments: bool = False, *, rows: Literal[True]) -> List[SliceRow]: ...
+
+    @builds_models
+    async def get_all(
+        self, lazy_attachments: bool = False, rows: bool = False
+    ) -> Union[List[AsyncSlice], List[SliceRow]]:
+        """Get All slices by id.
+
+        Takes the same arguments as `Slices.get_all`.
+
+        #### Example:
+            ```python
+            fetched_slices = await nac_client.slices.get_all()
+            ```
+        """
+        slice_data = (await self.api.slicing.get_all()).json()
+        if rows:
+            return [SliceRow.from_json(slice_json) for slice_json in slice_data]
+        index = None if lazy_attachments else await self._fetch_attachment_index()
+
+        slices = []
+        for slice_json in slice_data:
+            slice_instance = AsyncSlice(api=self.api, **AsyncSlice.fields_from_json(slice_json))
+            if index is None:
+                slice_instance.defer_attachments()
+            else:
+                slice_instance.set_attachments(index.get(slice_instance.name, []))
+            slices.append(slice_instance)
+
+        return slices
+
+    async def wait_all(
+        self,
+        slices: Sequence[AsyncSlice],
+        desired_state: Optional[str] = None,
+        timeout: datetime.timedelta = datetime.timedelta(seconds=3600),
+        poll_backoff: datetime.timedelta = datetime.timedelta(seconds=10),
+        max_poll_backoff: datetime.timedelta = DEFAULT_MAX_POLL_BACKOFF,
+    ) -> List[str]:
+        """Wait for many slices to reach a state, listing all slices once per poll.
+
+        Takes the same arguments as `Slices.wait_all`.
+
+        Returns: The new states of the slices, in the given order
+        """
+        if not desired_state:
+            desired_state = "AVAILABLE"
+
+        async def refresh():
+            slice_data = await self.api.slicing.get_all()
+            update_slice_states(slices, slice_data.json())
+
+        await poll_until(
+            lambda: all(slice_instance.state == desired_state for slice_instance in slices),
+            refresh,
+            timeout,
+            poll_backoff,
+            max_poll_backoff,
+        )
+        return [slice_instance.state for slice_instance in slices]
+
+    async def get_attachment(self, id: str):
+        """Get Application Attachment Instance
+
+        #### Args:
+            id (str): Application Attachment Id
+        """
+        return (await self.api.slice_attach.get(id)).json()
+
+    async def get_all_attachments(self):
+        """Get All Application Attachments"""
+        return (await self.api.slice_attach.get_attachments()).json()
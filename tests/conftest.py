@@ -1,8 +1,16 @@
 import pytest
 
 from network_as_code import NetworkAsCodeClient
+from network_as_code.api.cache import clear_caches
 
 @pytest.fixture(scope="module")
 def client() -> NetworkAsCodeClient:
     token = "TEST_TOKEN"
     return NetworkAsCodeClient(token=token)
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    # Cached responses would otherwise leak between tests sharing a client
+    clear_caches()
+    yield
+    clear_caches()
@@ -0,0 +1,854 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpcore
+import httpx
+import pytest
+
+from network_as_code import AsyncNetworkAsCodeClient, NetworkAsCodeClient
+from network_as_code.api import APIClient, AsyncAPIClient, request_timeout
+from network_as_code.api.client import BaseAPIClient
+from network_as_code.api.circuit_breaker import CLOSED, OPEN, CircuitBreakerPolicy
+from network_as_code.api.instrumentation import route_template
+from network_as_code.api.metrics import LatencyHistogram, MetricsRegistry
+from network_as_code.api.rate_limit import RateLimiter, TokenBucket
+from network_as_code.api.retry import RetryBudget, RetryPolicy, parse_retry_after
+from network_as_code.errors import APIError, CircuitOpenError, NotFound, ServiceError
+from network_as_code.models.device import Device, DeviceIpv4Addr
+
+
+def test_product_apis_share_one_connection_pool():
+    api = APIClient(token="TEST_TOKEN")
+
+    clients = [
+        api.sessions.client,
+        api.devicestatus.client,
+        api.location_verify.client,
+        api.location_retrieve.client,
+        api.slicing.client,
+        api.slice_attach.client,
+        api.congestion.client,
+        api.sim_swap.client,
+        api.geofencing.client,
+        api.number_verification.client,
+        api.credentials.client,
+        api.authorization.client,
+        api.call_forwarding.client,
+    ]
+
+    assert all(client._transport.pool is api.transport for client in clients)
+
+
+def test_product_apis_are_built_on_first_use():
+    client = NetworkAsCodeClient(token="TEST_TOKEN")
+
+    assert "sim_swap" not in vars(client._api)
+    assert "devices" not in vars(client)
+
+    sim_swap = client._api.sim_swap
+
+    assert client._api.sim_swap is sim_swap
+    assert client.devices is client.devices
+    assert [name for name in vars(client._api) if name in ("sessions", "slicing", "sim_swap")] == ["sim_swap"]
+
+
+def test_product_apis_are_built_once_across_threads():
+    api = APIClient(token="TEST_TOKEN")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        built = list(executor.map(lambda _: api.location_retrieve, range(8)))
+
+    assert all(location_api is built[0] for location_api in built)
+
+
+def test_pool_limits_can_be_configured():
+    limits = httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=30.0)
+
+    api = APIClient(token="TEST_TOKEN", limits=limits)
+
+    assert api.transport._pool._max_connections == 10
+    assert api.transport._pool._max_keepalive_connections == 5
+    assert api.transport._pool._keepalive_expiry == 30.0
+
+
+def test_requests_to_different_products_go_through_shared_pool(httpx_mock):
+    client = NetworkAsCodeClient(token="TEST_TOKEN")
+    device = client.devices.get(
+        "test_device_id",
+        ipv4_address=DeviceIpv4Addr(public_address="1.1.1.2", private_address="1.1.1.2", public_port=80),
+    )
+
+    httpx_mock.add_response(
+        url="https://network-as-code.p-eu.rapidapi.com/location-retrieval/v0/retrieve",
+        method="POST",
+        json={"area": {"areaType": "CIRCLE", "center": {"latitude": 1.0, "longitude": 2.0}, "radius": 10}},
+    )
+
+    httpx_mock.add_response(
+        url="https://network-as-code.p-eu.rapidapi.com/device-status/v0/connectivity",
+        method="POST",
+        json={"connectivityStatus": "CONNECTED_DATA"},
+    )
+
+    assert device.location().longitude == 2.0
+    assert device.get_connectivity() == "CONNECTED_DATA"
+
+    client.close()
+
+
+LOCATION_URL = "https://network-as-code.p-eu.rapidapi.com/location-retrieval/v0/retrieve"
+SLICE_URL = "https://network-as-code.p-eu.rapidapi.com/slice/v1/slices"
+ATTACHMENTS_URL = "https://network-as-code.p-eu.rapidapi.com/device-attach/v0/attachments"
+SLICE = {
+    "slice": {
+        "name": "sliceone",
+        "notificationUrl": "",
+        "networkIdentifier": {"mcc": "236", "mnc": "30"},
+        "sliceInfo": {"serviceType": "1", "differentiator": "AAABBB"},
+    },
+    "state": "AVAILABLE",
+}
+LOCATION = {"area": {"areaType": "CIRCLE", "center": {"latitude": 1.0, "longitude": 2.0}, "radius": 10}}
+
+
+def test_requests_are_not_retried_by_default(httpx_mock):
+    api = APIClient(token="TEST_TOKEN")
+
+    httpx_mock.add_response(url=SLICE_URL, method="GET", status_code=503)
+
+    with pytest.raises(ServiceError):
+        api.slicing.get_all()
+
+
+def test_idempotent_requests_are_retried(httpx_mock):
+    api = APIClient(token="TEST_TOKEN", retry=RetryPolicy(backoff=0))
+
+    httpx_mock.add_response(url=SLICE_URL, method="GET", status_code=503)
+    httpx_mock.add_response(url=SLICE_URL, method="GET", status_code=502)
+    httpx_mock.add_response(url=SLICE_URL, method="GET", json=[])
+
+    assert api.slicing.get_all().json() == []
+
+
+def test_retries_give_up_after_max_retries(httpx_mock):
+    api = APIClient(token="TEST_TOKEN", retry=RetryPolicy(max_retries=1, backoff=0))
+
+    httpx_mock.add_response(url=SLICE_URL, method="GET", status_code=503, is_reusable=True)
+
+    with pytest.raises(ServiceError):
+        api.slicing.get_all()
+
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_non_idempotent_requests_are_not_retried_after_server_errors(httpx_mock):
+    client = NetworkAsCodeClient(token="TEST_TOKEN", retry=RetryPolicy(backoff=0))
+    device = client.devices.get(phone_number="+3670123456")
+
+    httpx_mock.add_response(url=LOCATION_URL, method="POST", status_code=503)
+
+    with pytest.raises(ServiceError):
+        device.location()
+
+
+def test_throttled_requests_are_retried_after_the_requested_delay(httpx_mock):
+    client = NetworkAsCodeClient(token="TEST_TOKEN", retry=RetryPolicy(backoff=0))
+    device = client.devices.get(phone_number="+3670123456")
+
+    httpx_mock.add_response(url=LOCATION_URL, method="POST", status_code=429, headers={"Retry-After": "0"})
+    httpx_mock.add_response(url=LOCATION_URL, method="POST", json=LOCATION)
+
+    assert device.location().longitude == 2.0
+
+
+def test_throttled_requests_asking_to_wait_too_long_are_not_retried(httpx_mock):
+    client = NetworkAsCodeClient(token="TEST_TOKEN", retry=RetryPolicy(backoff=0, max_retry_after=1))
+    device = client.devices.get(phone_number="+3670123456")
+
+    httpx_mock.add_response(url=LOCATION_URL, method="POST", status_code=429, headers={"Retry-After": "120"})
+
+    with pytest.raises(APIError):
+        device.location()
+
+
+def test_connection_failures_are_retried_for_any_method(httpx_mock):
+    client = NetworkAsCodeClient(token="TEST_TOKEN", retry=RetryPolicy(backoff=0))
+    device = client.devices.get(phone_number="+3670123456")
+
+    httpx_mock.add_exception(httpx.ConnectError("Connection refused"), url=LOCATION_URL)
+    httpx_mock.add_response(url=LOCATION_URL, method="POST", json=LOCATION)
+
+    assert device.location().longitude == 2.0
+
+
+def test_retries_are_limited_by_the_budget(httpx_mock):
+    api = APIClient(token="TEST_TOKEN", retry=RetryPolicy(backoff=0, budget=RetryBudget(ratio=0, min_retries=1)))
+
+    httpx_mock.add_response(url=SLICE_URL, method="GET", status_code=503, is_reusable=True)
+
+    with pytest.raises(ServiceError):
+        api.slicing.get_all()
+
+    # One retry was funded by the budget, none is left for the second call
+    with pytest.raises(ServiceError):
+        api.slicing.get_all()
+
+    assert len(httpx_mock.get_requests()) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_requests_are_retried(httpx_mock):
+    api = AsyncAPIClient(token="TEST_TOKEN", retry=RetryPolicy(backoff=0))
+
+    httpx_mock.add_response(url=SLICE_URL, method="GET", status_code=504)
+    httpx_mock.add_response(url=SLICE_URL, method="GET", json=[])
+
+    assert (await api.slicing.get_all()).json() == []
+
+
+def test_retry_after_accepts_seconds_and_dates():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_token_bucket_allows_bursts_then_spaces_requests():
+    bucket = TokenBucket(rate=10, burst=2)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_rate_limiter_combines_global_and_product_buckets():
+    limiter = RateLimiter(rate=100, product_rates={"location_retrieve": 1})
+
+    assert limiter.reserve("location_retrieve") == 0
+    assert limiter.reserve("location_retrieve") == pytest.approx(1.0, abs=0.01)
+    # Other products are only limited by the global bucket
+    assert limiter.reserve("qos") == 0
+
+
+def test_rate_limiter_rejects_unknown_products():
+    with pytest.raises(ValueError, match="location_retreive"):
+        RateLimiter(product_rates={"location_retreive": 1})
+
+
+def test_rate_limiter_is_shared_between_threads():
+    limiter = RateLimiter(rate=10, burst=10)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        delays = sorted(executor.map(lambda _: limiter.reserve("qos"), range(20)))
+
+    assert delays[:10] == [0.0] * 10
+    assert delays[-1] == pytest.approx(1.0, abs=0.05)
+
+
+def test_requests_wait_for_the_rate_limiter(httpx_mock):
+    client = NetworkAsCodeClient(token="TEST_TOKEN", rate_limiter=RateLimiter(product_rates={"location_retrieve": 20}))
+    devices = [client.devices.get(phone_number=f"+367012345{index}") for index in range(25)]
+
+    httpx_mock.add_response(url=LOCATION_URL, method="POST", json=LOCATION, is_reusable=True)
+
+    started = time.monotonic()
+    results = list(client.devices.locate_many(devices, concurrency=10))
+
+    assert len(results) == 25
+    # 20 requests pass in the first burst, the remaining 5 at 20 per second
+    assert time.monotonic() - started >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_async_requests_wait_for_the_rate_limiter(httpx_mock):
+    api = AsyncAPIClient(token="TEST_TOKEN", rate_limiter=RateLimiter(rate=10, burst=1))
+
+    httpx_mock.add_response(url=SLICE_URL, method="GET", json=[], is_reusable=True)
+
+    started = time.monotonic()
+    await asyncio.gather(*(api.slicing.get_all() for _ in range(3)))
+
+    assert time.monotonic() - started >= 0.18
+
+
+def test_circuit_opens_after_repeated_server_errors(httpx_mock):
+    api = APIClient(token="TEST_TOKEN", circuit_breaker=CircuitBreakerPolicy(failure_threshold=2))
+
+    httpx_mock.add_response(url=SLICE_URL, method="GET", status_code=503, is_reusable=True)
+
+    for _ in range(2):
+        with pytest.raises(ServiceError):
+            api.slicing.get_all()
+
+    assert api.circuit_breakers["slice"].state == OPEN
+
+    with pytest.raises(CircuitOpenError):
+        api.slicing.get_all()
+
+    # The open circuit failed fast without sending the third request
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_client_errors_do_not_open_the_circuit(httpx_mock):
+    api = APIClient(token="TEST_TOKEN", circuit_breaker=CircuitBreakerPolicy(failure_threshold=1))
+
+    httpx_mock.add_response(url=f"{SLICE_URL}/missing", method="GET", status_code=404)
+
+    with pytest.raises(NotFound):
+        api.slicing.get("missing")
+
+    assert api.circuit_breakers["slice"].state == CLOSED
+
+
+def test_open_circuit_does_not_affect_other_products(httpx_mock):
+    client = NetworkAsCodeClient(token="TEST_TOKEN", circuit_breaker=CircuitBreakerPolicy(failure_threshold=1))
+    device = client.devices.get(phone_number="+3670123456")
+
+    httpx_mock.add_response(url=SLICE_URL, method="GET", status_code=500)
+    httpx_mock.add_response(url=LOCATION_URL, method="POST", json=LOCATION)
+
+    with pytest.raises(ServiceError):
+        client.slices.get_all()
+
+    assert device.location(max_age=60).latitude == 1.0
+
+
+def test_successful_probe_closes_the_circuit(httpx_mock):
+    policy = CircuitBreakerPolicy(failure_threshold=1, recovery_time=0.05)
+    api = APIClient(token="TEST_TOKEN", circuit_breaker=policy)
+
+    httpx_mock.add_response(url=SLICE_URL, method="GET", status_code=502)
+    httpx_mock.add_response(url=SLICE_URL, method="GET", json=[])
+
+    with pytest.raises(ServiceError):
+        api.slicing.get_all()
+
+    with pytest.raises(CircuitOpenError):
+        api.slicing.get_all()
+
+    time.sleep(0.06)
+
+    assert api.slicing.get_all().json() == []
+    assert api.circuit_breakers["slice"].state == CLOSED
+
+
+def test_failed_probe_opens_the_circuit_again(httpx_mock):
+    policy = CircuitBreakerPolicy(failure_threshold=3, recovery_time=0.05)
+    api = APIClient(token="TEST_TOKEN", circuit_breaker=policy)
+
+    httpx_mock.add_response(url=SLICE_URL, method="GET", status_code=503, is_reusable=True)
+
+    for _ in range(3):
+        with pytest.raises(ServiceError):
+            api.slicing.get_all()
+
+    time.sleep(0.06)
+
+    with pytest.raises(ServiceError):
+        api.slicing.get_all()
+
+    assert api.circuit_breakers["slice"].state == OPEN
+    with pytest.raises(CircuitOpenError):
+        api.slicing.get_all()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_frees_its_slot(httpx_mock):
+    policy = CircuitBreakerPolicy(failure_threshold=1, recovery_time=0.05)
+    api = AsyncAPIClient(token="TEST_TOKEN", circuit_breaker=policy)
+
+    async def hanging_response(request: httpx.Request):
+        await asyncio.sleep(10)
+
+    httpx_mock.add_response(url=SLICE_URL, method="GET", status_code=503)
+    httpx_mock.add_callback(hanging_response, url=SLICE_URL, method="GET")
+    httpx_mock.add_response(url=SLICE_URL, method="GET", json=[])
+
+    with pytest.raises(ServiceError):
+        await api.slicing.get_all()
+
+    await asyncio.sleep(0.06)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(api.slicing.get_all(), 0.05)
+
+    # Another probe is let through instead of failing fast forever
+    assert (await api.slicing.get_all()).json() == []
+    assert api.circuit_breakers["slice"].state == CLOSED
+
+
+def test_probe_failing_unexpectedly_frees_its_slot(httpx_mock):
+    policy = CircuitBreakerPolicy(failure_threshold=1, recovery_time=0.05)
+    api = APIClient(token="TEST_TOKEN", circuit_breaker=policy)
+
+    httpx_mock.add_response(url=SLICE_URL, method="GET", status_code=503)
+    httpx_mock.add_exception(RuntimeError("Broken transport"), url=SLICE_URL, method="GET")
+    httpx_mock.add_response(url=SLICE_URL, method="GET", json=[])
+
+    with pytest.raises(ServiceError):
+        api.slicing.get_all()
+
+    time.sleep(0.06)
+
+    with pytest.raises(RuntimeError):
+        api.slicing.get_all()
+
+    assert api.slicing.get_all().json() == []
+    assert api.circuit_breakers["slice"].state == CLOSED
+
+
+def test_slow_calls_count_as_failures(httpx_mock):
+    policy = CircuitBreakerPolicy(failure_threshold=1, slow_call_duration=0.01)
+    api = APIClient(token="TEST_TOKEN", circuit_breaker=policy)
+
+    def slow_response(request: httpx.Request):
+        time.sleep(0.02)
+        return httpx.Response(200, json=[])
+
+    httpx_mock.add_callback(slow_response, url=SLICE_URL, method="GET")
+
+    api.slicing.get_all()
+
+    assert api.circuit_breakers["slice"].state == OPEN
+
+
+def test_locate_many_reports_open_circuit_per_device(httpx_mock):
+    client = NetworkAsCodeClient(token="TEST_TOKEN", circuit_breaker=CircuitBreakerPolicy(failure_threshold=1))
+    devices = [client.devices.get(phone_number=f"+367012345{index}") for index in range(3)]
+
+    httpx_mock.add_response(url=LOCATION_URL, method="POST", status_code=500)
+
+    results = list(client.devices.locate_many(devices, concurrency=1))
+
+    errors = [result for _, result in results]
+    assert isinstance(errors[0], ServiceError)
+    assert all(isinstance(error, CircuitOpenError) for error in errors[1:])
+
+
+@pytest.mark.asyncio
+async def test_async_circuit_opens_after_connection_failures(httpx_mock):
+    api = AsyncAPIClient(token="TEST_TOKEN", circuit_breaker=CircuitBreakerPolicy(failure_threshold=1))
+
+    httpx_mock.add_exception(httpx.ConnectError("Connection refused"), url=SLICE_URL, method="GET")
+
+    with pytest.raises(httpx.ConnectError):
+        await api.slicing.get_all()
+
+    with pytest.raises(CircuitOpenError):
+        await api.slicing.get_all()
+
+
+def test_requests_use_the_default_timeout(httpx_mock):
+    api = APIClient(token="TEST_TOKEN")
+
+    httpx_mock.add_response(url=SLICE_URL, method="GET", json=[])
+
+    api.slicing.get_all()
+
+    assert httpx_mock.get_request().extensions["timeout"] == httpx.Timeout(30.0).as_dict()
+
+
+def test_timeouts_can_be_configured_per_product(httpx_mock):
+    client = NetworkAsCodeClient(
+        token="TEST_TOKEN",
+        timeout=60.0,
+        timeouts={"location_retrieve": httpx.Timeout(2.0, connect=0.5)},
+    )
+    device = client.devices.get(phone_number="+3670123456")
+
+    httpx_mock.add_response(url=SLICE_URL, method="GET", json=[])
+    httpx_mock.add_response(url=LOCATION_URL, method="POST", json=LOCATION)
+
+    client._api.slicing.get_all()
+    device.location(max_age=60)
+
+    slice_request, location_request = httpx_mock.get_requests()
+    assert slice_request.extensions["timeout"]["read"] == 60.0
+    assert location_request.extensions["timeout"] == {"connect": 0.5, "read": 2.0, "write": 2.0, "pool": 2.0}
+
+
+def test_unknown_products_in_timeouts_are_rejected():
+    with pytest.raises(ValueError):
+        APIClient(token="TEST_TOKEN", timeouts={"locaton": 1.0})
+
+
+def test_request_timeout_overrides_client_timeouts(httpx_mock):
+    api = APIClient(token="TEST_TOKEN", timeouts={"slice": 120.0})
+
+    httpx_mock.add_response(url=SLICE_URL, method="GET", json=[], is_reusable=True)
+
+    with request_timeout(httpx.Timeout(1.0, connect=0.2)):
+        api.slicing.get_all()
+    api.slicing.get_all()
+
+    overridden, configured = httpx_mock.get_requests()
+    assert overridden.extensions["timeout"]["connect"] == 0.2
+    assert configured.extensions["timeout"]["connect"] == 120.0
+
+
+def test_request_timeout_applies_to_bulk_operations(httpx_mock):
+    client = NetworkAsCodeClient(token="TEST_TOKEN")
+    devices = [client.devices.get(phone_number=f"+367012345{index}") for index in range(3)]
+
+    httpx_mock.add_response(url=LOCATION_URL, method="POST", json=LOCATION, is_reusable=True)
+
+    with request_timeout(5.0):
+        list(client.devices.locate_many(devices))
+
+    assert all(request.extensions["timeout"]["read"] == 5.0 for request in httpx_mock.get_requests())
+
+
+@pytest.mark.asyncio
+async def test_async_request_timeout_overrides_client_timeouts(httpx_mock):
+    api = AsyncAPIClient(token="TEST_TOKEN", timeout=10.0)
+
+    httpx_mock.add_response(url=SLICE_URL, method="GET", json=[])
+
+    with request_timeout(0.5):
+        await api.slicing.get_all()
+
+    assert httpx_mock.get_request().extensions["timeout"]["read"] == 0.5
+
+
+def test_custom_transport_replaces_the_connection_pool():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=LOCATION)
+
+    client = NetworkAsCodeClient(token="TEST_TOKEN", transport=httpx.MockTransport(handler))
+    device = client.devices.get(phone_number="+3670123456")
+
+    assert device.location(max_age=60).longitude == 2.0
+    assert requests[0].url == LOCATION_URL
+
+
+def test_api_clients_must_build_their_pool_and_transports():
+    class IncompleteClient(BaseAPIClient):
+        def _build_pool(self, options, proxies):
+            return httpx.HTTPTransport(**options)
+
+    with pytest.raises(TypeError):
+        IncompleteClient(token="TEST_TOKEN")
+
+
+def test_custom_transport_cannot_be_combined_with_pool_settings():
+    with pytest.raises(ValueError):
+        APIClient(token="TEST_TOKEN", transport=httpx.MockTransport(lambda request: None), http2=True)
+
+
+def test_requests_can_go_through_a_proxy():
+    api = APIClient(token="TEST_TOKEN", proxy="http://proxy.example.com:8080")
+
+    assert isinstance(api.transport._pool, httpcore.HTTPProxy)
+
+
+@pytest.fixture
+def proxy_environment(monkeypatch):
+    for name in ["HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"]:
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example.com:8080")
+    return monkeypatch
+
+
+def test_requests_go_through_the_proxy_set_in_the_environment(proxy_environment):
+    api = APIClient(token="TEST_TOKEN")
+
+    pool = api.transport.transport_for(httpx.URL(api._urls["slice"]))._pool
+    assert isinstance(pool, httpcore.HTTPProxy)
+    assert pool._proxy_url.host == b"proxy.example.com"
+    assert api.transport.transport_for(httpx.URL("http://example.com")) is api.transport.pool
+
+
+def test_environment_proxies_skip_hosts_in_no_proxy(proxy_environment):
+    proxy_environment.setenv("NO_PROXY", "rapidapi.com")
+    api = APIClient(token="TEST_TOKEN")
+
+    assert api.transport.transport_for(httpx.URL(api._urls["slice"])) is api.transport.pool
+
+
+def test_environment_proxies_are_ignored_without_trust_env(proxy_environment):
+    api = APIClient(token="TEST_TOKEN", trust_env=False)
+
+    assert isinstance(api.transport, httpx.HTTPTransport)
+    assert not isinstance(api.transport._pool, httpcore.HTTPProxy)
+
+
+@pytest.mark.asyncio
+async def test_async_requests_go_through_the_proxy_set_in_the_environment(proxy_environment):
+    api = AsyncAPIClient(token="TEST_TOKEN")
+
+    pool = api.transport.transport_for(httpx.URL(api._urls["slice"]))._pool
+    assert isinstance(pool, httpcore.AsyncHTTPProxy)
+    await api.aclose()
+
+
+def test_event_hooks_are_called_for_every_product(httpx_mock):
+    seen = []
+    api = APIClient(token="TEST_TOKEN", event_hooks={"response": [lambda response: seen.append(response.status_code)]})
+
+    httpx_mock.add_response(url=SLICE_URL, method="GET", json=[])
+    httpx_mock.add_response(url=LOCATION_URL, method="POST", json=LOCATION)
+
+    api.slicing.get_all()
+    api.location_retrieve.get_location(Device(api, phone_number="+3670123456"))
+
+    assert seen == [200, 200]
+
+
+@pytest.mark.asyncio
+async def test_async_client_accepts_custom_transport_and_hooks():
+    seen = []
+
+    async def on_request(request: httpx.Request):
+        seen.append(request.url.path)
+
+    api = AsyncAPIClient(
+        token="TEST_TOKEN",
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=[])),
+        event_hooks={"request": [on_request]},
+    )
+
+    await api.slicing.get_all()
+
+    assert seen == ["/slice/v1/slices"]
+
+
+def test_request_hooks_report_every_request(httpx_mock):
+    events = []
+    client = NetworkAsCodeClient(
+        token="TEST_TOKEN", retry=RetryPolicy(backoff=0), request_hooks=[events.append]
+    )
+    device = client.devices.get(phone_number="+3670123456")
+
+    httpx_mock.add_response(url=SLICE_URL, method="GET", status_code=503)
+    httpx_mock.add_response(url=SLICE_URL, method="GET", json=[])
+    httpx_mock.add_response(url=LOCATION_URL, method="POST", json=LOCATION)
+
+    client._api.slicing.get_all()
+    device.location()
+
+    slices, location = events
+    assert (slices.product, slices.method, slices.endpoint) == ("slice", "GET", "/slice/v1/slices")
+    assert (slices.status_code, slices.retries, slices.response_bytes) == (200, 1, 2)
+    assert (location.product, location.method, location.status_code) == ("location_retrieve", "POST", 200)
+    assert location.request_bytes == len(httpx_mock.get_requests()[-1].content)
+    assert location.response_bytes > 0
+    assert location.retries == 0
+    assert location.duration > 0
+    assert location.error is None
+
+
+def test_request_hooks_report_the_time_spent_decoding_and_building(httpx_mock):
+    events = []
+    client = NetworkAsCodeClient(token="TEST_TOKEN", request_hooks=[events.append])
+    device = client.devices.get(phone_number="+3670123456")
+
+    httpx_mock.add_response(url=SLICE_URL, method="GET", json=[])
+    httpx_mock.add_response(url=LOCATION_URL, method="POST", json=LOCATION)
+
+    # Decoded ahead of the SDK asking for it, which gets the value only once
+    response = client._api.slicing.get_all()
+    [slices] = events
+    assert response.json() == [] and response.json() is not response.json()
+
+    location = device.location()
+
+    [_, located] = events
+    assert location.radius == 10
+    assert slices.decode_duration > 0
+    assert slices.build_duration == 0
+    assert located.decode_duration > 0
+    assert located.build_duration > 0
+
+
+def test_requests_of_a_call_are_reported_once_it_built_its_models(httpx_mock):
+    events = []
+    client = NetworkAsCodeClient(token="TEST_TOKEN", request_hooks=[events.append])
+    reported_during_call = []
+    httpx_mock.add_callback(
+        lambda request: reported_during_call.append(len(events)) or httpx.Response(200, json=[]),
+        url=ATTACHMENTS_URL,
+    )
+    httpx_mock.add_callback(
+        lambda request: reported_during_call.append(len(events)) or httpx.Response(200, json=[SLICE]),
+        url=SLICE_URL,
+    )
+
+    [slice] = client.slices.get_all()
+
+    assert slice.name == "sliceone"
+    assert reported_during_call == [0, 0]
+    attachments, slices = sorted(events, key=lambda event: event.product)
+    assert attachments.build_duration == 0
+    assert slices.build_duration > 0
+
+
+def test_request_hooks_report_failed_requests(httpx_mock):
+    events = []
+    api = APIClient(token="TEST_TOKEN", request_hooks=[events.append])
+
+    httpx_mock.add_exception(httpx.ConnectError("Connection refused"), url=SLICE_URL, method="GET")
+
+    with pytest.raises(httpx.ConnectError):
+        api.slicing.get_all()
+
+    [event] = events
+    assert event.status_code is None
+    assert isinstance(event.error, httpx.ConnectError)
+
+
+def test_failing_request_hooks_do_not_fail_the_request(httpx_mock, caplog):
+    events = []
+
+    def broken_hook(event):
+        raise RuntimeError("Exporter is down")
+
+    api = APIClient(token="TEST_TOKEN", request_hooks=[broken_hook, events.append])
+
+    httpx_mock.add_response(url=SLICE_URL, method="GET", json=[])
+
+    assert api.slicing.get_all().json() == []
+    # The hooks after the failing one are still called
+    assert len(events) == 1
+    assert "Exporter is down" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_async_request_hooks_report_every_request(httpx_mock):
+    events = []
+    api = AsyncAPIClient(token="TEST_TOKEN", request_hooks=[events.append])
+
+    httpx_mock.add_response(url=SLICE_URL, method="GET", status_code=404)
+
+    with pytest.raises(NotFound):
+        await api.slicing.get_all()
+
+    [event] = events
+    assert (event.product, event.endpoint, event.status_code) == ("slice", "/slice/v1/slices", 404)
+
+
+@pytest.fixture(scope="module")
+def span_exporter():
+    sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+    from opentelemetry import trace
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    exporter = InMemorySpanExporter()
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    # The global provider can only be set once
+    trace.set_tracer_provider(provider)
+    return exporter
+
+
+@pytest.fixture
+def exporter(span_exporter):
+    span_exporter.clear()
+    return span_exporter
+
+
+def test_requests_are_traced_with_opentelemetry(httpx_mock, exporter):
+    api = APIClient(token="TEST_TOKEN", opentelemetry=True)
+
+    httpx_mock.add_response(url=SLICE_URL, method="GET", status_code=503)
+
+    with pytest.raises(ServiceError):
+        api.slicing.get_all()
+
+    [span] = exporter.get_finished_spans()
+    assert span.name == "GET slice"
+    assert span.attributes["http.response.status_code"] == 503
+    assert span.attributes["network_as_code.product"] == "slice"
+    assert not span.status.is_ok
+
+
+def test_decoding_and_building_are_traced_as_child_spans(httpx_mock, exporter):
+    client = NetworkAsCodeClient(token="TEST_TOKEN", opentelemetry=True)
+
+    httpx_mock.add_response(url=LOCATION_URL, method="POST", json=LOCATION)
+
+    client.devices.get(phone_number="+3670123456").location()
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    request = spans["POST location_retrieve"]
+    decode = spans["decode location_retrieve"]
+    build = spans["build location_retrieve"]
+    assert decode.parent.span_id == request.context.span_id
+    assert build.parent.span_id == request.context.span_id
+    assert decode.end_time <= build.start_time <= build.end_time
+
+
+@pytest.mark.asyncio
+async def test_async_request_hooks_report_the_time_spent_decoding_and_building(httpx_mock):
+    events = []
+    client = AsyncNetworkAsCodeClient(token="TEST_TOKEN", request_hooks=[events.append])
+
+    httpx_mock.add_response(url=LOCATION_URL, method="POST", json=LOCATION)
+
+    await client.devices.get(phone_number="+3670123456").location()
+
+    [event] = events
+    assert event.decode_duration > 0
+    assert event.build_duration > 0
+
+
+def test_metrics_are_collected_by_product_and_route(httpx_mock):
+    metrics = MetricsRegistry()
+    client = NetworkAsCodeClient(token="TEST_TOKEN", metrics=metrics)
+
+    httpx_mock.add_response(url=f"{SLICE_URL}/sliceone", method="GET", json={}, is_reusable=True)
+    httpx_mock.add_response(url=f"{SLICE_URL}/slicetwo", method="GET", status_code=404)
+
+    client._api.slicing.get("sliceone")
+    client._api.slicing.get("sliceone")
+    with pytest.raises(NotFound):
+        client._api.slicing.get("slicetwo")
+
+    assert client.metrics is metrics
+    assert metrics.keys() == ["slice:GET /slices/{id}"]
+
+    endpoint = metrics.get("slice:GET /slices/{id}")
+    assert endpoint.requests == 3
+    assert endpoint.statuses == {"200": 2, "404": 1}
+    assert endpoint.errors == 1
+    assert endpoint.latency.count == 3
+
+
+def test_latency_histogram_quantiles_are_accurate():
+    histogram = LatencyHistogram()
+    for millisecond in range(1, 1001):
+        histogram.record(millisecond / 1000)
+
+    assert histogram.quantile(0.5) == pytest.approx(0.5, rel=0.05)
+    assert histogram.quantile(0.99) == pytest.approx(0.99, rel=0.05)
+    assert histogram.quantile(1.0) == 1.0
+    assert histogram.quantile(0.0) == pytest.approx(0.001, rel=0.05)
+
+
+def test_metrics_are_exported_in_prometheus_format(httpx_mock):
+    metrics = MetricsRegistry()
+    api = APIClient(token="TEST_TOKEN", metrics=metrics)
+
+    httpx_mock.add_response(url=SLICE_URL, method="GET", json=[])
+
+    api.slicing.get_all()
+
+    exported = metrics.to_prometheus().splitlines()
+    labels = 'product="slice",method="GET",route="/slices"'
+    assert "# TYPE network_as_code_requests_total counter" in exported
+    assert f'network_as_code_requests_total{{{labels},status="200"}} 1' in exported
+    assert f"network_as_code_request_retries_total{{{labels}}} 0" in exported
+    assert f"network_as_code_request_duration_seconds_count{{{labels}}} 1" in exported
+    assert any(line.startswith(f'network_as_code_request_duration_seconds{{{labels},quantile="0.99"}}') for line in exported)
+
+
+def test_route_templates_replace_resource_ids():
+    assert route_template("/slice/v1/slices/my-slice/activate", "/slice/v1") == "/slices/{id}/activate"
+    assert route_template("/qod/v0/sessions", "/qod/v0") == "/sessions"
+    assert route_template("/device-status/v0/subscriptions/1234", "/device-status/v0") == "/subscriptions/{id}"
@@ -0,0 +1,537 @@
+import asyncio
+import datetime
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from network_as_code import AsyncNetworkAsCodeClient
+from network_as_code.errors import NotFound, ServiceError
+from network_as_code.models.device import AsyncDevice, DeviceIpv4Addr
+from network_as_code.models.geofencing import EventType
+from network_as_code.models.session import AsyncQoDSession, QoDSessionRow
+from network_as_code.models.slice import AsyncSlice, SliceRow
+
+BASE_URL = "https://network-as-code.p-eu.rapidapi.com"
+
+MOCK_SESSION = {
+    "sessionId": "08305343-7ed2-43b7-8eda-4c5ae9805bd0",
+    "qosProfile": "QOS_L",
+    "device": {
+        "phoneNumber": "+9382948473"
+    },
+    "applicationServer": {
+        "ipv4Address": "5.6.7.8",
+    },
+    "duration": 3600,
+    "qosStatus": "REQUESTED",
+    "startedAt": "2024-06-18T08:48:12.300312Z",
+    "expiresAt": "2024-06-18T08:48:12.300312Z"
+}
+
+MOCK_SLICE = {
+    "slice": {
+        "name": "sliceone",
+        "notificationUrl": "",
+        "networkIdentifier": {
+            "mcc": "236",
+            "mnc": "30"
+        },
+        "sliceInfo": {
+            "serviceType": "1",
+            "differentiator": "AAABBB"
+        },
+    },
+    "csi_id": "csi_368",
+    "state": "PENDING"
+}
+
+MOCK_LOCATION = {
+    "lastLocationTime": "2023-09-12T11:41:28+03:00",
+    "area": {
+        "areaType": "CIRCLE",
+        "center": {
+            "latitude": 1.0,
+            "longitude": 2.0
+        },
+        "radius": 10000
+    }
+}
+
+
+@pytest.fixture
+def async_client() -> AsyncNetworkAsCodeClient:
+    return AsyncNetworkAsCodeClient(token="TEST_TOKEN")
+
+
+@pytest.fixture
+def device(async_client) -> AsyncDevice:
+    return async_client.devices.get(phone_number="+9382948473")
+
+
+@pytest.mark.asyncio
+async def test_getting_a_device_fills_in_private_address(async_client):
+    device = async_client.devices.get(ipv4_address=DeviceIpv4Addr(public_address="1.1.1.2"))
+
+    assert isinstance(device, AsyncDevice)
+    assert device.ipv4_address.private_address == "1.1.1.2"
+
+
+@pytest.mark.asyncio
+async def test_async_device_location(httpx_mock: HTTPXMock, device):
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/location-retrieval/v0/retrieve",
+        method="POST",
+        match_json={"device": {"phoneNumber": "+9382948473"}, "maxAge": 60},
+        json=MOCK_LOCATION,
+    )
+
+    location = await device.location(max_age=60)
+
+    assert location.longitude == 2.0
+    assert location.latitude == 1.0
+    assert location.radius == 10000
+
+
+@pytest.mark.asyncio
+async def test_async_device_locations_run_concurrently(httpx_mock: HTTPXMock, async_client):
+    devices = [async_client.devices.get(phone_number=f"+35840000000{i}") for i in range(5)]
+
+    for _ in devices:
+        httpx_mock.add_response(
+            url=f"{BASE_URL}/location-retrieval/v0/retrieve",
+            method="POST",
+            json=MOCK_LOCATION,
+        )
+
+    locations = await asyncio.gather(*(device.location() for device in devices))
+
+    assert len(locations) == 5
+    assert all(location.longitude == 2.0 for location in locations)
+
+
+@pytest.mark.asyncio
+async def test_async_device_qod_session_lifecycle(httpx_mock: HTTPXMock, device):
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/qod/v0/sessions",
+        method="POST",
+        match_json={
+            "qosProfile": "QOS_L",
+            "device": {"phoneNumber": "+9382948473"},
+            "applicationServer": {"ipv4Address": "5.6.7.8"},
+            "duration": 3600,
+        },
+        json=MOCK_SESSION,
+    )
+
+    session = await device.create_qod_session(profile="QOS_L", duration=3600, service_ipv4="5.6.7.8")
+
+    assert isinstance(session, AsyncQoDSession)
+    assert session.device is device
+    assert session.status == "REQUESTED"
+
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/qod/v0/sessions/{MOCK_SESSION['sessionId']}/extend",
+        method="POST",
+        match_json={"requestedAdditionalDuration": 60},
+        json={**MOCK_SESSION, "duration": 3660},
+    )
+
+    await session.extend(60)
+
+    assert session.duration == 3660
+
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/qod/v0/sessions/{MOCK_SESSION['sessionId']}",
+        method="DELETE",
+    )
+
+    await session.delete()
+
+
+@pytest.mark.asyncio
+async def test_async_device_clear_sessions(httpx_mock: HTTPXMock, device):
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/qod/v0/retrieve-sessions",
+        method="POST",
+        json=[MOCK_SESSION],
+    )
+
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/qod/v0/sessions/{MOCK_SESSION['sessionId']}",
+        method="DELETE",
+    )
+
+    await device.clear_sessions()
+
+
+@pytest.mark.asyncio
+async def test_async_device_sessions_returns_empty_list_on_404(httpx_mock: HTTPXMock, device):
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/qod/v0/retrieve-sessions",
+        method="POST",
+        status_code=404,
+    )
+
+    assert await device.sessions() == []
+
+
+@pytest.mark.asyncio
+async def test_async_sessions_get(httpx_mock: HTTPXMock, async_client):
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/qod/v0/sessions/{MOCK_SESSION['sessionId']}",
+        method="GET",
+        json=MOCK_SESSION,
+    )
+
+    session = await async_client.sessions.get(MOCK_SESSION["sessionId"])
+
+    assert isinstance(session.device, AsyncDevice)
+    assert session.device.phone_number == "+9382948473"
+
+
+@pytest.mark.asyncio
+async def test_async_device_status(httpx_mock: HTTPXMock, device):
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/device-status/v0/connectivity",
+        method="POST",
+        json={"connectivityStatus": "CONNECTED_DATA"},
+    )
+
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/device-status/v0/roaming",
+        method="POST",
+        json={"roaming": True, "countryCode": 358, "countryName": ["Finland"]},
+    )
+
+    assert await device.get_connectivity() == "CONNECTED_DATA"
+
+    roaming = await device.get_roaming()
+
+    assert roaming.roaming
+    assert roaming.country_code == 358
+
+
+@pytest.mark.asyncio
+async def test_async_errors_are_mapped_like_sync_ones(httpx_mock: HTTPXMock, device):
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/passthrough/camara/v1/sim-swap/sim-swap/v0/check",
+        method="POST",
+        status_code=500,
+    )
+
+    with pytest.raises(ServiceError):
+        await device.verify_sim_swap()
+
+
+@pytest.mark.asyncio
+async def test_async_listing_as_rows(httpx_mock: HTTPXMock, async_client):
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/qod/v0/retrieve-sessions",
+        method="POST",
+        json=[MOCK_SESSION],
+    )
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/slice/v1/slices",
+        method="GET",
+        json=[MOCK_SLICE],
+    )
+    device = async_client.devices.get(phone_number="+9382948473")
+
+    sessions = await device.sessions(rows=True)
+    slices = await async_client.slices.get_all(rows=True)
+
+    assert isinstance(sessions[0], QoDSessionRow)
+    assert sessions[0].id == MOCK_SESSION["sessionId"]
+    assert sessions[0].device is device
+    assert isinstance(slices[0], SliceRow)
+    assert slices[0].sid == "csi_368"
+
+
+@pytest.mark.asyncio
+async def test_async_slices_get_all(httpx_mock: HTTPXMock, async_client):
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/slice/v1/slices",
+        method="GET",
+        json=[MOCK_SLICE],
+    )
+
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/device-attach/v0/attachments",
+        method="GET",
+        json=[{
+            "nac_resource_id": "attachment-1",
+            "resource": {"sliceId": "sliceone", "device": {"phoneNumber": "+9382948473"}},
+        }],
+    )
+
+    slices = await async_client.slices.get_all()
+
+    assert len(slices) == 1
+    assert isinstance(slices[0], AsyncSlice)
+    assert slices[0].sid == "csi_368"
+
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/device-attach/v0/attachments/attachment-1",
+        method="DELETE",
+    )
+
+    await slices[0].detach(async_client.devices.get(phone_number="+9382948473"))
+
+    with pytest.raises(NotFound):
+        await slices[0].detach(async_client.devices.get(phone_number="+9382948473"))
+
+
+@pytest.mark.asyncio
+async def test_async_slice_wait_for(httpx_mock: HTTPXMock, async_client):
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/slice/v1/slices/sliceone",
+        method="GET",
+        json=MOCK_SLICE,
+    )
+
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/device-attach/v0/attachments",
+        method="GET",
+        json=[],
+    )
+
+    my_slice = await async_client.slices.get("sliceone")
+
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/slice/v1/slices/sliceone",
+        method="GET",
+        json={**MOCK_SLICE, "state": "AVAILABLE"},
+    )
+
+    state = await my_slice.wait_for(poll_backoff=datetime.timedelta(seconds=0))
+
+    assert state == "AVAILABLE"
+
+
+@pytest.mark.asyncio
+async def test_async_geofencing_subscribe(httpx_mock: HTTPXMock, async_client, device):
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/geofencing-subscriptions/v0.3/subscriptions",
+        method="POST",
+        json={
+            "protocol": "HTTP",
+            "sink": "https://example.com/notify",
+            "types": [EventType.AREA_ENTERED.value],
+            "config": {
+                "subscriptionDetail": {
+                    "device": {"phoneNumber": "+9382948473"},
+                    "area": {
+                        "areaType": "CIRCLE",
+                        "center": {"latitude": 1.0, "longitude": 2.0},
+                        "radius": 2000,
+                    },
+                },
+            },
+            "startsAt": "2024-03-28T12:40:20.398Z",
+            "id": "subscription-1",
+        },
+    )
+
+    subscription = await async_client.geofencing.subscribe(
+        device=device,
+        sink="https://example.com/notify",
+        types=[EventType.AREA_ENTERED],
+        latitude=1.0,
+        longitude=2.0,
+        radius=2000,
+    )
+
+    assert subscription.event_subscription_id == "subscription-1"
+
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/geofencing-subscriptions/v0.3/subscriptions/subscription-1",
+        method="DELETE",
+    )
+
+    await subscription.delete()
+
+
+@pytest.mark.asyncio
+async def test_async_authentication_link(httpx_mock: HTTPXMock, async_client):
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/oauth2/v1/auth/clientcredentials",
+        method="GET",
+        json={"client_id": "my-client-id", "client_secret": "my-client-secret"},
+    )
+
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/.well-known/openid-configuration",
+        method="GET",
+        json={"authorization_endpoint": "https://auth.example.com/authorize", "token_endpoint": "token-endpoint"},
+    )
+
+    link = await async_client.authorization.create_authentication_link(
+        redirect_uri="https://example.com/callback",
+        scope="dpv:FraudPreventionAndDetection#number-verification-verify-read",
+        login_hint="+3637123456",
+    )
+
+    assert link.startswith("https://auth.example.com/authorize?")
+    assert "client_id=my-client-id" in link
+
+
+@pytest.mark.asyncio
+async def test_async_client_context_manager_closes_pool():
+    async with AsyncNetworkAsCodeClient(token="TEST_TOKEN") as client:
+        assert client.devices is not None
+
+
+@pytest.mark.asyncio
+async def test_async_locate_many(httpx_mock: HTTPXMock, async_client):
+    devices = [async_client.devices.get(phone_number=f"+35840000000{i}") for i in range(4)]
+
+    for index, device in enumerate(devices):
+        httpx_mock.add_response(
+            url=f"{BASE_URL}/location-retrieval/v0/retrieve",
+            method="POST",
+            match_json={"device": {"phoneNumber": device.phone_number}, "maxAge": 60},
+            status_code=404 if index == 0 else 200,
+            json=MOCK_LOCATION,
+        )
+
+    results = [result async for result in async_client.devices.locate_many(devices, concurrency=2)]
+
+    assert len(results) == 4
+    errors = [device for device, location in results if isinstance(location, NotFound)]
+    assert errors == [devices[0]]
+
+
+@pytest.mark.asyncio
+async def test_async_locate_many_reports_invalid_json_per_device(httpx_mock: HTTPXMock, async_client):
+    devices = [async_client.devices.get(phone_number=f"+35840000000{i}") for i in range(2)]
+
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/location-retrieval/v0/retrieve",
+        method="POST",
+        match_json={"device": {"phoneNumber": devices[0].phone_number}, "maxAge": 60},
+        content=b'{"area": ',
+        headers={"Content-Type": "application/json"},
+    )
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/location-retrieval/v0/retrieve",
+        method="POST",
+        match_json={"device": {"phoneNumber": devices[1].phone_number}, "maxAge": 60},
+        json=MOCK_LOCATION,
+    )
+
+    results = {
+        device.phone_number: location
+        async for device, location in async_client.devices.locate_many(devices, concurrency=1)
+    }
+
+    assert isinstance(results[devices[0].phone_number], ValueError)
+    assert not isinstance(results[devices[1].phone_number], Exception)
+
+
+@pytest.mark.asyncio
+async def test_async_create_and_delete_many_sessions(httpx_mock: HTTPXMock, async_client):
+    devices = [async_client.devices.get(phone_number=f"+938294847{i}") for i in range(3)]
+
+    for index, device in enumerate(devices):
+        httpx_mock.add_response(
+            url=f"{BASE_URL}/qod/v0/sessions",
+            method="POST",
+            match_json={
+                "qosProfile": "QOS_L",
+                "device": {"phoneNumber": device.phone_number},
+                "applicationServer": {"ipv4Address": "5.6.7.8"},
+                "duration": 3600,
+            },
+            json={**MOCK_SESSION, "sessionId": f"session-{index}", "device": {"phoneNumber": device.phone_number}},
+        )
+
+    report = await async_client.sessions.create_many(
+        devices, profile="QOS_L", duration=3600, service_ipv4="5.6.7.8", concurrency=2
+    )
+
+    assert len(report.succeeded) == 3
+    assert not report.failed
+
+    for index in range(3):
+        httpx_mock.add_response(
+            url=f"{BASE_URL}/qod/v0/sessions/session-{index}",
+            method="DELETE",
+            status_code=500 if index == 0 else 204,
+        )
+
+    report = await async_client.sessions.delete_many(result.session for result in report.succeeded)
+
+    assert len(report.succeeded) == 2
+    assert report.failed[0].session.id == "session-0"
+    assert isinstance(report.failed[0].error, ServiceError)
+
+
+@pytest.mark.asyncio
+async def test_async_slices_with_lazy_attachments(httpx_mock: HTTPXMock, async_client):
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/slice/v1/slices",
+        method="GET",
+        json=[MOCK_SLICE],
+    )
+
+    slices = await async_client.slices.get_all(lazy_attachments=True)
+
+    assert slices[0].attachments is None
+
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/device-attach/v0/attachments",
+        method="GET",
+        json=[{
+            "nac_resource_id": "attachment-1",
+            "resource": {"sliceId": "sliceone", "device": {"phoneNumber": "+9382948473"}},
+        }],
+    )
+
+    attachments = await slices[0].load_attachments()
+
+    assert [attachment.attachment_id for attachment in attachments] == ["attachment-1"]
+    assert slices[0].attachments is attachments
+
+
+@pytest.mark.asyncio
+async def test_async_detach_many(httpx_mock: HTTPXMock, async_client):
+    slice_instance = AsyncSlice(api=async_client._api, **AsyncSlice.fields_from_json(MOCK_SLICE))
+    slice_instance.set_attachments([
+        {
+            "nac_resource_id": f"attachment-{index}",
+            "resource": {"sliceId": "sliceone", "device": {"phoneNumber": f"+938294847{index}"}},
+        }
+        for index in range(3)
+    ])
+
+    for index in range(3):
+        httpx_mock.add_response(
+            url=f"{BASE_URL}/device-attach/v0/attachments/attachment-{index}",
+            method="DELETE",
+        )
+
+    devices = [async_client.devices.get(phone_number=f"+938294847{index}") for index in range(3)]
+
+    results = await slice_instance.detach_many(devices, concurrency=2)
+
+    assert sorted(device.phone_number for device, error in results if error is None) == [
+        device.phone_number for device in devices
+    ]
+    assert len(slice_instance.attachments) == 0
+
+
+@pytest.mark.asyncio
+async def test_async_wait_all(httpx_mock: HTTPXMock, async_client):
+    slices = [AsyncSlice(api=async_client._api, **AsyncSlice.fields_from_json(MOCK_SLICE))]
+
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/slice/v1/slices",
+        method="GET",
+        json=[{**MOCK_SLICE, "state": "OPERATING"}],
+    )
+
+    states = await async_client.slices.wait_all(
+        slices, desired_state="OPERATING", poll_backoff=datetime.timedelta(seconds=0)
+    )
+
+    assert states == ["OPERATING"]
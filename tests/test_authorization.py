@@ -1,6 +1,7 @@
 from network_as_code.errors import ServiceError, APIError
 from network_as_code.models.number_verification import Credentials, Endpoints
 from network_as_code.namespaces.authorization import Authorization
+from network_as_code.api.authorization_api import ENDPOINTS_CACHE
 import pytest
 from unittest.mock import patch
 
@@ -141,3 +142,57 @@ def test_create_authentication_link_without_optionals(client):
             )
 
             assert authentication_link == "https://some-auth-server.example.com/oauth2/v1/authorize?scope=number-verification%3Averify&response_type=code&client_id=my-client-id&redirect_uri=https%3A%2F%2Fexample.com%2Fredirect&login_hint=%2B3637123456"
+
+def test_credentials_and_endpoints_are_cached(httpx_mock, client):
+    httpx_mock.add_response(
+        url="https://network-as-code.p-eu.rapidapi.com/oauth2/v1/auth/clientcredentials",
+        method='GET',
+        json={"client_id": "my-client-id", "client_secret": "my-client-secret"},
+    )
+    httpx_mock.add_response(
+        url="https://network-as-code.p-eu.rapidapi.com/.well-known/openid-configuration",
+        method='GET',
+        json={"authorization_endpoint": "authorization-endpoint", "token_endpoint": "token-endpoint"},
+    )
+
+    for _ in range(3):
+        assert client.authorization.credentials().client_id == "my-client-id"
+        assert client.authorization.auth_endpoints().token_endpoint == "token-endpoint"
+
+    assert len(httpx_mock.get_requests()) == 2
+
+def test_invalidated_credentials_are_fetched_again(httpx_mock, client):
+    url = "https://network-as-code.p-eu.rapidapi.com/oauth2/v1/auth/clientcredentials"
+
+    httpx_mock.add_response(url=url, method='GET', json={"client_id": "old-id", "client_secret": "old-secret"})
+    httpx_mock.add_response(url=url, method='GET', json={"client_id": "new-id", "client_secret": "new-secret"})
+
+    assert client.authorization.credentials().client_id == "old-id"
+
+    client._api.credentials.invalidate_credentials()
+
+    assert client.authorization.credentials().client_id == "new-id"
+
+def test_expired_endpoints_are_fetched_again(httpx_mock, client, monkeypatch):
+    url = "https://network-as-code.p-eu.rapidapi.com/.well-known/openid-configuration"
+
+    monkeypatch.setattr(ENDPOINTS_CACHE, "ttl", 0)
+
+    for _ in range(2):
+        httpx_mock.add_response(
+            url=url,
+            method='GET',
+            json={"authorization_endpoint": "authorization-endpoint", "token_endpoint": "token-endpoint"},
+        )
+        client.authorization.auth_endpoints()
+
+def test_failed_credentials_are_not_cached(httpx_mock, client):
+    url = "https://network-as-code.p-eu.rapidapi.com/oauth2/v1/auth/clientcredentials"
+
+    httpx_mock.add_response(url=url, method='GET', status_code=500)
+    httpx_mock.add_response(url=url, method='GET', json={"client_id": "my-client-id", "client_secret": "my-client-secret"})
+
+    with pytest.raises(ServiceError):
+        client.authorization.credentials()
+
+    assert client.authorization.credentials().client_id == "my-client-id"
@@ -0,0 +1,128 @@
+import json
+
+import httpx
+import pytest
+
+from network_as_code.api import codec
+from network_as_code.api.codec import Codec, current_codec, use_codec
+from network_as_code.errors import ServiceError
+
+CONNECTIVITY_URL = "https://network-as-code.p-eu.rapidapi.com/device-status/v0/connectivity"
+
+
+@pytest.fixture
+def recording_codec():
+    calls = []
+
+    def encode(value):
+        calls.append(("encode", value))
+        return json.dumps(value).encode()
+
+    def decode(content):
+        calls.append(("decode", content))
+        return json.loads(content)
+
+    previous = current_codec()
+    use_codec(Codec("recording", encode, decode))
+    yield calls
+    use_codec(previous)
+
+
+@pytest.fixture(params=codec.CODECS)
+def installed_codec(request):
+    if request.param != "json":
+        pytest.importorskip(request.param)
+
+    previous = current_codec()
+    yield use_codec(request.param)
+    use_codec(previous)
+
+
+def test_standard_library_codec_is_always_available():
+    assert codec.load_codec("json").decode(codec.load_codec("json").encode({"a": "ä"})) == {"a": "ä"}
+
+
+def test_detected_codec_is_the_fastest_installed():
+    installed = []
+    for name in codec.CODECS:
+        try:
+            codec.load_codec(name)
+            installed.append(name)
+        except ImportError:
+            pass
+
+    assert codec.detect_codec().name == installed[0]
+
+
+def test_unknown_codecs_are_rejected():
+    with pytest.raises(ValueError):
+        use_codec("simplejson")
+
+
+def test_standard_library_encoding_matches_httpx():
+    assert codec.load_codec("json").encode({"device": {"phoneNumber": "+36 70"}}) == b'{"device":{"phoneNumber":"+36 70"}}'
+
+
+def test_requests_and_responses_go_through_the_codec(client, httpx_mock, recording_codec):
+    device = client.devices.get(phone_number="+3670123456")
+
+    httpx_mock.add_response(
+        url=CONNECTIVITY_URL,
+        method="POST",
+        match_json={"device": {"phoneNumber": "+3670123456"}},
+        json={"connectivityStatus": "CONNECTED_DATA"},
+    )
+
+    assert device.get_connectivity() == "CONNECTED_DATA"
+    assert [call for call, _ in recording_codec] == ["encode", "decode"]
+    assert httpx_mock.get_request().headers["content-type"] == "application/json"
+
+
+def test_responses_are_only_wrapped_for_faster_codecs(client, httpx_mock, recording_codec):
+    httpx_mock.add_response(url=CONNECTIVITY_URL, method="POST", json={"connectivityStatus": "NOT_CONNECTED"}, is_reusable=True)
+
+    assert type(client._api.devicestatus.client.post("/connectivity", json={})) is codec.CodecResponse
+
+    use_codec("json")
+
+    assert type(client._api.devicestatus.client.post("/connectivity", json={})) is httpx.Response
+
+
+def test_invalid_json_raises_value_error(installed_codec):
+    with pytest.raises(ValueError):
+        codec.decode_json(b'{"connectivityStatus": ')
+
+
+def test_errors_of_other_libraries_are_raised_as_value_error():
+    class DecodeError(Exception):
+        """Like the errors of msgspec, which are not a `ValueError`"""
+
+    def decode(content):
+        raise DecodeError("truncated")
+
+    previous = current_codec()
+    use_codec(Codec("strict", codec.load_codec("json").encode, decode))
+    try:
+        with pytest.raises(ValueError) as error:
+            codec.decode_json(b"{}")
+    finally:
+        use_codec(previous)
+
+    assert isinstance(error.value.__cause__, DecodeError)
+
+
+def test_invalid_json_in_error_responses_is_reported(client, httpx_mock, installed_codec):
+    device = client.devices.get(phone_number="+3670123456")
+
+    httpx_mock.add_response(
+        url=CONNECTIVITY_URL,
+        method="POST",
+        status_code=500,
+        content=b'{"detail": ',
+        headers={"Content-Type": "application/json"},
+    )
+
+    with pytest.raises(ServiceError) as error:
+        device.get_connectivity()
+
+    assert "Invalid JSON response" in str(error.value)
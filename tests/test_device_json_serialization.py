@@ -32,3 +32,77 @@ def test_serializing_device_with_phone_number(client):
         "networkAccessIdentifier": "test_device_id",
         "phoneNumber": "+1 206 555 0100"
     }
+
+def test_wire_dict_matches_serialized_device(client):
+    device = client.devices.get("test_device_id", phone_number="+1 206 555 0100", ipv4_address=DeviceIpv4Addr(public_address="1.1.1.2", public_port=80))
+
+    assert device.wire_dict() == device.model_dump(mode='json', by_alias=True, exclude_none=True)
+
+def test_wire_dict_matches_serialized_device_with_every_identifier(client):
+    device = client.devices.get(
+        "test_device_id",
+        phone_number="+1 206 555 0100",
+        ipv4_address=DeviceIpv4Addr(public_address="1.1.1.2", private_address="10.0.0.1", public_port=80),
+        ipv6_address="2345:0425:2CA1:0000:0000:0567:5673:23b5",
+        imsi=123456789012345,
+    )
+
+    assert device.wire_dict() == device.model_dump(mode='json', by_alias=True, exclude_none=True)
+
+def test_wire_dict_is_not_shared_between_calls(client):
+    device = client.devices.get("test_device_id", ipv4_address=DeviceIpv4Addr(public_address="1.1.1.2"))
+
+    wire = device.wire_dict()
+    wire["ipv4Address"]["publicAddress"] = None
+    del wire["networkAccessIdentifier"]
+
+    assert device.wire_dict() == {
+        "networkAccessIdentifier": "test_device_id",
+        "ipv4Address": {"publicAddress": "1.1.1.2", "privateAddress": "1.1.1.2"}
+    }
+
+def test_wire_dict_is_invalidated_on_assignment(client):
+    device = client.devices.get("test_device_id")
+    device.wire_dict()
+
+    device.phone_number = "+1 206 555 0100"
+
+    assert device.wire_dict() == {
+        "networkAccessIdentifier": "test_device_id",
+        "phoneNumber": "+1 206 555 0100"
+    }
+
+def test_wire_dict_follows_changes_to_the_ipv4_address(client):
+    device = client.devices.get("test_device_id", ipv4_address=DeviceIpv4Addr(public_address="1.1.1.2"))
+    device.wire_dict()
+
+    device.ipv4_address.public_port = 8080
+
+    assert device.wire_dict()["ipv4Address"]["publicPort"] == 8080
+
+def test_wire_dict_of_a_copy_has_its_own_identifiers(client):
+    device = client.devices.get(phone_number="+1")
+    device.wire_dict()
+
+    copy = device.model_copy(update={"phone_number": "+2"})
+
+    assert copy.wire_dict() == {"phoneNumber": "+2"}
+    assert device.wire_dict() == {"phoneNumber": "+1"}
+
+def test_polling_does_not_serialize_the_device_with_pydantic(client, httpx_mock, monkeypatch):
+    device = client.devices.get("test_device_id")
+    dumps = []
+    monkeypatch.setattr(type(device), "model_dump", lambda self, **kwargs: dumps.append(kwargs) or {"networkAccessIdentifier": "test_device_id"})
+
+    httpx_mock.add_response(
+        url="https://network-as-code.p-eu.rapidapi.com/device-status/v0/connectivity",
+        method="POST",
+        match_json={"device": {"networkAccessIdentifier": "test_device_id"}},
+        json={"connectivityStatus": "CONNECTED_DATA"},
+        is_reusable=True,
+    )
+
+    for _ in range(3):
+        assert device.get_connectivity() == "CONNECTED_DATA"
+
+    assert dumps == []
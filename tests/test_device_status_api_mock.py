@@ -1,12 +1,21 @@
-import pytest
+import asyncio
+import dataclasses
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import httpx
+import pytest
+
+from network_as_code import NetworkAsCodeClient, AsyncNetworkAsCodeClient
+from network_as_code.api import CachePolicy
+from network_as_code.api.cache import TTLCache
 from network_as_code.errors import AuthenticationException, NotFound, ServiceError, APIError
 
 
 from network_as_code.models.device import Device, DeviceIpv4Addr
 
-from network_as_code.models.device_status import EventType
+from network_as_code.models.device_status import EventSubscriptionRow, EventType
 
 @pytest.fixture
 def device(client) -> Device:
@@ -546,6 +555,38 @@ def test_get_subscriptions(httpx_mock, device, client):
         assert subscription.id
         assert subscription.device
 
+def test_get_subscriptions_as_rows(httpx_mock, client):
+    httpx_mock.add_response(
+        method="GET",
+        url="https://network-as-code.p-eu.rapidapi.com/device-status/v0/subscriptions",
+        json=[
+            {
+                "subscriptionDetail": {
+                    "device": {
+                        "networkAccessIdentifier": "testuser@testcsp.net"
+                    },
+                    "type": "org.camaraproject.device-status.v0.connectivity-data"
+                },
+                "maxNumberOfReports": 1,
+                "webhook": {
+                    "notificationUrl": "http://192.0.2.0:8080/",
+                    "notificationAuthToken": "c8974e592c2fa383d4a3960714"
+                },
+                "subscriptionId": "34e9e3ee-e281-4f47-bbc2-2431e6abbef0",
+                "startsAt": "2024-04-09T11:14:50.254312Z",
+            }
+        ],
+        is_reusable=True,
+    )
+
+    rows = client.connectivity.get_subscriptions(rows=True)
+    subscriptions = client.connectivity.get_subscriptions()
+
+    assert isinstance(rows[0], EventSubscriptionRow)
+    for field in dataclasses.fields(EventSubscriptionRow):
+        assert getattr(rows[0], field.name) == getattr(subscriptions[0], field.name)
+    assert rows[0].device.network_access_identifier == "testuser@testcsp.net"
+
 def test_poll_connectivity(httpx_mock, device, client):
     httpx_mock.add_response(
         method="POST",
@@ -655,3 +696,88 @@ def test_subscribe_api_error(httpx_mock, device, client):
             notification_url="http://localhost:9090/notify", 
             notification_auth_token="my-token"
         )
+
+CONNECTIVITY_URL = "https://network-as-code.p-eu.rapidapi.com/device-status/v0/connectivity"
+ROAMING_URL = "https://network-as-code.p-eu.rapidapi.com/device-status/v0/roaming"
+
+def test_device_status_is_not_cached_by_default(httpx_mock, device):
+    httpx_mock.add_response(method="POST", url=CONNECTIVITY_URL, json={"connectivityStatus": "CONNECTED_DATA"}, is_reusable=True)
+
+    device.get_connectivity()
+    device.get_connectivity()
+
+    assert len(httpx_mock.get_requests()) == 2
+
+def test_cached_device_status_is_reused_until_it_expires(httpx_mock):
+    client = NetworkAsCodeClient(token="TEST_TOKEN", device_status_cache=CachePolicy(ttl=0.2))
+    device = client.devices.get(phone_number="7777777777")
+    other_device = client.devices.get(phone_number="8888888888")
+
+    httpx_mock.add_response(method="POST", url=CONNECTIVITY_URL, json={"connectivityStatus": "CONNECTED_DATA"}, is_reusable=True)
+    httpx_mock.add_response(method="POST", url=ROAMING_URL, json={"roaming": False}, is_reusable=True)
+
+    assert device.get_connectivity() == "CONNECTED_DATA"
+    assert client.devices.get(phone_number="7777777777").get_connectivity() == "CONNECTED_DATA"
+    assert not device.get_roaming().roaming
+    assert not device.get_roaming().roaming
+    other_device.get_connectivity()
+
+    assert len(httpx_mock.get_requests(url=CONNECTIVITY_URL)) == 2
+    assert len(httpx_mock.get_requests(url=ROAMING_URL)) == 1
+
+    time.sleep(0.2)
+    device.get_connectivity()
+
+    assert len(httpx_mock.get_requests(url=CONNECTIVITY_URL)) == 3
+
+def test_concurrent_device_status_queries_share_one_request(httpx_mock):
+    client = NetworkAsCodeClient(token="TEST_TOKEN", device_status_cache=CachePolicy(ttl=60))
+    device = client.devices.get(phone_number="7777777777")
+
+    def respond(request):
+        time.sleep(0.1)
+        return httpx.Response(200, json={"connectivityStatus": "CONNECTED_SMS"})
+
+    httpx_mock.add_callback(respond, method="POST", url=CONNECTIVITY_URL, is_reusable=True)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        statuses = list(executor.map(lambda _: device.get_connectivity(), range(8)))
+
+    assert statuses == ["CONNECTED_SMS"] * 8
+    assert len(httpx_mock.get_requests()) == 1
+
+def test_failed_device_status_queries_are_not_cached(httpx_mock):
+    client = NetworkAsCodeClient(token="TEST_TOKEN", device_status_cache=CachePolicy(ttl=60))
+    device = client.devices.get(phone_number="7777777777")
+
+    httpx_mock.add_response(method="POST", url=CONNECTIVITY_URL, status_code=500)
+    httpx_mock.add_response(method="POST", url=CONNECTIVITY_URL, json={"connectivityStatus": "NOT_CONNECTED"})
+
+    with pytest.raises(ServiceError):
+        device.get_connectivity()
+
+    assert device.get_connectivity() == "NOT_CONNECTED"
+
+@pytest.mark.asyncio
+async def test_concurrent_async_device_status_queries_share_one_request(httpx_mock):
+    client = AsyncNetworkAsCodeClient(token="TEST_TOKEN", device_status_cache=CachePolicy(ttl=60))
+    device = client.devices.get(phone_number="7777777777")
+
+    httpx_mock.add_response(method="POST", url=ROAMING_URL, json={"roaming": True, "countryCode": 358})
+
+    statuses = await asyncio.gather(*[device.get_roaming() for _ in range(5)])
+
+    assert [status.country_code for status in statuses] == [358] * 5
+    assert len(httpx_mock.get_requests()) == 1
+
+def test_least_recently_used_statuses_are_evicted():
+    cache = TTLCache(ttl=60, max_size=2)
+
+    cache.set("first", 1)
+    cache.set("second", 2)
+    cache.get("first")
+    cache.set("third", 3)
+
+    assert cache.get("first") == 1
+    assert cache.get("second") is None
+    assert cache.get("third") == 3
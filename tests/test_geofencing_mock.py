@@ -1,7 +1,9 @@
+import dataclasses
+
 import pytest
 
 from network_as_code.models.device import DeviceIpv4Addr, Device
-from network_as_code.models.geofencing import PlainCredential, AccessTokenCredential, EventType
+from network_as_code.models.geofencing import PlainCredential, AccessTokenCredential, EventType, GeofencingSubscriptionRow
 from network_as_code.errors import NotFound, AuthenticationException, APIError, ServiceError
 
 
@@ -595,6 +597,46 @@ def test_getting_geofencing_subscriptions(httpx_mock, client):
         
     
 
+def test_getting_all_geofencing_subscriptions_as_rows(httpx_mock, client):
+    httpx_mock.add_response(
+        url="https://network-as-code.p-eu.rapidapi.com/geofencing-subscriptions/v0.3/subscriptions",
+        method="GET",
+        json=[
+            {
+            "protocol": "HTTP",
+            "sink": "https://example.com/",
+            "types": [
+                "org.camaraproject.geofencing-subscriptions.v0.area-entered"
+            ],
+            "config": {
+                "subscriptionDetail": {
+                "device": {
+                    "phoneNumber": "+987654321"
+                },
+                "area": {
+                    "areaType": "CIRCLE",
+                    "center": {
+                    "latitude": -90,
+                    "longitude": -180
+                    },
+                    "radius": 2001
+                }
+                },
+            },
+            "id": "de87e438-58b4-42c3-9d49-0fbfbd878305",
+            "startsAt": "2025-01-23T10:30:30.616Z"
+            }
+        ],
+        is_reusable=True,
+    )
+
+    rows = client.geofencing.get_all(rows=True)
+    subscriptions = client.geofencing.get_all()
+
+    assert isinstance(rows[0], GeofencingSubscriptionRow)
+    for field in dataclasses.fields(GeofencingSubscriptionRow):
+        assert getattr(rows[0], field.name) == getattr(subscriptions[0], field.name)
+
 def test_deleting_geofencing_subscription(httpx_mock, client):
     httpx_mock.add_response(
         url="https://network-as-code.p-eu.rapidapi.com/geofencing-subscriptions/v0.3/subscriptions/de87e438-58b4-42c3-9d49-0fbfbd878305",
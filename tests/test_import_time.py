@@ -0,0 +1,87 @@
+import json
+import re
+import subprocess
+import sys
+
+# Budget for the time spent in the modules of the SDK itself when importing
+# it, leaving out the time spent importing httpx and the standard library
+IMPORT_TIME_BUDGET_US = 100_000
+
+# Modules which are only needed once the corresponding product is used
+LAZY_MODULES = [
+    "pydantic",
+    "network_as_code.models",
+    "network_as_code.models.device",
+    "network_as_code.models.slice",
+    "network_as_code.api.slice_api",
+    "network_as_code.api.qod_api",
+    "network_as_code.api.geofencing_api",
+    "network_as_code.namespaces.slice",
+]
+
+
+def run_python(code: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *options, "-c", code], capture_output=True, text=True, check=True
+    )
+
+
+def sdk_import_time() -> int:
+    """Returns the microseconds spent in the modules of the SDK while importing it"""
+    process = run_python("import network_as_code", "-X", "importtime")
+
+    total = 0
+    for line in process.stderr.splitlines():
+        match = re.match(r"import time:\s+(\d+) \|\s+\d+ \|\s+(\S+)", line)
+        if match and match.group(2).startswith("network_as_code"):
+            total += int(match.group(1))
+    return total
+
+
+def test_creating_a_client_does_not_import_unused_products():
+    process = run_python(
+        "import json, sys\n"
+        "from network_as_code import NetworkAsCodeClient\n"
+        "NetworkAsCodeClient(token='TEST_TOKEN')\n"
+        "print(json.dumps(sorted(sys.modules)))"
+    )
+
+    imported = set(json.loads(process.stdout))
+
+    assert imported.isdisjoint(LAZY_MODULES)
+
+
+def test_using_a_product_imports_only_what_it_needs():
+    process = run_python(
+        "import json, sys\n"
+        "from network_as_code import NetworkAsCodeClient\n"
+        "client = NetworkAsCodeClient(token='TEST_TOKEN')\n"
+        "client.devices.get(phone_number='+3670123456')\n"
+        "client._api.sim_swap\n"
+        "print(json.dumps(sorted(sys.modules)))"
+    )
+
+    imported = set(json.loads(process.stdout))
+
+    assert "network_as_code.api.sim_swap_api" in imported
+    assert "network_as_code.models.device" in imported
+    assert "network_as_code.api.slice_api" not in imported
+    assert "network_as_code.models.slice" not in imported
+
+
+def test_import_time_stays_within_budget():
+    # The fastest of a few runs, to not fail on a momentarily busy machine
+    fastest = min(sdk_import_time() for _ in range(3))
+
+    assert fastest < IMPORT_TIME_BUDGET_US
+
+
+def test_session_models_are_complete_when_imported_on_their_own():
+    process = run_python(
+        "import json\n"
+        "from network_as_code.models.session import AsyncQoDSession, QoDSession, SessionReport, SessionResult\n"
+        "models = [QoDSession, AsyncQoDSession, SessionResult, SessionReport]\n"
+        "print(json.dumps([model.__pydantic_complete__ for model in models]))"
+    )
+
+    assert json.loads(process.stdout) == [True, True, True, True]
@@ -1,10 +1,13 @@
+import json
 import pytest
+from network_as_code import NetworkAsCodeClient, AsyncNetworkAsCodeClient
+from network_as_code.api import CachePolicy
 from network_as_code.errors import AuthenticationException, ServiceError
 from network_as_code.models.device import Device, DeviceIpv4Addr
 
 import pytest
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 @pytest.fixture
 def device(client) -> Device:
@@ -258,3 +261,167 @@ def test_verify_location_raises_exception_if_server_fails(httpx_mock, device):
 
     with pytest.raises(ServiceError):
         device.verify_location(longitude=19, latitude=47, radius=10_000)
+
+
+def test_locate_many_streams_results_and_errors(httpx_mock, client):
+    url = "https://network-as-code.p-eu.rapidapi.com/location-retrieval/v0/retrieve"
+
+    devices = [client.devices.get(phone_number=f"+3670123456{i}") for i in range(3)]
+
+    for index, device in enumerate(devices):
+        httpx_mock.add_response(
+            url=url,
+            method='POST',
+            match_json={"device": {"phoneNumber": device.phone_number}, "maxAge": 120},
+            status_code=500 if index == 1 else 200,
+            json={
+                "lastLocationTime": "2023-09-12T11:41:28+03:00",
+                "area": {
+                    "areaType": "CIRCLE",
+                    "center": {"latitude": float(index), "longitude": 0.0},
+                    "radius": 10000
+                }
+            },
+        )
+
+    results = dict(
+        (device.phone_number, location)
+        for device, location in client.devices.locate_many(devices, max_age=120, concurrency=2)
+    )
+
+    assert len(results) == 3
+    assert results["+36701234560"].latitude == 0.0
+    assert isinstance(results["+36701234561"], ServiceError)
+    assert results["+36701234562"].latitude == 2.0
+
+
+def test_locate_many_reports_malformed_responses_per_device(httpx_mock, client):
+    url = "https://network-as-code.p-eu.rapidapi.com/location-retrieval/v0/retrieve"
+
+    devices = [client.devices.get(phone_number=f"+3670123456{i}") for i in range(3)]
+
+    for index, device in enumerate(devices):
+        httpx_mock.add_response(
+            url=url,
+            method='POST',
+            match_json={"device": {"phoneNumber": device.phone_number}, "maxAge": 60},
+            # The second response lacks the area of the device
+            json={"lastLocationTime": "2023-09-12T11:41:28+03:00"} if index == 1 else {
+                "lastLocationTime": "2023-09-12T11:41:28+03:00",
+                "area": {
+                    "areaType": "CIRCLE",
+                    "center": {"latitude": float(index), "longitude": 0.0},
+                    "radius": 10000
+                }
+            },
+        )
+
+    results = dict(
+        (device.phone_number, location)
+        for device, location in client.devices.locate_many(devices, concurrency=1)
+    )
+
+    assert len(results) == 3
+    assert isinstance(results["+36701234561"], KeyError)
+    assert results["+36701234562"].latitude == 2.0
+
+
+def test_locate_many_rejects_zero_concurrency(client):
+    with pytest.raises(ValueError):
+        list(client.devices.locate_many([], concurrency=0))
+
+RETRIEVE_URL = "https://network-as-code.p-eu.rapidapi.com/location-retrieval/v0/retrieve"
+
+def location_response(age: float = 0) -> dict:
+    located = datetime.now(timezone.utc) - timedelta(seconds=age)
+    return {
+        "lastLocationTime": located.isoformat(),
+        "area": {
+            "areaType": "CIRCLE",
+            "center": {"latitude": 47.48, "longitude": 19.07},
+            "radius": 100
+        }
+    }
+
+def test_locations_are_not_cached_by_default(httpx_mock, device):
+    httpx_mock.add_response(url=RETRIEVE_URL, method="POST", json=location_response(), is_reusable=True)
+
+    device.location(max_age=60)
+    device.location(max_age=60)
+
+    assert len(httpx_mock.get_requests()) == 2
+
+def test_cached_location_is_reused_within_max_age(httpx_mock):
+    client = NetworkAsCodeClient(token="TEST_TOKEN", location_cache=CachePolicy(ttl=300))
+    device = client.devices.get(phone_number="+3670123456")
+
+    httpx_mock.add_response(url=RETRIEVE_URL, method="POST", json=location_response(age=30), is_reusable=True)
+
+    first = device.location(max_age=60)
+    second = client.devices.get(phone_number="+3670123456").location(max_age=60)
+
+    assert len(httpx_mock.get_requests()) == 1
+    assert (second.latitude, second.longitude) == (first.latitude, first.longitude)
+    assert second.last_location_time == first.last_location_time
+
+    # The cached location was found 30 seconds ago, too long ago for this call
+    device.location(max_age=10)
+
+    assert len(httpx_mock.get_requests()) == 2
+    assert client._api.location_cache.stats() == {"hits": 1, "misses": 2, "size": 1}
+
+@pytest.mark.parametrize("max_age", [None, 0])
+def test_location_without_max_age_skips_the_cache(httpx_mock, max_age):
+    client = NetworkAsCodeClient(token="TEST_TOKEN", location_cache=CachePolicy(ttl=300))
+    device = client.devices.get(phone_number="+3670123456")
+
+    httpx_mock.add_response(url=RETRIEVE_URL, method="POST", json=location_response(), is_reusable=True)
+
+    device.location(max_age=60)
+    location = device.location(max_age=max_age)
+
+    assert location.radius == 100
+    assert len(httpx_mock.get_requests()) == 2
+    # The network decides how old the location may be, as for a client without a cache
+    assert "maxAge" not in json.loads(httpx_mock.get_requests()[1].content)
+
+def test_least_recently_used_locations_are_evicted(httpx_mock):
+    client = NetworkAsCodeClient(token="TEST_TOKEN", location_cache=CachePolicy(ttl=300, max_size=1))
+    first = client.devices.get(phone_number="+3670123456")
+    second = client.devices.get(phone_number="+3670654321")
+
+    httpx_mock.add_response(url=RETRIEVE_URL, method="POST", json=location_response(), is_reusable=True)
+
+    first.location()
+    second.location()
+    second.location()
+    first.location()
+
+    assert len(httpx_mock.get_requests()) == 3
+
+@pytest.mark.asyncio
+async def test_async_cached_location_is_reused_within_max_age(httpx_mock):
+    client = AsyncNetworkAsCodeClient(token="TEST_TOKEN", location_cache=CachePolicy(ttl=300))
+    device = client.devices.get(phone_number="+3670123456")
+
+    httpx_mock.add_response(url=RETRIEVE_URL, method="POST", json=location_response(), is_reusable=True)
+
+    await device.location(max_age=60)
+    location = await device.location(max_age=60)
+
+    assert location.radius == 100
+    assert len(httpx_mock.get_requests()) == 1
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_age", [None, 0])
+async def test_async_location_without_max_age_skips_the_cache(httpx_mock, max_age):
+    client = AsyncNetworkAsCodeClient(token="TEST_TOKEN", location_cache=CachePolicy(ttl=300))
+    device = client.devices.get(phone_number="+3670123456")
+
+    httpx_mock.add_response(url=RETRIEVE_URL, method="POST", json=location_response(), is_reusable=True)
+
+    await device.location(max_age=60)
+    location = await device.location(max_age=max_age)
+
+    assert location.radius == 100
+    assert len(httpx_mock.get_requests()) == 2
@@ -1,7 +1,7 @@
 import pytest
 
 from datetime import datetime
-from network_as_code.models.congestion import Congestion, CongestionSubscription
+from network_as_code.models.congestion import Congestion, CongestionRow, CongestionSubscription, CongestionSubscriptionRow
 
 from network_as_code.models.device import Device
 
@@ -72,6 +72,31 @@ def test_can_request_congestion_time_range(httpx_mock, camara_device):
 
     assert congestion[0].level == "medium"
 
+def test_can_request_congestion_time_range_as_rows(httpx_mock, camara_device):
+    httpx_mock.add_response(
+        url="https://network-as-code.p-eu.rapidapi.com/congestion-insights/v0/query",
+        method="POST",
+        json=[
+            {
+                "timeIntervalStart": "2024-08-20T21:00:00+00:00",
+                "timeIntervalStop": "2024-08-20T21:05:00+00:00",
+                "congestionLevel": "medium",
+                "confidenceLevel": 50
+            }
+        ],
+    )
+
+    congestion = camara_device.get_congestion(rows=True)
+
+    assert congestion == [
+        CongestionRow(
+            level="medium",
+            start=datetime.fromisoformat("2024-08-20T21:00:00+00:00"),
+            stop=datetime.fromisoformat("2024-08-20T21:05:00+00:00"),
+            confidence=50,
+        )
+    ]
+
 def test_can_subscribe_to_congestion_reports(httpx_mock, client, camara_device):
     httpx_mock.add_response(
         url="https://network-as-code.p-eu.rapidapi.com/congestion-insights/v0/subscriptions",
@@ -193,3 +218,27 @@ def test_get_subscriptions(httpx_mock, client):
 
     for subscription in subscriptions:
         assert subscription.id
+
+
+def test_get_subscriptions_as_rows(httpx_mock, client):
+    httpx_mock.add_response(
+        url="https://network-as-code.p-eu.rapidapi.com/congestion-insights/v0/subscriptions",
+        method="GET",
+        json=[
+            {
+                "subscriptionId": "asd",
+                "startedAt": "2024-08-20T21:00:00+00:00",
+                "expiresAt": None
+            }
+        ]
+    )
+
+    subscriptions = client.insights.get_congestion_subscriptions(rows=True)
+
+    assert subscriptions == [
+        CongestionSubscriptionRow(
+            id="asd",
+            starts_at=datetime.fromisoformat("2024-08-20T21:00:00+00:00"),
+            expires_at=None,
+        )
+    ]
@@ -92,3 +92,33 @@ def test_verify_number_with_no_phone_number(client):
         device.verify_number(code='your-code')
                             
 
+
+def test_verify_number_exchanges_codes_over_pooled_client(httpx_mock, client, device):
+    assert client._api.token.client._transport.pool is client._api.transport
+
+    httpx_mock.add_response(
+        url="https://network-as-code.p-eu.rapidapi.com/oauth2/v1/auth/clientcredentials",
+        method='GET',
+        json={"client_id": "my-client-id", "client_secret": "my-client-secret"},
+    )
+    httpx_mock.add_response(
+        url="https://network-as-code.p-eu.rapidapi.com/.well-known/openid-configuration",
+        method='GET',
+        json={"authorization_endpoint": "https://auth.example.com/authorize", "token_endpoint": "https://auth.example.com/token"},
+    )
+
+    for code in ("first-code", "second-code"):
+        httpx_mock.add_response(
+            url="https://auth.example.com/token",
+            method='POST',
+            match_content=f"client_id=my-client-id&client_secret=my-client-secret&grant_type=authorization_code&code={code}".encode(),
+            json={"access_token": "my-token", "token_type": "Bearer", "expires_in": 12345},
+        )
+        httpx_mock.add_response(
+            url="https://network-as-code.p-eu.rapidapi.com/passthrough/camara/v1/number-verification/number-verification/v0/verify",
+            method='POST',
+            match_headers={"Authorization": "Bearer my-token"},
+            json={"devicePhoneNumberVerified": True},
+        )
+
+        assert device.verify_number(code=code) == True
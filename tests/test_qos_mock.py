@@ -1,9 +1,10 @@
+import dataclasses
 from datetime import datetime
 import pytest
 
 from network_as_code.models.device import DeviceIpv4Addr, PortsSpec
-from network_as_code.errors import AuthenticationException
-from network_as_code.models.session import PortRange
+from network_as_code.errors import AuthenticationException, NotFound
+from network_as_code.models.session import PortRange, QoDSession, QoDSessionRow
 
 def test_creating_a_session_mock(httpx_mock, client):
     device = client.devices.get("testuser@open5glab.net", ipv4_address = DeviceIpv4Addr(public_address="1.1.1.2", private_address="1.1.1.2", public_port=80), phone_number = "+9382948473")
@@ -516,6 +517,43 @@ def test_getting_all_sessions(httpx_mock, client):
 
     assert session[0].id == "1234"
 
+def test_getting_all_sessions_as_rows(httpx_mock, client):
+    device = client.devices.get(phone_number="+3670123456")
+
+    mock_response = [{
+        "sessionId": "1234",
+        "qosProfile": "QOS_L",
+        "device": {
+            "phoneNumber": "+3670123456",
+        },
+        "applicationServer": {
+            "ipv4Address": "5.6.7.8",
+        },
+        "devicePorts": {
+            "ports": [80, 443],
+        },
+        "duration": 3600,
+        "qosStatus": "REQUESTED",
+        "startedAt": "2024-06-18T08:48:12.300312Z",
+        "expiresAt": "2024-06-18T09:48:12.300312Z"
+    }]
+
+    httpx_mock.add_response(
+        method='POST',
+        url='https://network-as-code.p-eu.rapidapi.com/qod/v0/retrieve-sessions',
+        json=mock_response,
+        is_reusable=True,
+    )
+
+    rows = device.sessions(rows=True)
+    sessions = device.sessions()
+
+    assert isinstance(rows[0], QoDSessionRow)
+    assert not hasattr(rows[0], "__dict__")
+    assert rows[0].device is device
+    for field in dataclasses.fields(QoDSessionRow):
+        assert getattr(rows[0], field.name) == getattr(sessions[0], field.name)
+
 def test_clearing_device_sessions(httpx_mock, client):
     device = client.devices.get("testuser@open5glab.net")
 
@@ -697,3 +735,67 @@ def test_extending_a_qod_session_duration(httpx_mock, client):
     session = client.sessions.get(session_id)
     session.extend(additional_duration=240)
     assert session.duration == 3840
+
+
+def test_creating_sessions_for_many_devices(httpx_mock, client):
+    devices = [client.devices.get(phone_number=f"+938294847{i}") for i in range(4)]
+
+    for index, device in enumerate(devices):
+        httpx_mock.add_response(
+            method="POST",
+            url="https://network-as-code.p-eu.rapidapi.com/qod/v0/sessions",
+            match_json={
+                "qosProfile": "QOS_L",
+                "device": {"phoneNumber": device.phone_number},
+                "applicationServer": {"ipv4Address": "5.6.7.8"},
+                "duration": 3600,
+            },
+            status_code=403 if index == 2 else 200,
+            json={
+                "sessionId": f"session-{index}",
+                "qosProfile": "QOS_L",
+                "device": {"phoneNumber": device.phone_number},
+                "applicationServer": {"ipv4Address": "5.6.7.8"},
+                "duration": 3600,
+                "qosStatus": "REQUESTED",
+            },
+        )
+
+    report = client.sessions.create_many(
+        devices, profile="QOS_L", duration=3600, service_ipv4="5.6.7.8", concurrency=3
+    )
+
+    assert len(report.results) == 4
+    assert sorted(result.session.id for result in report.succeeded) == ["session-0", "session-1", "session-3"]
+    assert all(result.session.device is result.device for result in report.succeeded)
+    assert len(report.failed) == 1
+    assert report.failed[0].device is devices[2]
+    assert isinstance(report.failed[0].error, AuthenticationException)
+
+
+def test_create_many_requires_ip_before_sending_requests(client):
+    devices = [client.devices.get(phone_number="+9382948473")]
+
+    with pytest.raises(ValueError):
+        client.sessions.create_many(devices, profile="QOS_L", duration=3600)
+
+
+def test_deleting_many_sessions(httpx_mock, client):
+    device = client.devices.get(phone_number="+9382948473")
+    sessions = [
+        QoDSession(api=client._api, device=device, id=f"session-{index}", profile="QOS_L", status="AVAILABLE")
+        for index in range(3)
+    ]
+
+    for index in range(3):
+        httpx_mock.add_response(
+            method="DELETE",
+            url=f"https://network-as-code.p-eu.rapidapi.com/qod/v0/sessions/session-{index}",
+            status_code=404 if index == 1 else 204,
+        )
+
+    report = client.sessions.delete_many(sessions, concurrency=2)
+
+    assert sorted(result.session.id for result in report.succeeded) == ["session-0", "session-2"]
+    assert [result.session.id for result in report.failed] == ["session-1"]
+    assert isinstance(report.failed[0].error, NotFound)
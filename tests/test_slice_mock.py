@@ -1,9 +1,12 @@
 import copy
+import dataclasses
 import pytest
+from datetime import timedelta
 from typing import Any, Dict
 from pytest_httpx import HTTPXMock
 from network_as_code.client import NetworkAsCodeClient
-from network_as_code.models.slice import Apps, NetworkIdentifier, Slice, SliceInfo, AreaOfService, Point, Throughput, TrafficCategories, Customer
+from network_as_code.api.backoff import backoff_delay
+from network_as_code.models.slice import Apps, NetworkIdentifier, Slice, SliceInfo, SliceRow, AreaOfService, Point, Throughput, TrafficCategories, Customer
 from network_as_code.models.device import Device, DeviceIpv4Addr
 
 
@@ -302,6 +305,214 @@ def test_get_slice(httpx_mock: HTTPXMock, client: NetworkAsCodeClient):
     response = client.slices.get(MOCK_SLICE['slice']['name'])
     assert response.sid == MOCK_SLICE['csi_id']
 
+def test_get_all_slices_lists_attachments_once(httpx_mock: HTTPXMock, client: NetworkAsCodeClient):
+    slices = []
+    for name in ("sliceone", "slicetwo", "slicethree"):
+        slice_json = copy.deepcopy(MOCK_SLICE)
+        slice_json["slice"]["name"] = name
+        slices.append(slice_json)
+
+    httpx_mock.add_response(
+        method="GET",
+        url="https://network-as-code.p-eu.rapidapi.com/slice/v1/slices",
+        json=slices
+    )
+    # Registered once, so a second attachment listing would fail the test
+    httpx_mock.add_response(
+        method="GET",
+        url="https://network-as-code.p-eu.rapidapi.com/device-attach/v0/attachments",
+        json=[{
+            "nac_resource_id": "attachment-1",
+            "resource": {
+                "device": {
+                    "phoneNumber": "12065550100"
+                },
+                "sliceId": "sliceone"
+            },
+        }, {
+            "nac_resource_id": "attachment-2",
+            "resource": {
+                "device": {
+                    "phoneNumber": "09213284343"
+                },
+                "sliceId": "slicetwo"
+            },
+        }, {
+            "nac_resource_id": "attachment-3",
+            "resource": {
+                "device": {
+                    "phoneNumber": "12065550101"
+                },
+                "sliceId": "sliceone"
+            },
+        }]
+    )
+
+    fetched = client.slices.get_all()
+
+    assert [len(fetched_slice.attachments) for fetched_slice in fetched] == [2, 1, 0]
+    assert [attachment.attachment_id for attachment in fetched[1].attachments] == ["attachment-2"]
+
+    httpx_mock.add_response(
+        method="GET",
+        json=slices[1],
+        url="https://network-as-code.p-eu.rapidapi.com/slice/v1/slices/slicetwo"
+    )
+
+    cached = client.slices.get("slicetwo", cached_attachments=True)
+
+    assert [attachment.attachment_id for attachment in cached.attachments] == ["attachment-2"]
+
+
+def test_cached_attachments_are_listed_again_after_detaching(httpx_mock: HTTPXMock, client: NetworkAsCodeClient):
+    attachment = {
+        "nac_resource_id": "attachment-1",
+        "resource": {"device": {"phoneNumber": "12065550100"}, "sliceId": "sliceone"},
+    }
+    httpx_mock.add_response(
+        method="GET",
+        url="https://network-as-code.p-eu.rapidapi.com/slice/v1/slices",
+        json=[MOCK_SLICE],
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url="https://network-as-code.p-eu.rapidapi.com/device-attach/v0/attachments",
+        json=[attachment],
+    )
+    httpx_mock.add_response(
+        method="DELETE",
+        url="https://network-as-code.p-eu.rapidapi.com/device-attach/v0/attachments/attachment-1",
+    )
+
+    [fetched] = client.slices.get_all()
+    fetched.detach(client.devices.get(phone_number="12065550100"))
+
+    httpx_mock.add_response(
+        method="GET",
+        url=f"https://network-as-code.p-eu.rapidapi.com/slice/v1/slices/{MOCK_SLICE['slice']['name']}",
+        json=MOCK_SLICE,
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url="https://network-as-code.p-eu.rapidapi.com/device-attach/v0/attachments",
+        json=[],
+    )
+
+    cached = client.slices.get(MOCK_SLICE["slice"]["name"], cached_attachments=True)
+
+    assert len(cached.attachments) == 0
+
+
+def test_cached_attachments_expire(httpx_mock: HTTPXMock, client: NetworkAsCodeClient, monkeypatch):
+    httpx_mock.add_response(
+        method="GET",
+        url=f"https://network-as-code.p-eu.rapidapi.com/slice/v1/slices/{MOCK_SLICE['slice']['name']}",
+        json=MOCK_SLICE,
+        is_reusable=True,
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url="https://network-as-code.p-eu.rapidapi.com/device-attach/v0/attachments",
+        json=[],
+        is_reusable=True,
+    )
+    monkeypatch.setattr(client._api.attachment_index, "ttl", 0.0)
+
+    client.slices.get(MOCK_SLICE["slice"]["name"])
+    client.slices.get(MOCK_SLICE["slice"]["name"], cached_attachments=True)
+
+    assert len(httpx_mock.get_requests(url="https://network-as-code.p-eu.rapidapi.com/device-attach/v0/attachments")) == 2
+
+
+def test_get_all_slices_as_rows(httpx_mock: HTTPXMock, client: NetworkAsCodeClient):
+    httpx_mock.add_response(
+        method="GET",
+        url="https://network-as-code.p-eu.rapidapi.com/slice/v1/slices",
+        json=[MOCK_SLICE],
+        is_reusable=True,
+    )
+
+    rows = client.slices.get_all(rows=True)
+    models = client.slices.get_all(lazy_attachments=True)
+
+    assert isinstance(rows[0], SliceRow)
+    assert not hasattr(rows[0], "__dict__")
+    for field in dataclasses.fields(SliceRow):
+        assert getattr(rows[0], field.name) == getattr(models[0], field.name)
+    # Rows never list the attachments
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_get_all_slices_with_lazy_attachments(httpx_mock: HTTPXMock, client: NetworkAsCodeClient):
+    httpx_mock.add_response(
+        method="GET",
+        url="https://network-as-code.p-eu.rapidapi.com/slice/v1/slices",
+        json=[MOCK_SLICE]
+    )
+
+    fetched = client.slices.get_all(lazy_attachments=True)
+
+    assert fetched[0].state == MOCK_SLICE["state"]
+
+    httpx_mock.add_response(
+        method="GET",
+        url="https://network-as-code.p-eu.rapidapi.com/device-attach/v0/attachments",
+        json=[{
+            "nac_resource_id": "attachment-1",
+            "resource": {
+                "device": {
+                    "phoneNumber": "12065550100"
+                },
+                "sliceId": "sliceone"
+            },
+        }, {
+            "nac_resource_id": "attachment-2",
+            "resource": {
+                "device": {
+                    "phoneNumber": "09213284343"
+                },
+                "sliceId": "slicetwo"
+            },
+        }]
+    )
+
+    assert [attachment.attachment_id for attachment in fetched[0].attachments] == ["attachment-1"]
+    # Loaded attachments are kept on the slice
+    assert len(fetched[0].attachments) == 1
+
+
+def test_detaching_from_lazy_slice_loads_attachments(httpx_mock: HTTPXMock, client: NetworkAsCodeClient):
+    httpx_mock.add_response(
+        method="GET",
+        json=MOCK_SLICE,
+        url=f"https://network-as-code.p-eu.rapidapi.com/slice/v1/slices/{MOCK_SLICE['slice']['name']}"
+    )
+
+    fetched = client.slices.get(MOCK_SLICE['slice']['name'], lazy_attachments=True)
+
+    httpx_mock.add_response(
+        method="GET",
+        url="https://network-as-code.p-eu.rapidapi.com/device-attach/v0/attachments",
+        json=[{
+            "nac_resource_id": "attachment-1",
+            "resource": {
+                "device": {
+                    "phoneNumber": "12065550100"
+                },
+                "sliceId": "sliceone"
+            },
+        }]
+    )
+    httpx_mock.add_response(
+        method="DELETE",
+        url="https://network-as-code.p-eu.rapidapi.com/device-attach/v0/attachments/attachment-1"
+    )
+
+    fetched.detach(client.devices.get(phone_number="12065550100"))
+
+    assert len(fetched.attachments) == 0
+
+
 def test_get_slice_with_no_differentiator(httpx_mock: HTTPXMock, client: NetworkAsCodeClient):
     MOCK_SLICE_RES: Dict[str, Any] = {
     "slice": {
@@ -518,6 +729,62 @@ async def test_slice_wait_for_can_wait_for_arbitrary_state(httpx_mock: HTTPXMock
 
     assert my_slice.state == "OPERATING"
 
+@pytest.mark.asyncio
+async def test_waiting_for_many_slices_lists_slices_once_per_poll(httpx_mock: HTTPXMock, client: NetworkAsCodeClient):
+    slices = []
+    for name in ("sliceone", "slicetwo"):
+        slice_json = copy.deepcopy(MOCK_SLICE)
+        slice_json["slice"]["name"] = name
+        slices.append(Slice(api=client._api, **Slice.fields_from_json(slice_json)))
+
+    first_poll = [copy.deepcopy(MOCK_SLICE), copy.deepcopy(MOCK_SLICE)]
+    first_poll[1]["slice"]["name"] = "slicetwo"
+    first_poll[1]["state"] = "AVAILABLE"
+
+    second_poll = copy.deepcopy(first_poll)
+    second_poll[0]["state"] = "AVAILABLE"
+
+    for listing in (first_poll, second_poll):
+        httpx_mock.add_response(
+            method="GET",
+            url="https://network-as-code.p-eu.rapidapi.com/slice/v1/slices",
+            json=listing
+        )
+
+    states = await client.slices.wait_all(slices, poll_backoff=timedelta(seconds=0))
+
+    assert states == ["AVAILABLE", "AVAILABLE"]
+    assert len(httpx_mock.get_requests()) == 2
+
+
+@pytest.mark.asyncio
+async def test_waiting_for_slice_times_out(httpx_mock: HTTPXMock, client: NetworkAsCodeClient):
+    my_slice = Slice(api=client._api, **Slice.fields_from_json(MOCK_SLICE))
+
+    httpx_mock.add_response(
+        method="GET",
+        json=MOCK_SLICE,
+        url=f"https://network-as-code.p-eu.rapidapi.com/slice/v1/slices/{MOCK_SLICE['slice']['name']}",
+        is_optional=True,
+        is_reusable=True,
+    )
+
+    state = await my_slice.wait_for(
+        timeout=timedelta(milliseconds=50),
+        poll_backoff=timedelta(milliseconds=10),
+        max_poll_backoff=timedelta(milliseconds=20),
+    )
+
+    assert state == "PENDING"
+
+
+def test_poll_backoff_grows_up_to_maximum():
+    delays = [backoff_delay(attempt, 1.0, 8.0, jitter=False) for attempt in range(6)]
+
+    assert delays == [1.0, 2.0, 4.0, 8.0, 8.0, 8.0]
+    assert all(4.0 <= backoff_delay(10, 1.0, 8.0) <= 8.0 for _ in range(20))
+
+
 def test_activate_slice(httpx_mock: HTTPXMock, client: NetworkAsCodeClient):
     httpx_mock.add_response(
         method="POST",
@@ -1000,3 +1267,180 @@ def test_get_slice_missing_csi_id(httpx_mock: HTTPXMock, client: NetworkAsCodeCl
     response = client.slices.get(MOCK_SLICE['slice']['name'])
     assert response is not None
     assert response.sid is None
+
+
+def test_detaching_by_network_access_identifier(httpx_mock: HTTPXMock, client: NetworkAsCodeClient):
+    slice = Slice(
+        api=client._api,
+        state="AVAILABLE",
+        name="sliceone",
+        network_identifier=NetworkIdentifier(mcc="236", mnc="30"),
+        slice_info=SliceInfo(service_type="eMBB", differentiator="123456"),
+        notification_url="",
+    )
+    slice.set_attachments([{
+        "nac_resource_id": "attachment-1",
+        "resource": {
+            "device": {
+                "phoneNumber": "12065550100",
+                "networkAccessIdentifier": "testuser@open5glab.net",
+            },
+            "sliceId": "sliceone"
+        },
+    }])
+
+    httpx_mock.add_response(
+        method="DELETE",
+        url="https://network-as-code.p-eu.rapidapi.com/device-attach/v0/attachments/attachment-1"
+    )
+
+    device = client.devices.get("testuser@open5glab.net")
+
+    assert device in slice.attachments
+
+    slice.detach(device)
+
+    assert device not in slice.attachments
+    assert len(slice.attachments) == 0
+
+
+def test_detaching_does_not_match_another_device_on_a_shared_ip_address(
+    httpx_mock: HTTPXMock, client: NetworkAsCodeClient
+):
+    slice = Slice(
+        api=client._api,
+        state="AVAILABLE",
+        name="sliceone",
+        network_identifier=NetworkIdentifier(mcc="236", mnc="30"),
+        slice_info=SliceInfo(service_type="eMBB", differentiator="123456"),
+        notification_url="",
+    )
+    slice.set_attachments([{
+        "nac_resource_id": "attachment-1",
+        "resource": {
+            "device": {
+                "phoneNumber": "+12065550100",
+                "networkAccessIdentifier": "testuser@open5glab.net",
+                "ipv4Address": {"publicAddress": "1.1.1.2"},
+            },
+            "sliceId": "sliceone"
+        },
+    }])
+
+    # Behind the same NAT as the attached device
+    other = client.devices.get(
+        phone_number="+12065550101",
+        ipv4_address=DeviceIpv4Addr(public_address="1.1.1.2", private_address="10.0.0.2"),
+    )
+    assert other not in slice.attachments
+
+    with pytest.raises(NotFound):
+        slice.detach(other)
+
+    assert len(slice.attachments) == 1
+    assert not httpx_mock.get_requests()
+
+    # Without a phone number, every shared identifier must agree
+    assert client.devices.get(ipv4_address=DeviceIpv4Addr(public_address="1.1.1.2")) in slice.attachments
+    assert client.devices.get(
+        network_access_identifier="other@open5glab.net",
+        ipv4_address=DeviceIpv4Addr(public_address="1.1.1.2"),
+    ) not in slice.attachments
+
+
+def test_constructed_slice_has_private_attribute_defaults(httpx_mock: HTTPXMock, client: NetworkAsCodeClient):
+    slice = Slice.model_construct(**Slice.fields_from_json(MOCK_SLICE))
+    slice._api = client._api
+
+    assert slice._sessions == []
+    assert slice._attachments is None
+
+    # Attachments unknown to a constructed slice are listed on first use
+    httpx_mock.add_response(
+        method="GET",
+        url="https://network-as-code.p-eu.rapidapi.com/device-attach/v0/attachments",
+        json=[],
+    )
+    assert len(slice.attachments) == 0
+
+
+def test_detaching_many_devices(httpx_mock: HTTPXMock, client: NetworkAsCodeClient):
+    slice = Slice(
+        api=client._api,
+        state="AVAILABLE",
+        name="sliceone",
+        network_identifier=NetworkIdentifier(mcc="236", mnc="30"),
+        slice_info=SliceInfo(service_type="eMBB", differentiator="123456"),
+        notification_url="",
+    )
+    slice.set_attachments([
+        {
+            "nac_resource_id": f"attachment-{index}",
+            "resource": {
+                "device": {
+                    "phoneNumber": f"1206555010{index}"
+                },
+                "sliceId": "sliceone"
+            },
+        }
+        for index in range(5)
+    ])
+
+    for index in range(4):
+        httpx_mock.add_response(
+            method="DELETE",
+            url=f"https://network-as-code.p-eu.rapidapi.com/device-attach/v0/attachments/attachment-{index}",
+            status_code=500 if index == 3 else 204,
+        )
+
+    devices = [client.devices.get(phone_number=f"1206555010{index}") for index in (0, 1, 2, 3, 9)]
+
+    results = dict(
+        (device.phone_number, error)
+        for device, error in slice.detach_many(devices, concurrency=3)
+    )
+
+    assert results["12065550100"] is None
+    assert results["12065550101"] is None
+    assert results["12065550102"] is None
+    assert isinstance(results["12065550103"], ServiceError)
+    assert isinstance(results["12065550109"], NotFound)
+    assert [attachment.attachment_id for attachment in slice.attachments] == ["attachment-3", "attachment-4"]
+
+
+def test_failed_detach_keeps_the_attachment(httpx_mock: HTTPXMock, client: NetworkAsCodeClient):
+    slice = Slice(
+        api=client._api,
+        state="AVAILABLE",
+        name="sliceone",
+        network_identifier=NetworkIdentifier(mcc="236", mnc="30"),
+        slice_info=SliceInfo(service_type="eMBB", differentiator="123456"),
+        notification_url="",
+    )
+    slice.set_attachments([
+        {
+            "nac_resource_id": "attachment-1",
+            "resource": {
+                "device": {
+                    "phoneNumber": "12065550100"
+                },
+                "sliceId": "sliceone"
+            },
+        }
+    ])
+
+    url = "https://network-as-code.p-eu.rapidapi.com/device-attach/v0/attachments/attachment-1"
+    httpx_mock.add_response(method="DELETE", url=url, status_code=503)
+    httpx_mock.add_response(method="DELETE", url=url, status_code=204)
+
+    device = client.devices.get(phone_number="12065550100")
+
+    with pytest.raises(ServiceError):
+        slice.detach(device)
+
+    assert [attachment.attachment_id for attachment in slice.attachments] == ["attachment-1"]
+
+    slice.detach(device)
+
+    assert list(slice.attachments) == []
+    assert len(httpx_mock.get_requests(url=url)) == 2